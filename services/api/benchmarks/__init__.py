@@ -0,0 +1 @@
+"""Benchmarks package - Load-test harness and stub upstream providers."""
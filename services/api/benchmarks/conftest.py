@@ -0,0 +1,146 @@
+"""Pytest configuration for latency-budget microbenchmarks.
+
+Run from ``services/api`` (not collected by the default ``tests`` run)::
+
+    pytest benchmarks                     # compare against stored baselines
+    pytest benchmarks --update-baselines  # re-record baselines.json
+
+Each benchmark records the median per-call time over several timed rounds.
+A benchmark fails when its median exceeds the stored baseline by more than
+``--benchmark-tolerance`` (relative) *and* ``--benchmark-min-delta-us``
+(absolute), so sub-microsecond noise on tiny functions doesn't flake while a
+real regression on the per-turn path does.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-do-not-use-in-production")
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("latency budgets")
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Re-record benchmark baselines instead of checking them.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown over baseline (default: 0.5 = +50%%).",
+    )
+    group.addoption(
+        "--benchmark-min-delta-us",
+        type=float,
+        default=20.0,
+        help="Slowdowns smaller than this many microseconds never fail.",
+    )
+
+
+class BenchmarkResult:
+    """Timing summary for one benchmarked callable."""
+
+    def __init__(self, name: str, samples_us: list[float]):
+        self.name = name
+        self.median_us = statistics.median(samples_us)
+        self.min_us = min(samples_us)
+
+
+class Benchmark:
+    """Callable fixture timing a function, pytest-benchmark style."""
+
+    def __init__(self, name: str, rounds: int = 7, min_round_seconds: float = 0.02):
+        self.name = name
+        self.rounds = rounds
+        self.min_round_seconds = min_round_seconds
+        self.result: BenchmarkResult | None = None
+
+    def __call__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        value = func(*args, **kwargs)  # warm-up, also returned to the test
+
+        loops = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(loops):
+                func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.min_round_seconds:
+                break
+            loops *= 2
+
+        samples = [elapsed / loops * 1e6]
+        for _ in range(self.rounds - 1):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func(*args, **kwargs)
+            samples.append((time.perf_counter() - start) / loops * 1e6)
+
+        self.result = BenchmarkResult(self.name, samples)
+        return value
+
+
+def _load_baselines() -> dict[str, Any]:
+    if BASELINES_PATH.exists():
+        return json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+    return {"machine": {}, "benchmarks": {}}
+
+
+@pytest.fixture(scope="session")
+def _baseline_store(request: pytest.FixtureRequest):
+    store = _load_baselines()
+    yield store
+    if request.config.getoption("--update-baselines"):
+        store["machine"] = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        }
+        store["benchmarks"] = dict(sorted(store["benchmarks"].items()))
+        BASELINES_PATH.write_text(json.dumps(store, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest, _baseline_store):
+    """Time a callable and check it against the stored latency baseline."""
+    name = request.node.name.removeprefix("test_")
+    bench = Benchmark(name)
+    yield bench
+
+    if bench.result is None:
+        return
+
+    config = request.config
+    result = bench.result
+    terminal = config.pluginmanager.get_plugin("terminalreporter")
+    if terminal is not None:
+        terminal.write_line(f"  {name}: median {result.median_us:.2f}us")
+
+    if config.getoption("--update-baselines"):
+        _baseline_store["benchmarks"][name] = {"median_us": round(result.median_us, 3)}
+        return
+
+    baseline = _baseline_store["benchmarks"].get(name)
+    if baseline is None:
+        pytest.skip(f"No baseline recorded for {name}; run with --update-baselines")
+
+    baseline_us = baseline["median_us"]
+    tolerance = config.getoption("--benchmark-tolerance")
+    min_delta_us = config.getoption("--benchmark-min-delta-us")
+    delta_us = result.median_us - baseline_us
+    if delta_us > baseline_us * tolerance and delta_us > min_delta_us:
+        pytest.fail(
+            f"{name} regressed: median {result.median_us:.2f}us vs baseline "
+            f"{baseline_us:.2f}us (+{delta_us:.2f}us, tolerance {tolerance:.0%})"
+        )
@@ -0,0 +1,483 @@
+"""Load-test harness driving simulated interviews against stub providers.
+
+Each simulated interview runs ``/session/start`` → ``/turn`` × k →
+``/tts/{id}`` with real providers pointed at local stub servers (see
+``stub_providers``), so the measured throughput includes our own HTTP client,
+serialization, and orchestration overhead but no external network.
+
+Run from ``services/api``::
+
+    python -m benchmarks.loadtest --interviews 50 --concurrency 20 --turns 3
+    python -m benchmarks.loadtest --workers 2 --max-p95 total_ms=1500
+
+Without ``--workers`` the API runs in-process over an ASGI transport; with it,
+the harness spawns ``uvicorn --workers N`` and reports RSS per worker. Sessions
+and TTS audio live in per-worker memory, so each interview keeps one
+keep-alive connection (and therefore one worker) for its whole run. The
+process exits non-zero when a ``--max-p95`` or ``--max-error-rate`` budget is
+exceeded, so it can gate deploys.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import math
+import os
+import resource
+import struct
+import subprocess
+import sys
+import time
+import wave
+from contextlib import AbstractAsyncContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import httpx
+
+from benchmarks.stub_providers import StubConfig, StubProfile, StubServer, free_port
+
+_API_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class LoadTestConfig:
+    """Shape of the simulated traffic.
+
+    Attributes:
+        interviews: Total simulated interviews to run
+        turns_per_interview: Turns submitted per interview (question_count)
+        concurrency: Maximum interviews in flight at once
+        fetch_tts: Fetch the TTS audio after each turn
+        workers: Spawn uvicorn with this many workers (None = in-process ASGI)
+    """
+
+    interviews: int = 10
+    turns_per_interview: int = 3
+    concurrency: int = 10
+    fetch_tts: bool = True
+    workers: int | None = None
+
+
+@dataclass
+class LoadTestReport:
+    """Raw measurements collected during a load test run."""
+
+    wall_seconds: float = 0.0
+    turns_ok: int = 0
+    requests: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    client_latency_ms: dict[str, list[float]] = field(default_factory=dict)
+    stage_timings_ms: dict[str, list[float]] = field(default_factory=dict)
+    memory_kb: dict[str, int] = field(default_factory=dict)
+    upstream_requests: dict[str, int] = field(default_factory=dict)
+
+    def record_latency(self, endpoint: str, elapsed_ms: float) -> None:
+        self.requests += 1
+        self.client_latency_ms.setdefault(endpoint, []).append(elapsed_ms)
+
+    def record_error(self, code: str) -> None:
+        self.errors[code] = self.errors.get(code, 0) + 1
+
+    @property
+    def error_rate(self) -> float:
+        failed = sum(self.errors.values())
+        return failed / self.requests if self.requests else 0.0
+
+    def percentiles(self) -> dict[str, dict[str, float]]:
+        """p50/p95/p99 for every client endpoint and server-side stage."""
+        series = {f"client.{k}": v for k, v in self.client_latency_ms.items()}
+        series.update({f"stage.{k}": v for k, v in self.stage_timings_ms.items()})
+        return {
+            name: {
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+            }
+            for name, values in sorted(series.items())
+            if values
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"wall time:        {self.wall_seconds:.2f}s",
+            f"requests:         {self.requests}",
+            f"turns ok:         {self.turns_ok}",
+            f"turn throughput:  {self.turns_ok / self.wall_seconds:.2f} turns/s"
+            if self.wall_seconds
+            else "turn throughput:  n/a",
+            f"error rate:       {self.error_rate:.2%} {self.errors or ''}".rstrip(),
+            "",
+            f"{'series':<28}{'p50':>10}{'p95':>10}{'p99':>10}  (ms)",
+        ]
+        for name, values in self.percentiles().items():
+            lines.append(
+                f"{name:<28}{values['p50']:>10.1f}{values['p95']:>10.1f}"
+                f"{values['p99']:>10.1f}"
+            )
+        if self.memory_kb:
+            lines.append("")
+            for name, kb in sorted(self.memory_kb.items()):
+                lines.append(f"rss {name:<24}{kb / 1024:>10.1f} MiB")
+        if self.upstream_requests:
+            lines.append(f"upstream requests: {self.upstream_requests}")
+        return "\n".join(lines)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def make_answer_audio(seconds: float = 2.0, sample_rate: int = 16000) -> bytes:
+    """Build a spoken-level 220 Hz tone as 16-bit mono WAV."""
+    frames = int(seconds * sample_rate)
+    samples = (
+        int(8000 * math.sin(2 * math.pi * 220 * i / sample_rate)) for i in range(frames)
+    )
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"".join(struct.pack("<h", s) for s in samples))
+    return buffer.getvalue()
+
+
+async def _timed(
+    report: LoadTestReport, endpoint: str, request: Any
+) -> httpx.Response | None:
+    start = time.perf_counter()
+    try:
+        response = await request
+    except httpx.HTTPError as exc:
+        report.record_latency(endpoint, (time.perf_counter() - start) * 1000)
+        report.record_error(f"{endpoint}:{type(exc).__name__}")
+        return None
+    report.record_latency(endpoint, (time.perf_counter() - start) * 1000)
+    return response
+
+
+async def run_interview(
+    client: httpx.AsyncClient,
+    config: LoadTestConfig,
+    report: LoadTestReport,
+    audio: bytes,
+) -> None:
+    """Run one simulated interview end to end."""
+    response = await _timed(
+        report,
+        "session_start",
+        client.post(
+            "/session/start",
+            json={
+                "role": "Backend Engineer",
+                "interview_type": "behavioral",
+                "difficulty": "medium",
+                "question_count": config.turns_per_interview,
+            },
+        ),
+    )
+    if response is None or response.status_code != 200:
+        report.record_error("session_start")
+        return
+    session = response.json()["data"]
+    auth = {"Authorization": f"Bearer {session['session_token']}"}
+
+    for _ in range(config.turns_per_interview):
+        response = await _timed(
+            report,
+            "turn",
+            client.post(
+                "/turn",
+                files={"audio": ("answer.wav", audio, "audio/wav")},
+                data={"session_id": session["session_id"]},
+                headers=auth,
+            ),
+        )
+        if response is None:
+            return
+        body = response.json()
+        if body.get("error"):
+            report.record_error(body["error"]["code"])
+            return
+
+        report.turns_ok += 1
+        for stage, value in body["data"]["timings"].items():
+            report.stage_timings_ms.setdefault(stage, []).append(value)
+
+        tts_url = body["data"].get("tts_audio_url")
+        if config.fetch_tts and tts_url:
+            tts_response = await _timed(
+                report, "tts_fetch", client.get(tts_url, headers=auth)
+            )
+            if tts_response is not None and tts_response.status_code != 200:
+                report.record_error("tts_fetch")
+
+
+async def drive(
+    open_client: Callable[[], AbstractAsyncContextManager[httpx.AsyncClient]],
+    config: LoadTestConfig,
+) -> LoadTestReport:
+    """Run all interviews with bounded concurrency and collect a report.
+
+    Args:
+        open_client: Returns the client one interview uses for all of its
+            requests
+        config: Shape of the simulated traffic
+    """
+    report = LoadTestReport()
+    audio = make_answer_audio()
+    semaphore = asyncio.Semaphore(config.concurrency)
+
+    async def bounded() -> None:
+        async with semaphore, open_client() as client:
+            await run_interview(client, config, report, audio)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded() for _ in range(config.interviews)))
+    report.wall_seconds = time.perf_counter() - start
+    return report
+
+
+def _stub_environment(stub: StubServer) -> dict[str, str]:
+    return {
+        "DEEPGRAM_BASE_URL": stub.base_url,
+        "GROQ_BASE_URL": stub.base_url,
+        "DEEPGRAM_API_KEY": "stub-deepgram-key",
+        "GROQ_API_KEY": "stub-groq-key",
+        "SECRET_KEY": os.environ.get("SECRET_KEY") or "loadtest-secret-key",
+    }
+
+
+@contextmanager
+def _patched_environ(values: dict[str, str]) -> Iterator[None]:
+    from src.settings.config import get_settings
+
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    get_settings.cache_clear()
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        get_settings.cache_clear()
+
+
+async def run_in_process(
+    config: LoadTestConfig, stub_config: StubConfig | None = None
+) -> LoadTestReport:
+    """Run the load test against an in-process app over an ASGI transport."""
+    with StubServer(stub_config) as stub, _patched_environ(_stub_environment(stub)):
+        from src.api.dependencies.shared_services import (
+            get_session_store,
+            get_token_service,
+            get_tts_cache,
+        )
+        from src.main import create_app
+
+        # Build the shared singletons before concurrent requests race to
+        # create them
+        get_session_store()
+        get_token_service()
+        get_tts_cache()
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=60
+        ) as client:
+            report = await drive(lambda: nullcontext(client), config)
+        report.memory_kb["loadtest_process_peak"] = resource.getrusage(
+            resource.RUSAGE_SELF
+        ).ru_maxrss
+        report.upstream_requests = stub.request_counts()
+    return report
+
+
+def _child_pids(parent_pid: int) -> list[int]:
+    children = []
+    for stat_path in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            fields = stat_path.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) != parent_pid:
+            continue
+        cmdline = (stat_path.parent / "cmdline").read_bytes()
+        # Skip multiprocessing's resource tracker; only count serving workers
+        if b"resource_tracker" not in cmdline:
+            children.append(int(stat_path.parent.name))
+    return children
+
+
+def _rss_kb(pid: int) -> int | None:
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+async def run_against_workers(
+    config: LoadTestConfig, stub_config: StubConfig | None = None
+) -> LoadTestReport:
+    """Spawn ``uvicorn --workers N`` and run the load test over real HTTP."""
+    with StubServer(stub_config) as stub:
+        port = free_port()
+        env = {**os.environ, **_stub_environment(stub)}
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "src.main:app",
+                "--port",
+                str(port),
+                "--workers",
+                str(config.workers),
+                # Interviews pin a worker through their connection; keep it
+                # open between turns
+                "--timeout-keep-alive",
+                "120",
+                "--log-level",
+                "warning",
+            ],
+            cwd=_API_ROOT,
+            env=env,
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+                await _wait_for_health(client)
+
+            def interview_client() -> httpx.AsyncClient:
+                # One connection per interview: uvicorn workers share the
+                # listening socket, so a connection stays on the worker that
+                # accepted it and holds the interview's session
+                return httpx.AsyncClient(
+                    base_url=base_url,
+                    timeout=60,
+                    limits=httpx.Limits(max_connections=1),
+                )
+
+            report = await drive(interview_client, config)
+
+            worker_pids = _child_pids(server.pid) or [server.pid]
+            for pid in worker_pids:
+                rss = _rss_kb(pid)
+                if rss is not None:
+                    report.memory_kb[f"worker_{pid}"] = rss
+            report.upstream_requests = stub.request_counts()
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+    return report
+
+
+async def _wait_for_health(client: httpx.AsyncClient, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/healthz")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("API server did not become healthy")
+
+
+def check_budgets(
+    report: LoadTestReport,
+    max_p95: dict[str, float],
+    max_error_rate: float | None,
+) -> list[str]:
+    """Return human-readable budget violations (empty when within budget)."""
+    violations = []
+    percentiles = report.percentiles()
+    for stage, budget in max_p95.items():
+        key = stage if "." in stage else f"stage.{stage}"
+        observed = percentiles.get(key, {}).get("p95")
+        if observed is None:
+            violations.append(f"{key}: no samples")
+        elif observed > budget:
+            violations.append(f"{key}: p95 {observed:.1f}ms > {budget:.1f}ms")
+    if max_error_rate is not None and report.error_rate > max_error_rate:
+        violations.append(
+            f"error rate {report.error_rate:.2%} > {max_error_rate:.2%}"
+        )
+    return violations
+
+
+def _parse_profile(value: str) -> StubProfile:
+    """Parse ``latency_ms[,jitter_ms[,error_rate[,rate_limit_rate]]]``."""
+    parts = [float(p) for p in value.split(",")]
+    return StubProfile(*parts)
+
+
+def _parse_budget(value: str) -> tuple[str, float]:
+    stage, _, budget = value.partition("=")
+    return stage, float(budget)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--interviews", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-tts-fetch", action="store_true")
+    parser.add_argument(
+        "--stt-profile", type=_parse_profile, default=StubProfile(latency_ms=300.0)
+    )
+    parser.add_argument(
+        "--llm-profile", type=_parse_profile, default=StubProfile(latency_ms=600.0)
+    )
+    parser.add_argument(
+        "--tts-profile", type=_parse_profile, default=StubProfile(latency_ms=200.0)
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--max-p95",
+        type=_parse_budget,
+        action="append",
+        default=[],
+        metavar="STAGE=MS",
+    )
+    parser.add_argument("--max-error-rate", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    config = LoadTestConfig(
+        interviews=args.interviews,
+        turns_per_interview=args.turns,
+        concurrency=args.concurrency,
+        fetch_tts=not args.no_tts_fetch,
+        workers=args.workers,
+    )
+    stub_config = StubConfig(
+        stt=args.stt_profile, llm=args.llm_profile, tts=args.tts_profile, seed=args.seed
+    )
+
+    runner = run_against_workers if config.workers else run_in_process
+    report = asyncio.run(runner(config, stub_config))
+    print(report.format())
+
+    violations = check_budgets(report, dict(args.max_p95), args.max_error_rate)
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""Local stub servers emulating the Deepgram and Groq HTTP APIs.
+
+The stubs implement just enough of each upstream contract for the real
+providers to run unmodified:
+
+- ``POST /v1/listen``: Deepgram pre-recorded transcription
+- ``POST /v1/speak``: Deepgram Aura text-to-speech (returns fake MP3 bytes)
+- ``POST /openai/v1/chat/completions``: Groq chat completions (JSON mode)
+
+Each endpoint has a ``StubProfile`` controlling added latency, jitter, and the
+fraction of requests answered with a 5xx error or a 429 rate limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+STUB_TRANSCRIPT = (
+    "In my last role I led the migration of our billing service to an "
+    "event-driven design, which cut invoice latency by forty percent."
+)
+
+STUB_AUDIO = b"ID3" + b"\x00" * 4093
+
+_FOLLOW_UP_PAYLOAD = {
+    "follow_up_question": "What trade-offs did you weigh during that migration?",
+    "coaching_feedback": {
+        "dimensions": [
+            {"label": "Clarity", "score": 4, "tip": "Lead with the outcome."},
+            {"label": "Relevance", "score": 5, "tip": "Great role alignment."},
+            {"label": "Structure", "score": 3, "tip": "Use STAR explicitly."},
+            {"label": "Filler Words", "score": 4, "tip": "Pause instead of um."},
+        ],
+        "summary_tip": "Quantify impact early and keep the structure explicit.",
+    },
+    "refused": False,
+}
+
+_SUMMARY_PAYLOAD = {
+    "overall_assessment": "Solid, well-grounded answers with measurable impact.",
+    "strengths": ["Quantified results", "Relevant examples"],
+    "improvements": ["Make STAR structure explicit"],
+    "recommended_actions": ["Practice one STAR answer aloud each day."],
+    "average_scores": {},
+}
+
+_ROLLING_SUMMARY_PAYLOAD = {
+    "strengths": ["Quantified results"],
+    "improvements": ["Make STAR structure explicit"],
+    "notes": "Consistently grounds answers in concrete projects.",
+}
+
+
+@dataclass
+class StubProfile:
+    """Latency and failure profile for one stub endpoint.
+
+    Attributes:
+        latency_ms: Base added latency per request
+        jitter_ms: Uniform random jitter added on top of latency_ms
+        error_rate: Fraction of requests answered with HTTP 503
+        rate_limit_rate: Fraction of requests answered with HTTP 429
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+
+
+@dataclass
+class StubConfig:
+    """Per-endpoint profiles for the stub servers."""
+
+    stt: StubProfile = field(default_factory=lambda: StubProfile(latency_ms=300.0))
+    llm: StubProfile = field(default_factory=lambda: StubProfile(latency_ms=600.0))
+    tts: StubProfile = field(default_factory=lambda: StubProfile(latency_ms=200.0))
+    seed: int | None = None
+
+
+class _ProfileGate:
+    """Applies a StubProfile: sleeps, then maybe returns a failure response."""
+
+    def __init__(self, profile: StubProfile, rng: random.Random):
+        self._profile = profile
+        self._rng = rng
+        self.requests = 0
+
+    async def __call__(self) -> Response | None:
+        self.requests += 1
+        delay_ms = self._profile.latency_ms
+        if self._profile.jitter_ms:
+            delay_ms += self._rng.uniform(0.0, self._profile.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        roll = self._rng.random()
+        if roll < self._profile.rate_limit_rate:
+            return JSONResponse(
+                {"error": {"message": "Rate limit reached", "type": "rate_limit"}},
+                status_code=429,
+                headers={"retry-after": "0"},
+            )
+        if roll < self._profile.rate_limit_rate + self._profile.error_rate:
+            return JSONResponse(
+                {"error": {"message": "Stub upstream failure"}}, status_code=503
+            )
+        return None
+
+
+def create_stub_app(config: StubConfig | None = None) -> Starlette:
+    """Build the ASGI app serving all stub provider endpoints."""
+    config = config or StubConfig()
+    rng = random.Random(config.seed)
+    gates = {
+        "stt": _ProfileGate(config.stt, rng),
+        "llm": _ProfileGate(config.llm, rng),
+        "tts": _ProfileGate(config.tts, rng),
+    }
+
+    async def listen(request: Request) -> Response:
+        await request.body()
+        failure = await gates["stt"]()
+        if failure is not None:
+            return failure
+        return JSONResponse(
+            {
+                "results": {
+                    "channels": [{"alternatives": [{"transcript": STUB_TRANSCRIPT}]}]
+                }
+            }
+        )
+
+    async def speak(request: Request) -> Response:
+        await request.body()
+        failure = await gates["tts"]()
+        if failure is not None:
+            return failure
+        return Response(STUB_AUDIO, media_type="audio/mpeg")
+
+    async def chat_completions(request: Request) -> Response:
+        body = await request.json()
+        failure = await gates["llm"]()
+        if failure is not None:
+            return failure
+
+        system_prompt = next(
+            (
+                message.get("content", "")
+                for message in body.get("messages", [])
+                if message.get("role") == "system"
+            ),
+            "",
+        )
+        if "summarizing a completed" in system_prompt:
+            payload = _SUMMARY_PAYLOAD
+        elif "running summary of an in-progress" in system_prompt:
+            payload = _ROLLING_SUMMARY_PAYLOAD
+        elif "scoring one candidate answer" in system_prompt:
+            payload = {"coaching_feedback": _FOLLOW_UP_PAYLOAD["coaching_feedback"]}
+        elif '{"follow_up_question": string, "refused": boolean}' in system_prompt:
+            payload = {
+                "follow_up_question": _FOLLOW_UP_PAYLOAD["follow_up_question"],
+                "refused": False,
+            }
+        else:
+            payload = _FOLLOW_UP_PAYLOAD
+        content = json.dumps(payload)
+        if body.get("stream"):
+            return StreamingResponse(
+                _completion_chunks(body, content, f"stub-{gates['llm'].requests}"),
+                media_type="text/event-stream",
+            )
+        prompt_chars = sum(len(m.get("content", "")) for m in body.get("messages", []))
+        return JSONResponse(
+            {
+                "id": f"stub-{gates['llm'].requests}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "stub-model"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_chars // 4,
+                    "completion_tokens": len(content) // 4,
+                    "total_tokens": (prompt_chars + len(content)) // 4,
+                },
+            }
+        )
+
+    app = Starlette(
+        routes=[
+            Route("/v1/listen", listen, methods=["POST"]),
+            Route("/v1/speak", speak, methods=["POST"]),
+            Route("/openai/v1/chat/completions", chat_completions, methods=["POST"]),
+        ]
+    )
+    app.state.gates = gates
+    return app
+
+
+async def _completion_chunks(body: dict, content: str, completion_id: str):
+    """Server-sent chat completion chunks, a few tokens' worth of text each."""
+    created = int(time.time())
+    pieces = [content[i : i + 16] for i in range(0, len(content), 16)]
+    for index, piece in enumerate(pieces):
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": body.get("model", "stub-model"),
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"role": "assistant", "content": piece}
+                    if index == 0
+                    else {"content": piece},
+                    "finish_reason": "stop" if index == len(pieces) - 1 else None,
+                }
+            ],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StubServer:
+    """Runs the stub app under uvicorn on a background thread.
+
+    Usage::
+
+        with StubServer(StubConfig()) as stub:
+            os.environ["DEEPGRAM_BASE_URL"] = stub.base_url
+    """
+
+    def __init__(self, config: StubConfig | None = None, port: int | None = None):
+        self.app = create_stub_app(config)
+        self.port = port or free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                self.app,
+                host="127.0.0.1",
+                port=self.port,
+                log_level="warning",
+                access_log=False,
+                ws="none",
+            )
+        )
+        self._thread: threading.Thread | None = None
+
+    def request_counts(self) -> dict[str, int]:
+        """Return the number of requests each stub endpoint has received."""
+        return {name: gate.requests for name, gate in self.app.state.gates.items()}
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Stub server failed to start")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StubServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,214 @@
+"""Latency-budget microbenchmarks for the CPU-side work in POST /turn.
+
+Covers everything on the turn path that doesn't touch the network: token
+verification, session copies, safety regexes, prompt building, LLM output
+parsing (single-pass fast path and the lenient fallback), coaching and
+summary validation and envelope serialization. ``turn_cpu_path``
+chains them in request order so per-turn overhead shows up as one number.
+"""
+
+import json
+
+import pytest
+
+from src.api.models import (
+    ApiEnvelope,
+    CoachingFeedback,
+    SessionSummary,
+    TurnResponseData,
+)
+from src.api.models.session_models import SessionStartRequest
+from src.domain.session_state import TurnRecord
+from src.providers.llm_groq import GroqLLMProvider
+from src.security import SessionTokenService
+from src.services import SafetyFilter, SessionStore
+
+TRANSCRIPT = (
+    "In my last role I led the migration of our billing service to an "
+    "event-driven design. I started by mapping every consumer of the invoice "
+    "tables, then introduced an outbox so writes and events stayed consistent. "
+    "We rolled it out behind a flag per region, and invoice latency dropped by "
+    "forty percent while on-call pages for billing fell to almost zero."
+)
+
+COACHING_FEEDBACK = {
+    "dimensions": [
+        {"label": "Clarity", "score": 4, "tip": "Lead with the outcome first."},
+        {"label": "Relevance", "score": 5, "tip": "Strong alignment with the role."},
+        {"label": "Structure", "score": 3, "tip": "Name each STAR step explicitly."},
+        {"label": "Filler Words", "score": 4, "tip": "Pause briefly instead of um."},
+    ],
+    "summary_tip": "Quantify impact early and keep the STAR structure explicit.",
+}
+
+LLM_OUTPUT = json.dumps(
+    {
+        "follow_up_question": "What trade-offs did you weigh during that migration?",
+        "coaching_feedback": COACHING_FEEDBACK,
+        "refused": False,
+    }
+)
+
+SESSION_SUMMARY = {
+    "overall_assessment": (
+        "Clear, well-grounded answers with measurable impact; structure was "
+        "sometimes implicit."
+    ),
+    "strengths": [
+        "Quantified results in most answers",
+        "Relevant, recent examples",
+        "Calm delivery with few filler words",
+    ],
+    "improvements": [
+        "Make each STAR step explicit",
+        "Lead with the outcome before the context",
+    ],
+    "average_scores": {"clarity": 4.0, "relevance": 4.5, "structure": 3.0},
+    "recommended_actions": [
+        "Practice one STAR answer aloud each day.",
+        "Write down the headline metric before answering.",
+    ],
+}
+
+ASKED_QUESTIONS = [f"Tell me about challenge number {i}." for i in range(9)]
+
+
+@pytest.fixture(scope="module")
+def token_service():
+    return SessionTokenService(secret_key="benchmark-secret", max_age_seconds=3600)
+
+
+@pytest.fixture(scope="module")
+def llm_provider():
+    return GroqLLMProvider(api_key="benchmark-key")
+
+
+@pytest.fixture(scope="module")
+def safety_filter():
+    return SafetyFilter()
+
+
+@pytest.fixture(scope="module")
+def stored_session():
+    """Store holding one session with a 9-turn history, plus its session id."""
+    store = SessionStore()
+    session = store.create_session(
+        SessionStartRequest(
+            role="Backend Engineer",
+            interview_type="behavioral",
+            difficulty="medium",
+            question_count=10,
+        )
+    )
+    store.update_session(
+        session.session_id,
+        turn_count=9,
+        asked_questions=list(ASKED_QUESTIONS),
+        turn_history=[
+            TurnRecord(
+                turn_number=i + 1,
+                transcript=TRANSCRIPT,
+                assistant_text=ASKED_QUESTIONS[i],
+                coaching_feedback=dict(COACHING_FEEDBACK),
+            )
+            for i in range(9)
+        ],
+    )
+    return store, session.session_id
+
+
+def _build_envelope(feedback: CoachingFeedback) -> str:
+    envelope = ApiEnvelope[TurnResponseData](
+        data=TurnResponseData(
+            transcript=TRANSCRIPT,
+            assistant_text="What trade-offs did you weigh during that migration?",
+            tts_audio_url="/tts/550e8400-e29b-41d4-a716-446655440000",
+            coaching_feedback=feedback,
+            timings={"upload_ms": 1.0, "stt_ms": 800.0, "llm_ms": 900.0},
+            is_complete=False,
+            question_number=3,
+            total_questions=5,
+        ),
+        error=None,
+        request_id="550e8400-e29b-41d4-a716-446655440000",
+    )
+    return envelope.model_dump_json()
+
+
+def test_verify_token(benchmark, token_service):
+    token = token_service.generate_token("session-123")
+    assert benchmark(token_service.verify_token, token) == "session-123"
+
+
+def test_session_deep_copy(benchmark, stored_session):
+    store, session_id = stored_session
+    session = benchmark(store.get_session, session_id)
+    assert len(session.turn_history) == 9
+
+
+def test_safety_check_transcript(benchmark, safety_filter):
+    assert benchmark(safety_filter.check_transcript, TRANSCRIPT).is_safe
+
+
+def test_build_system_prompt(benchmark, llm_provider):
+    prompt = benchmark(
+        llm_provider._build_system_prompt,
+        "Backend Engineer",
+        "behavioral",
+        "medium",
+        ASKED_QUESTIONS,
+        10,
+        10,
+    )
+    assert "Backend Engineer" in prompt
+
+
+def test_parse_llm_response(benchmark, llm_provider):
+    response = benchmark(llm_provider._parse_llm_response, LLM_OUTPUT)
+    assert response.coaching_feedback is not None
+
+
+def test_parse_llm_response_lenient(benchmark, llm_provider):
+    """Field-by-field parser, the fallback for malformed output."""
+    response = benchmark(llm_provider._parse_llm_response_lenient, LLM_OUTPUT)
+    assert response.coaching_feedback is not None
+
+
+def test_session_summary_validate(benchmark):
+    summary = benchmark(SessionSummary.model_validate, SESSION_SUMMARY)
+    assert len(summary.strengths) == 3
+
+
+def test_coaching_feedback_validate(benchmark):
+    feedback = benchmark(CoachingFeedback.model_validate, COACHING_FEEDBACK)
+    assert len(feedback.dimensions) == 4
+
+
+def test_envelope_serialization(benchmark):
+    feedback = CoachingFeedback.model_validate(COACHING_FEEDBACK)
+    assert '"request_id"' in benchmark(_build_envelope, feedback)
+
+
+def test_turn_cpu_path(
+    benchmark, token_service, stored_session, safety_filter, llm_provider
+):
+    """All CPU-side steps of one /turn, in request order."""
+    session_store, stored_session_id = stored_session
+    token = token_service.generate_token(stored_session_id)
+
+    def turn() -> str:
+        session_id = token_service.verify_token(token)
+        session = session_store.get_session(session_id)
+        safety_filter.check_transcript(TRANSCRIPT)
+        llm_provider._build_system_prompt(
+            session.role,
+            session.interview_type,
+            session.difficulty,
+            session.asked_questions,
+            session.turn_count + 1,
+            session.question_count,
+        )
+        response = llm_provider._parse_llm_response(LLM_OUTPUT)
+        return _build_envelope(response.coaching_feedback)
+
+    benchmark(turn)
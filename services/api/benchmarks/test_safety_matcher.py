@@ -0,0 +1,69 @@
+"""Safety matcher scaling with large custom pattern lists.
+
+Half the patterns are word-bounded literal terms (slur lists), half are short
+phrases starting with a literal word (PII solicitation). ``sequential`` runs
+every compiled regex in order, the pre-index behaviour, for comparison.
+
+The ``defaults`` pair measures the built-in ``SafetyFilter`` patterns that
+most deployments run. Only two of the three are indexable (``explicit_threat``
+alternates between phrases inside its group and starts with the one-letter
+word "i"), which is below ``_MIN_INDEXED_PATTERNS``, so the matcher scans them
+in order and should track ``sequential`` rather than beat it.
+"""
+
+import re
+
+import pytest
+
+from src.services.safety_filter import PatternMatcher, SafetyFilter
+
+from .test_hot_path import TRANSCRIPT
+
+PATTERN_COUNTS = (10, 100, 1000)
+
+
+def _patterns(count: int) -> list[tuple[str, str]]:
+    patterns = []
+    for i in range(count):
+        if i % 2:
+            patterns.append((f"term_{i}", rf"\b(blockterm{i}|blockword{i})\b"))
+        else:
+            patterns.append(
+                (f"phrase_{i}", rf"\bgive{i}\s+me\s+your\s+(pin|password)\b")
+            )
+    return patterns
+
+
+@pytest.mark.parametrize("count", PATTERN_COUNTS)
+def test_safety_matcher(benchmark, count):
+    matcher = PatternMatcher(_patterns(count))
+    assert benchmark(matcher.search, TRANSCRIPT) is None
+
+
+def _sequential(patterns: list[tuple[str, str]]):
+    compiled = [
+        (name, re.compile(pattern, flags=re.IGNORECASE)) for name, pattern in patterns
+    ]
+
+    def search(text: str) -> str | None:
+        for name, pattern in compiled:
+            if pattern.search(text):
+                return name
+        return None
+
+    return search
+
+
+@pytest.mark.parametrize("count", PATTERN_COUNTS)
+def test_safety_sequential(benchmark, count):
+    assert benchmark(_sequential(_patterns(count)), TRANSCRIPT) is None
+
+
+def test_safety_matcher_defaults(benchmark):
+    matcher = PatternMatcher(list(SafetyFilter._DEFAULT_PATTERNS))
+    assert benchmark(matcher.search, TRANSCRIPT) is None
+
+
+def test_safety_sequential_defaults(benchmark):
+    search = _sequential(list(SafetyFilter._DEFAULT_PATTERNS))
+    assert benchmark(search, TRANSCRIPT) is None
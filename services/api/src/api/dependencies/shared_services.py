@@ -4,25 +4,46 @@ Both session and turn routes must share the SAME SessionStore and
 SessionTokenService instances. This module provides the single source of
 truth for those singletons so sessions created via /session/start are
 visible to /turn.
+
+Sync dependencies run on the threadpool, so first-time construction is
+guarded by a lock; otherwise two concurrent first requests could each build
+(and one then lose) a separate SessionStore.
 """
 
+import threading
+
 from src.security import SessionTokenService
-from src.services import SessionStore, TTSCache, SafetyFilter
+from src.services import (
+    BatchingSafetyClassifier,
+    RollingSummarizer,
+    SessionStore,
+    SessionSummaryJobs,
+    DiskTTSStore,
+    TTSCache,
+    SafetyFilter,
+)
 from src.settings.config import get_settings
 
 
+_lock = threading.Lock()
 _session_store: SessionStore | None = None
 _token_service: SessionTokenService | None = None
-_tts_cache: TTSCache | None = None
+_tts_cache: TTSCache | DiskTTSStore | None = None
 _safety_filter: SafetyFilter | None = None
+_safety_classifier: BatchingSafetyClassifier | None = None
+_safety_classifier_loaded = False
+_rolling_summarizer: RollingSummarizer | None = None
+_summary_jobs: SessionSummaryJobs | None = None
 
 
 def get_session_store() -> SessionStore:
     """Dependency to get the session store singleton."""
     global _session_store
     if _session_store is None:
-        settings = get_settings()
-        _session_store = SessionStore(ttl_minutes=settings.session_ttl_minutes)
+        with _lock:
+            if _session_store is None:
+                settings = get_settings()
+                _session_store = SessionStore(ttl_minutes=settings.session_ttl_minutes)
     return _session_store
 
 
@@ -30,20 +51,30 @@ def get_token_service() -> SessionTokenService:
     """Dependency to get the token service singleton."""
     global _token_service
     if _token_service is None:
-        settings = get_settings()
-        _token_service = SessionTokenService(
-            secret_key=settings.secret_key,
-            max_age_seconds=settings.session_ttl_minutes * 60,
-        )
+        with _lock:
+            if _token_service is None:
+                settings = get_settings()
+                _token_service = SessionTokenService(
+                    secret_key=settings.secret_key,
+                    max_age_seconds=settings.session_ttl_minutes * 60,
+                )
     return _token_service
 
 
-def get_tts_cache() -> TTSCache:
-    """Dependency to get the TTS cache singleton."""
+def get_tts_cache() -> TTSCache | DiskTTSStore:
+    """Dependency to get the TTS cache singleton (in memory or on disk)."""
     global _tts_cache
     if _tts_cache is None:
-        settings = get_settings()
-        _tts_cache = TTSCache(ttl_seconds=settings.tts_cache_ttl_seconds)
+        with _lock:
+            if _tts_cache is None:
+                settings = get_settings()
+                if settings.tts_store_backend == "disk":
+                    _tts_cache = DiskTTSStore(
+                        settings.tts_store_dir,
+                        ttl_seconds=settings.tts_cache_ttl_seconds,
+                    )
+                else:
+                    _tts_cache = TTSCache(ttl_seconds=settings.tts_cache_ttl_seconds)
     return _tts_cache
 
 
@@ -51,5 +82,38 @@ def get_safety_filter() -> SafetyFilter:
     """Dependency to get the safety filter singleton."""
     global _safety_filter
     if _safety_filter is None:
-        _safety_filter = SafetyFilter.from_settings()
+        with _lock:
+            if _safety_filter is None:
+                _safety_filter = SafetyFilter.from_settings()
     return _safety_filter
+
+
+def get_safety_classifier() -> BatchingSafetyClassifier | None:
+    """Dependency to get the safety classifier singleton (None when disabled)."""
+    global _safety_classifier, _safety_classifier_loaded
+    if not _safety_classifier_loaded:
+        with _lock:
+            if not _safety_classifier_loaded:
+                _safety_classifier = BatchingSafetyClassifier.from_settings()
+                _safety_classifier_loaded = True
+    return _safety_classifier
+
+
+def get_rolling_summarizer() -> RollingSummarizer:
+    """Dependency to get the rolling session summary scheduler singleton."""
+    global _rolling_summarizer
+    if _rolling_summarizer is None:
+        with _lock:
+            if _rolling_summarizer is None:
+                _rolling_summarizer = RollingSummarizer()
+    return _rolling_summarizer
+
+
+def get_summary_jobs() -> SessionSummaryJobs:
+    """Dependency to get the background session summary jobs singleton."""
+    global _summary_jobs
+    if _summary_jobs is None:
+        with _lock:
+            if _summary_jobs is None:
+                _summary_jobs = SessionSummaryJobs()
+    return _summary_jobs
@@ -0,0 +1,211 @@
+"""ASGI middleware enforcing upload size and read-time limits.
+
+Starlette buffers the whole multipart body before the ``/turn`` handler runs,
+so handler-side checks come too late to protect worker memory.
+``UploadLimitMiddleware`` sits in front of the app and:
+
+- rejects requests whose ``Content-Length`` exceeds the limit before reading
+  any body bytes (413 ``file_too_large``)
+- counts body bytes as they stream in and aborts once the limit is crossed,
+  which also covers chunked uploads without a ``Content-Length``
+- aborts when the client sends no body bytes for ``read_timeout_seconds``
+  (408 ``upload_timeout``), so stalled uploads free their worker slot
+- aborts once the whole body has taken longer than ``total_timeout_seconds``
+  (also 408 ``upload_timeout``), so a client dripping a byte just inside the
+  read timeout cannot hold a worker indefinitely
+
+Errors use the standard envelope with ``stage="upload"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Iterable
+
+from src.api.models import ApiEnvelope, ApiError
+from src.observability.metrics import turn_requests_total
+
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[dict[str, Any], Receive, Send], Awaitable[None]]
+
+
+class _UploadRejected(Exception):
+    """Raised from ``receive`` to stop the app from reading the body."""
+
+    def __init__(
+        self,
+        status_code: int,
+        code: str,
+        message: str,
+        retryable: bool,
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.retryable = retryable
+        self.details = details
+
+
+def _too_large(max_bytes: int) -> _UploadRejected:
+    return _UploadRejected(
+        413,
+        "file_too_large",
+        "Audio file is too large",
+        retryable=False,
+        details={"max_bytes": max_bytes},
+    )
+
+
+def _timed_out() -> _UploadRejected:
+    return _UploadRejected(
+        408,
+        "upload_timeout",
+        "Upload took too long. Please try again.",
+        retryable=True,
+    )
+
+
+class UploadLimitMiddleware:
+    """Limit request body size and upload time on selected paths."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_bytes: int,
+        read_timeout_seconds: float,
+        total_timeout_seconds: float | None = None,
+        paths: Iterable[str] = ("/turn",),
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI app
+            max_bytes: Largest accepted request body
+            read_timeout_seconds: Longest wait for the next body chunk
+            total_timeout_seconds: Longest time to receive the whole body,
+                measured from the first read (None disables the deadline)
+            paths: Path prefixes the limits apply to
+        """
+        self.app = app
+        self._max_bytes = max_bytes
+        self._read_timeout = read_timeout_seconds
+        self._total_timeout = total_timeout_seconds
+        self._paths = tuple(paths)
+
+    def _applies(self, scope: dict[str, Any]) -> bool:
+        if scope["type"] != "http" or scope["method"] in ("GET", "HEAD", "OPTIONS"):
+            return False
+        path = scope["path"]
+        return any(
+            path == prefix or path.startswith(prefix.rstrip("/") + "/")
+            for prefix in self._paths
+        )
+
+    async def __call__(
+        self, scope: dict[str, Any], receive: Receive, send: Send
+    ) -> None:
+        if not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None:
+            try:
+                declared = int(content_length)
+            except ValueError:
+                declared = 0
+            if declared > self._max_bytes:
+                await self._reject(scope, send, _too_large(self._max_bytes))
+                return
+
+        received = 0
+        body_complete = False
+        deadline: float | None = None
+        rejected: _UploadRejected | None = None
+        response_started = False
+        replaced = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, body_complete, rejected, deadline
+            if rejected is not None:
+                raise rejected
+            if body_complete:
+                # Only disconnect notices are left; no timeout applies
+                return await receive()
+            timeout = self._read_timeout
+            if self._total_timeout is not None:
+                if deadline is None:
+                    deadline = time.monotonic() + self._total_timeout
+                timeout = min(timeout, deadline - time.monotonic())
+            try:
+                if timeout <= 0:
+                    raise asyncio.TimeoutError
+                message = await asyncio.wait_for(receive(), timeout)
+            except asyncio.TimeoutError:
+                rejected = _timed_out()
+                raise rejected
+            if message["type"] == "http.request":
+                if deadline is not None and time.monotonic() > deadline:
+                    rejected = _timed_out()
+                    raise rejected
+                received += len(message.get("body", b""))
+                if received > self._max_bytes:
+                    rejected = _too_large(self._max_bytes)
+                    raise rejected
+                body_complete = not message.get("more_body", False)
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started, replaced
+            if message["type"] == "http.response.start":
+                if rejected is not None and not response_started:
+                    # Replace whatever error the app made of the aborted read
+                    replaced = response_started = True
+                    await self._reject(scope, send, rejected)
+                    return
+                response_started = True
+            if not replaced:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _UploadRejected:
+            pass
+        if rejected is not None and not response_started:
+            await self._reject(scope, send, rejected)
+
+    async def _reject(
+        self, scope: dict[str, Any], send: Send, error: _UploadRejected
+    ) -> None:
+        turn_requests_total().inc(stage="upload", outcome=error.code)
+        # Set by the request ID middleware, which wraps this one
+        request_id = scope.get("state", {}).get("request_id") or str(uuid.uuid4())
+        body = ApiEnvelope(
+            data=None,
+            error=ApiError(
+                stage="upload",
+                code=error.code,
+                message_safe=str(error),
+                retryable=error.retryable,
+                details=error.details,
+            ),
+            request_id=request_id,
+        ).model_dump_json().encode("utf-8")
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"connection", b"close"),
+        ]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": error.status_code,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -9,6 +9,8 @@ from src.api.models.session_models import (
     SessionStartResponse,
     DeleteResult,
     DeleteSessionResponse,
+    SessionSummaryData,
+    SessionSummaryResponse,
 )
 from src.api.models.turn_models import (
     CoachingDimension,
@@ -28,6 +30,8 @@ __all__ = [
     "SessionStartResponse",
     "DeleteResult",
     "DeleteSessionResponse",
+    "SessionSummaryData",
+    "SessionSummaryResponse",
     "CoachingDimension",
     "CoachingFeedback",
     "SessionSummary",
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 from typing import Literal
 
 from src.api.models.envelope import ApiEnvelope
+from src.api.models.turn_models import SessionSummary
 
 
 class SessionStartRequest(BaseModel):
@@ -52,6 +53,20 @@ class DeleteResult(BaseModel):
     deleted: bool = Field(..., description="Whether the session data was deleted")
 
 
+class SessionSummaryData(BaseModel):
+    """Response data for session summary retrieval."""
+
+    summary_status: Literal["pending", "ready", "failed"] = Field(
+        ...,
+        description="Whether the end-of-session summary is still being generated",
+    )
+    session_summary: SessionSummary | None = Field(
+        default=None,
+        description="End-of-session summary payload (when ready)",
+    )
+
+
 # Type alias for the complete session start response with envelope
 SessionStartResponse = ApiEnvelope[SessionData]
 DeleteSessionResponse = ApiEnvelope[DeleteResult]
+SessionSummaryResponse = ApiEnvelope[SessionSummaryData]
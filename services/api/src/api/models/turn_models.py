@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import re
+from typing import Literal
 
 from pydantic import BaseModel, Field
 from pydantic import field_validator
@@ -11,7 +11,8 @@ from src.api.models.envelope import ApiEnvelope
 
 
 def _word_count(text: str) -> int:
-    return len(re.findall(r"\S+", text.strip()))
+    # str.split() splits on the same Unicode whitespace as \S+ without a regex
+    return len(text.split())
 
 
 class CoachingDimension(BaseModel):
@@ -139,6 +140,14 @@ class TurnResponseData(BaseModel):
         description="End-of-session summary payload (final turn only)",
     )
 
+    summary_status: Literal["pending", "ready", "failed"] | None = Field(
+        default=None,
+        description=(
+            "Final turn only: 'pending' when the summary is generated in the "
+            "background and must be fetched from GET /session/{id}/summary"
+        ),
+    )
+
     timings: dict[str, float] = Field(
         ...,
         description="Pipeline stage timings in milliseconds",
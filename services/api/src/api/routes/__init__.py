@@ -1,5 +1,5 @@
 """API routes package."""
 
-from src.api.routes import health, session, turn, tts
+from src.api.routes import health, metrics, profiling, session, turn, tts
 
-__all__ = ["health", "session", "turn", "tts"]
+__all__ = ["health", "metrics", "profiling", "session", "turn", "tts"]
@@ -0,0 +1,31 @@
+"""Metrics endpoint - GET /metrics in Prometheus text format.
+
+Exposes the in-process metrics registry (per-stage turn latency histograms
+and outcome counters) for scraping. Like TTS audio, successful responses are
+raw payloads rather than the JSON envelope so standard scrapers can parse them.
+"""
+
+from fastapi import APIRouter, Response
+
+from src.observability.metrics import PROMETHEUS_CONTENT_TYPE, get_metrics_registry
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus metrics",
+    description="Per-stage latency histograms and counters in Prometheus text format.",
+    responses={
+        200: {
+            "description": "Metrics in Prometheus text exposition format",
+            "content": {"text/plain": {}},
+        }
+    },
+)
+async def get_metrics() -> Response:
+    """Render the metrics registry for Prometheus scraping."""
+    return Response(
+        content=get_metrics_registry().render(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -0,0 +1,114 @@
+"""Sampling profiler endpoint - GET /debug/profile.
+
+Disabled unless ``profiling_enabled`` is set, and refused with 403 until a
+``profiling_token`` is configured. Returns collapsed stacks as
+plain text on success (pipe into flamegraph.pl or load in speedscope) and the
+standard JSON envelope on errors.
+"""
+
+import asyncio
+import hmac
+import threading
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+
+from src.api.dependencies import RequestContext, get_request_context
+from src.api.models import ApiEnvelope, ApiError
+from src.observability.profiler import StackSampler, get_continuous_sampler
+from src.settings.config import get_settings
+
+router = APIRouter()
+
+_profile_lock = asyncio.Lock()
+
+
+def _error_response(
+    ctx: RequestContext, status_code: int, code: str, message: str, retryable: bool
+) -> Response:
+    return Response(
+        content=ApiEnvelope(
+            data=None,
+            error=ApiError(
+                stage="unknown",
+                code=code,
+                message_safe=message,
+                retryable=retryable,
+            ),
+            request_id=ctx.request_id,
+        ).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/profile",
+    summary="Sample worker stacks",
+    description=(
+        "Samples the event loop thread's stacks for `seconds` and returns "
+        "collapsed stacks tagged with the pipeline stage. Without `seconds`, "
+        "returns (and resets) the continuous sampler's profile when enabled."
+    ),
+    responses={200: {"content": {"text/plain": {}}}},
+)
+async def profile_worker(
+    seconds: float | None = Query(None, gt=0, le=60),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    profiling_token: str | None = Header(None, alias="X-Profiling-Token"),
+    ctx: RequestContext = Depends(get_request_context),
+) -> Response:
+    """Return a collapsed-stack profile of this worker."""
+    settings = get_settings()
+    if not settings.profiling_enabled:
+        return _error_response(
+            ctx, 404, "not_found", "Profiling is not enabled", retryable=False
+        )
+
+    if not settings.profiling_token:
+        # Stacks expose code paths and timings; never serve them unauthenticated
+        return _error_response(
+            ctx,
+            403,
+            "profiling_token_not_configured",
+            "Profiling requires a configured profiling token",
+            retryable=False,
+        )
+
+    if not hmac.compare_digest(profiling_token or "", settings.profiling_token):
+        return _error_response(
+            ctx, 401, "invalid_token", "Invalid profiling token", retryable=False
+        )
+
+    if seconds is None:
+        continuous = get_continuous_sampler()
+        if continuous is not None:
+            samples = continuous.samples
+            return Response(
+                content=continuous.collapsed(reset=True),
+                media_type="text/plain",
+                headers={"X-Profile-Samples": str(samples)},
+            )
+        seconds = 10.0
+
+    if _profile_lock.locked():
+        return _error_response(
+            ctx, 409, "profiler_busy", "A profile is already running", retryable=True
+        )
+
+    async with _profile_lock:
+        sampler = StackSampler(
+            interval_seconds=interval_ms / 1000,
+            loop=asyncio.get_running_loop(),
+            thread_id=threading.get_ident(),
+        )
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+
+    return Response(
+        content=sampler.collapsed(),
+        media_type="text/plain",
+        headers={"X-Profile-Samples": str(sampler.samples)},
+    )
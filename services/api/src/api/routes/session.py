@@ -1,12 +1,13 @@
 """Session routes - /session endpoints."""
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Response
 
 from src.api.dependencies import RequestContext, get_request_context
 from src.api.dependencies.shared_services import (
     get_session_store,
     get_token_service,
     get_tts_cache,
+    get_summary_jobs,
 )
 from src.api.models import (
     SessionStartRequest,
@@ -14,16 +15,70 @@ from src.api.models import (
     SessionData,
     DeleteResult,
     DeleteSessionResponse,
+    SessionSummaryData,
+    SessionSummaryResponse,
     ApiEnvelope,
     ApiError,
 )
 from src.security import SessionTokenService
-from src.services import SessionStore, TTSCache, generate_opening_prompt
+from src.services import (
+    SessionStore,
+    SessionSummaryJobs,
+    TTSCache,
+    generate_opening_prompt,
+)
+from src.settings.config import get_settings
 
 
 router = APIRouter(tags=["Session Management"])
 
 
+def _error_response(
+    status_code: int, code: str, message_safe: str, request_id: str
+) -> Response:
+    """Return an error envelope with a non-200 status code."""
+    return Response(
+        content=ApiEnvelope(
+            data=None,
+            error=ApiError(
+                stage="unknown",
+                code=code,
+                message_safe=message_safe,
+                retryable=False,
+            ),
+            request_id=request_id,
+        ).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _verify_session_token(
+    authorization: str | None,
+    session_id: str,
+    token_service: SessionTokenService,
+    request_id: str,
+) -> Response | None:
+    """Return a 401 response unless the bearer token is valid for session_id."""
+    if authorization is None:
+        return _error_response(
+            401, "invalid_token", "Missing authorization header", request_id
+        )
+
+    if not authorization.startswith("Bearer "):
+        return _error_response(
+            401, "invalid_token", "Invalid authorization header format", request_id
+        )
+
+    token = authorization[7:]
+    token_session_id = token_service.verify_token(token)
+    if token_session_id is None or token_session_id != session_id:
+        return _error_response(
+            401, "invalid_token", "Session token is invalid or expired", request_id
+        )
+    return None
+
+
 @router.post(
     "/start",
     response_model=SessionStartResponse,
@@ -98,73 +153,23 @@ async def delete_session(
     tts_cache: TTSCache = Depends(get_tts_cache),
 ) -> DeleteSessionResponse | Response:
     """Delete session artifacts for a valid session/token pair."""
-    if authorization is None:
-        return Response(
-            content=ApiEnvelope(
-                data=None,
-                error=ApiError(
-                    stage="unknown",
-                    code="invalid_token",
-                    message_safe="Missing authorization header",
-                    retryable=False,
-                ),
-                request_id=ctx.request_id,
-            ).model_dump_json(),
-            status_code=401,
-            media_type="application/json",
-        )
-
-    if not authorization.startswith("Bearer "):
-        return Response(
-            content=ApiEnvelope(
-                data=None,
-                error=ApiError(
-                    stage="unknown",
-                    code="invalid_token",
-                    message_safe="Invalid authorization header format",
-                    retryable=False,
-                ),
-                request_id=ctx.request_id,
-            ).model_dump_json(),
-            status_code=401,
-            media_type="application/json",
-        )
-
-    token = authorization[7:]
-    token_session_id = token_service.verify_token(token)
-    if token_session_id is None or token_session_id != session_id:
-        return Response(
-            content=ApiEnvelope(
-                data=None,
-                error=ApiError(
-                    stage="unknown",
-                    code="invalid_token",
-                    message_safe="Session token is invalid or expired",
-                    retryable=False,
-                ),
-                request_id=ctx.request_id,
-            ).model_dump_json(),
-            status_code=401,
-            media_type="application/json",
-        )
+    auth_error = _verify_session_token(
+        authorization, session_id, token_service, ctx.request_id
+    )
+    if auth_error is not None:
+        return auth_error
 
     deleted = session_store.delete_session(session_id)
     if not deleted:
-        return Response(
-            content=ApiEnvelope(
-                data=None,
-                error=ApiError(
-                    stage="unknown",
-                    code="session_not_found",
-                    message_safe="Session not found or already deleted.",
-                    retryable=False,
-                ),
-                request_id=ctx.request_id,
-            ).model_dump_json(),
-            status_code=404,
-            media_type="application/json",
+        return _error_response(
+            404,
+            "session_not_found",
+            "Session not found or already deleted.",
+            ctx.request_id,
         )
 
+    # A sync task, so Starlette runs it in the threadpool after the response
+    # rather than on the event loop (the disk store walks its directories)
     background_tasks.add_task(tts_cache.cleanup)
 
     return ApiEnvelope(
@@ -172,3 +177,60 @@ async def delete_session(
         error=None,
         request_id=ctx.request_id,
     )
+
+
+@router.get(
+    "/{session_id}/summary",
+    response_model=SessionSummaryResponse,
+    status_code=200,
+    summary="Get the end-of-session summary",
+    description=(
+        "Returns the session summary once the final turn has been submitted. "
+        "While the summary is still being generated, `wait` long-polls for up "
+        "to that many seconds before returning `summary_status: pending`."
+    ),
+)
+async def get_session_summary(
+    session_id: str,
+    wait: float = Query(0.0, ge=0.0, description="Seconds to long-poll"),
+    authorization: str | None = Header(None, alias="Authorization"),
+    ctx: RequestContext = Depends(get_request_context),
+    session_store: SessionStore = Depends(get_session_store),
+    token_service: SessionTokenService = Depends(get_token_service),
+    summary_jobs: SessionSummaryJobs = Depends(get_summary_jobs),
+) -> SessionSummaryResponse | Response:
+    """Fetch (or long-poll for) the summary of a completed session."""
+    auth_error = _verify_session_token(
+        authorization, session_id, token_service, ctx.request_id
+    )
+    if auth_error is not None:
+        return auth_error
+
+    session = session_store.get_session(session_id)
+    if session is not None and session.summary_status == "pending" and wait > 0:
+        await summary_jobs.wait(
+            session_id,
+            timeout=min(wait, get_settings().session_summary_max_wait_seconds),
+        )
+        session = session_store.get_session(session_id)
+
+    if session is None:
+        return _error_response(
+            404, "session_not_found", "Session not found or expired", ctx.request_id
+        )
+    if session.summary_status is None:
+        return _error_response(
+            409,
+            "session_not_complete",
+            "Session summary is available after the final turn",
+            ctx.request_id,
+        )
+
+    return ApiEnvelope(
+        data=SessionSummaryData(
+            summary_status=session.summary_status,
+            session_summary=session.session_summary,
+        ),
+        error=None,
+        request_id=ctx.request_id,
+    )
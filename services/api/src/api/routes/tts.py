@@ -1,7 +1,11 @@
 """TTS audio fetch route - GET /tts/{request_id} endpoint."""
 
+import asyncio
 import logging
+import os
+
 from fastapi import APIRouter, Depends, Header, Response
+from fastapi.responses import FileResponse
 
 from src.api.dependencies import RequestContext, get_request_context
 from src.api.dependencies.shared_services import (
@@ -10,13 +14,32 @@ from src.api.dependencies.shared_services import (
 )
 from src.api.models import ApiEnvelope, ApiError
 from src.security import SessionTokenService
-from src.services import TTSCache
+from src.services import DiskTTSStore, TTSCache
+from src.services.tts_cache import audio_media_type
 
 
 router = APIRouter(tags=["TTS Audio"])
 logger = logging.getLogger(__name__)
 
 
+def _not_found(request_id: str, ctx: RequestContext) -> Response:
+    logger.warning(f"TTS audio not found or expired for request_id: {request_id}")
+    return Response(
+        content=ApiEnvelope(
+            data=None,
+            error=ApiError(
+                stage="tts",
+                code="tts_audio_not_found",
+                message_safe="TTS audio not found or has expired",
+                retryable=False,
+            ),
+            request_id=ctx.request_id,
+        ).model_dump_json(),
+        status_code=404,
+        media_type="application/json",
+    )
+
+
 @router.get(
     "/{request_id}",
     status_code=200,
@@ -29,7 +52,10 @@ logger = logging.getLogger(__name__)
     responses={
         200: {
             "description": "TTS audio retrieved successfully",
-            "content": {"audio/mpeg": {"example": "<binary audio data>"}},
+            "content": {
+                "audio/mpeg": {"example": "<binary audio data>"},
+                "audio/wav": {"example": "<binary audio data>"},
+            },
         },
         401: {
             "description": "Invalid or missing session token",
@@ -72,7 +98,7 @@ async def fetch_tts_audio(
     authorization: str | None = Header(None, alias="Authorization"),
     ctx: RequestContext = Depends(get_request_context),
     token_service: SessionTokenService = Depends(get_token_service),
-    tts_cache: TTSCache = Depends(get_tts_cache),
+    tts_cache: TTSCache | DiskTTSStore = Depends(get_tts_cache),
 ) -> Response:
     """
     Fetch TTS audio by request ID.
@@ -84,7 +110,8 @@ async def fetch_tts_audio(
     - `Authorization`: Bearer token for session authentication (required)
 
     **Success Response (200):**
-    - Returns raw audio bytes with `Content-Type: audio/mpeg`
+    - Returns raw audio bytes with `Content-Type: audio/mpeg` (or `audio/wav`
+      with the local TTS backend)
     - Includes `X-Request-ID` header (added by middleware)
 
     **Error Responses:**
@@ -95,6 +122,7 @@ async def fetch_tts_audio(
     - Audio is cached for 5 minutes after generation
     - After TTL expiration, the endpoint returns 404
     - Successful responses return raw bytes, NOT JSON envelope
+    - With the disk TTS store the file is sent directly (sendfile)
     - Error responses use the standard JSON envelope format
     """
     # Check if Authorization header is missing
@@ -155,25 +183,27 @@ async def fetch_tts_audio(
             media_type="application/json",
         )
 
+    if isinstance(tts_cache, DiskTTSStore):
+        # Stream the stored file without reading it into memory
+        stored = await asyncio.to_thread(tts_cache.locate, request_id)
+        if stored is None:
+            return _not_found(request_id, ctx)
+        try:
+            # Stat here so a clip removed by a concurrent cleanup is a 404
+            # rather than an error inside FileResponse
+            stat_result = await asyncio.to_thread(os.stat, stored.path)
+        except FileNotFoundError:
+            return _not_found(request_id, ctx)
+        logger.info(f"TTS audio served from disk for request_id: {request_id}")
+        return FileResponse(
+            stored.path, media_type=stored.media_type, stat_result=stat_result
+        )
+
     # Attempt to retrieve audio from cache
     audio_bytes = tts_cache.get(request_id)
 
     if audio_bytes is None:
-        logger.warning(f"TTS audio not found or expired for request_id: {request_id}")
-        return Response(
-            content=ApiEnvelope(
-                data=None,
-                error=ApiError(
-                    stage="tts",
-                    code="tts_audio_not_found",
-                    message_safe="TTS audio not found or has expired",
-                    retryable=False,
-                ),
-                request_id=ctx.request_id,
-            ).model_dump_json(),
-            status_code=404,
-            media_type="application/json",
-        )
+        return _not_found(request_id, ctx)
 
     # Success: return raw audio bytes
     logger.info(
@@ -182,5 +212,5 @@ async def fetch_tts_audio(
     )
     return Response(
         content=audio_bytes,
-        media_type="audio/mpeg",
+        media_type=audio_media_type(audio_bytes),
     )
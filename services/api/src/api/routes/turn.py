@@ -1,5 +1,6 @@
 """Turn submission route - POST /turn endpoint."""
 
+import asyncio
 import logging
 import time
 from fastapi import APIRouter, Depends, File, Form, UploadFile, Header
@@ -10,6 +11,9 @@ from src.api.dependencies.shared_services import (
     get_token_service,
     get_tts_cache,
     get_safety_filter,
+    get_safety_classifier,
+    get_rolling_summarizer,
+    get_summary_jobs,
 )
 from src.api.models import (
     TurnResponseData,
@@ -18,14 +22,69 @@ from src.api.models import (
     ApiError,
 )
 from src.domain.session_state import TurnRecord
-from src.services import process_turn, TurnProcessingError, TTSCache, SafetyFilter
+from src.observability.metrics import turn_requests_total, turn_stage_latency
+from src.observability.tracing import get_tracer
+from src.providers.stt_deepgram import DEEPGRAM_STT_MODEL, EmptyTranscriptError
+from src.services import (
+    process_turn,
+    TurnProcessingError,
+    TTSCache,
+    SafetyFilter,
+    BatchingSafetyClassifier,
+    RollingSummarizer,
+    SessionSummaryJobs,
+)
 from src.security import SessionTokenService
 from src.services import SessionStore
+from src.services.audio_preprocessing import measure_audio
+from src.services.audio_spool import SpooledAudio, spool_upload
+from src.settings.config import get_settings
 
 
 router = APIRouter(tags=["Turn Management"])
 
 
+def _record_turn_metrics(
+    timings: dict[str, float],
+    outcome: str,
+    stage: str,
+    llm_model: str | None = None,
+) -> None:
+    """Record per-stage latency histograms and the outcome counter for a turn.
+
+    Stages that did not run (e.g. STT on the transcript retry flow) report
+    0.0 and are skipped so they don't skew the latency distribution.
+    ``llm_model`` is the model the LLM router picked, when known.
+    """
+    settings = get_settings()
+    unrouted_model = "router" if settings.llm_router_enabled else settings.llm_model
+    stage_models = {
+        "upload_ms": ("upload", "none"),
+        "preprocess_ms": ("preprocess", "none"),
+        "stt_ms": (
+            "stt",
+            "vosk" if settings.stt_backend == "local" else DEEPGRAM_STT_MODEL,
+        ),
+        "llm_ms": ("llm", llm_model or unrouted_model),
+        # Split mode's separate coaching call
+        "coaching_ms": ("llm.coaching", unrouted_model),
+        "tts_ms": (
+            "tts",
+            "espeak" if settings.tts_backend == "local" else settings.tts_model,
+        ),
+        "total_ms": ("total", "none"),
+    }
+    histogram = turn_stage_latency()
+    for key, (stage_label, model) in stage_models.items():
+        value = timings.get(key)
+        if value is None:
+            continue
+        if value <= 0.0 and key not in ("upload_ms", "total_ms"):
+            continue
+        histogram.observe(value, stage=stage_label, model=model, outcome=outcome)
+    turn_requests_total().inc(stage=stage, outcome=outcome)
+
+
 @router.post(
     "",
     response_model=TurnResponse,
@@ -47,6 +106,11 @@ async def submit_turn(
     token_service: SessionTokenService = Depends(get_token_service),
     tts_cache: TTSCache = Depends(get_tts_cache),
     safety_filter: SafetyFilter = Depends(get_safety_filter),
+    safety_classifier: BatchingSafetyClassifier | None = Depends(
+        get_safety_classifier
+    ),
+    rolling_summarizer: RollingSummarizer = Depends(get_rolling_summarizer),
+    summary_jobs: SessionSummaryJobs = Depends(get_summary_jobs),
 ) -> TurnResponse:
     """
     Submit a turn (audio answer) for processing.
@@ -65,6 +129,8 @@ async def submit_turn(
     - `tts_audio_url`: URL for TTS audio (null in this story)
     - `timings`: Stage-wise processing timings
     - `is_complete`: Whether this was the final turn (session complete)
+    - `summary_status`: Final turn only; `pending` when the session summary is
+      generated in the background (fetch it from `GET /session/{id}/summary`)
     - `question_number`: Current question number (1-indexed)
     - `total_questions`: Total configured questions for the session
 
@@ -74,8 +140,11 @@ async def submit_turn(
     - 404: Session not found
     - 422: Missing audio file, empty audio, or invalid audio format
     - 500: STT processing error (with stage and retryable flag)
+    - `stt_empty_transcript`: also returned without calling STT for WAV/L16
+      recordings that are silent or too short
     """
     upload_start = time.perf_counter()
+    tracer = get_tracer()
 
     # Extract Bearer token
     if not authorization.startswith("Bearer "):
@@ -120,7 +189,8 @@ async def submit_turn(
         )
 
     # Validate session exists and is active
-    session = session_store.get_session(session_id)
+    with tracer.start_as_current_span("session_store.get"):
+        session = session_store.get_session(session_id)
     if session is None:
         return ApiEnvelope(
             data=None,
@@ -147,7 +217,7 @@ async def submit_turn(
         )
 
     # Validate audio file if provided
-    audio_bytes = None
+    audio_bytes: SpooledAudio | None = None
     content_type = None
 
     if audio:
@@ -163,26 +233,93 @@ async def submit_turn(
                 request_id=ctx.request_id,
             )
 
-        # Read audio bytes
-        audio_bytes = await audio.read()
-        if len(audio_bytes) == 0:
+        # UploadLimitMiddleware caps the request body; this also covers apps
+        # mounted without it
+        max_upload_bytes = get_settings().max_upload_bytes
+        if audio.size is not None and audio.size > max_upload_bytes:
             return ApiEnvelope(
                 data=None,
                 error=ApiError(
                     stage="upload",
-                    code="invalid_audio",
-                    message_safe="Audio file is empty",
+                    code="file_too_large",
+                    message_safe="Audio file is too large",
                     retryable=False,
+                    details={"max_bytes": max_upload_bytes},
                 ),
                 request_id=ctx.request_id,
             )
-        content_type = audio.content_type
-
-    upload_end = time.perf_counter()
-    upload_ms = (upload_end - upload_start) * 1000
 
-    # Process turn through orchestrator
     try:
+        if audio:
+            # Large uploads go to a memory-mapped temp file; process_turn
+            # releases the audio as soon as STT finishes
+            with tracer.start_as_current_span("upload.read") as span:
+                audio_bytes = await spool_upload(
+                    audio, get_settings().audio_spool_memory_bytes
+                )
+                span.set_attribute("upload.bytes", len(audio_bytes))
+                span.set_attribute("upload.spooled", audio_bytes.on_disk)
+            if len(audio_bytes) == 0:
+                return ApiEnvelope(
+                    data=None,
+                    error=ApiError(
+                        stage="upload",
+                        code="invalid_audio",
+                        message_safe="Audio file is empty",
+                        retryable=False,
+                    ),
+                    request_id=ctx.request_id,
+                )
+            content_type = audio.content_type
+
+        upload_end = time.perf_counter()
+        upload_ms = (upload_end - upload_start) * 1000
+
+        # Reject silent or too-short recordings without an STT round trip
+        settings = get_settings()
+        if audio_bytes and not transcript and settings.audio_silence_check_enabled:
+            with tracer.start_as_current_span("upload.silence_check") as span:
+                level = await asyncio.to_thread(
+                    measure_audio, audio_bytes.buffer, content_type
+                )
+                span.set_attribute("audio.decoded", level is not None)
+            if level is not None and (
+                level.duration_ms < settings.audio_min_duration_ms
+                or level.peak_rms_dbfs < settings.audio_silence_threshold_dbfs
+            ):
+                empty = EmptyTranscriptError()
+                _record_turn_metrics(
+                    {
+                        "upload_ms": upload_ms,
+                        "total_ms": (time.perf_counter() - upload_start) * 1000,
+                    },
+                    outcome=empty.code,
+                    stage=empty.stage,
+                )
+                return ApiEnvelope(
+                    data=None,
+                    error=ApiError(
+                        stage=empty.stage,
+                        code=empty.code,
+                        message_safe=str(empty),
+                        retryable=empty.retryable,
+                    ),
+                    request_id=ctx.request_id,
+                )
+
+        rolling_mode = get_settings().summary_mode == "rolling"
+        rolling_summary = None
+        if rolling_mode and session.turn_count + 1 >= session.question_count:
+            # Final turn: give queued background updates a short window to
+            # land, then merge from the last completed rolling summary (turns
+            # it doesn't cover yet are summarized from the full history)
+            await rolling_summarizer.wait(
+                session_id, timeout=get_settings().rolling_summary_final_wait_seconds
+            )
+            latest = session_store.get_session(session_id)
+            rolling_summary = latest.rolling_summary if latest is not None else None
+
+        # Process turn through orchestrator
         result = await process_turn(
             audio_bytes,
             content_type,
@@ -191,18 +328,14 @@ async def submit_turn(
             interview_type=session.interview_type,
             difficulty=session.difficulty,
             asked_questions=session.asked_questions,
-            turn_history=[
-                {
-                    "turn_number": turn.turn_number,
-                    "transcript": turn.transcript,
-                    "assistant_text": turn.assistant_text,
-                    "coaching_feedback": turn.coaching_feedback,
-                }
-                for turn in session.turn_history
-            ],
+            turn_history=session.turn_history,
+            rubric_scores=session.rubric_scores,
+            rolling_summary=rolling_summary,
+            defer_summary=get_settings().session_summary_async,
             question_count=session.question_count,
             tts_cache=tts_cache,
             safety_filter=safety_filter,
+            safety_classifier=safety_classifier,
             transcript=transcript,
             request_id=ctx.request_id,
         )
@@ -212,36 +345,50 @@ async def submit_turn(
         if result.assistant_text:
             new_asked_questions.append(result.assistant_text)
 
-        new_turn_history = list(session.turn_history)
-        new_turn_history.append(
-            TurnRecord(
-                turn_number=session.turn_count,
-                transcript=result.transcript,
-                assistant_text=result.assistant_text or "",
-                coaching_feedback=(
-                    result.coaching_feedback.model_dump()
-                    if result.coaching_feedback is not None
-                    else None
-                ),
-            )
+        coaching_feedback = (
+            result.coaching_feedback.model_dump()
+            if result.coaching_feedback is not None
+            else None
         )
+        session.rubric_scores.record(coaching_feedback)
 
         # Detect session completion
         is_complete = session.turn_count >= session.question_count
         new_status = "completed" if is_complete else session.status
+        summary_status = None
+        if result.pending_summary is not None:
+            summary_status = "pending"
+        elif is_complete:
+            summary_status = "ready" if result.session_summary else "failed"
 
         # Save session state changes
-        session_store.update_session(
-            session_id,
-            turn_count=session.turn_count,
-            last_activity_at=session.last_activity_at,
-            asked_questions=new_asked_questions,
-            turn_history=new_turn_history,
-            status=new_status,
-        )
+        with tracer.start_as_current_span("session_store.update"):
+            session_store.append_turn(
+                session_id,
+                TurnRecord(
+                    turn_number=session.turn_count,
+                    transcript=result.transcript,
+                    assistant_text=result.assistant_text or "",
+                    coaching_feedback=coaching_feedback,
+                ),
+                turn_count=session.turn_count,
+                last_activity_at=session.last_activity_at,
+                asked_questions=new_asked_questions,
+                rubric_scores=session.rubric_scores,
+                session_summary=result.session_summary,
+                summary_status=summary_status,
+                status=new_status,
+            )
+        if result.pending_summary is not None:
+            summary_jobs.start(session_store, session_id, result.pending_summary)
+        if rolling_mode and not is_complete:
+            rolling_summarizer.schedule(session_store, session_id)
 
         # Add upload timing to result timings
         result.timings["upload_ms"] = upload_ms
+        _record_turn_metrics(
+            result.timings, outcome="ok", stage="none", llm_model=result.llm_model
+        )
 
         # Log structured timing data
         logging.info(
@@ -261,6 +408,7 @@ async def submit_turn(
             tts_audio_url=result.tts_audio_url,
             coaching_feedback=result.coaching_feedback,
             session_summary=result.session_summary,
+            summary_status=summary_status,
             timings=result.timings,
             is_complete=is_complete,
             question_number=session.turn_count,
@@ -274,6 +422,15 @@ async def submit_turn(
         )
 
     except TurnProcessingError as e:
+        _record_turn_metrics(
+            {
+                "upload_ms": upload_ms,
+                "total_ms": (time.perf_counter() - upload_start) * 1000,
+            },
+            outcome=e.code,
+            stage=e.stage,
+        )
+
         # Return stage-aware error response
         return ApiEnvelope(
             data=None,
@@ -285,3 +442,8 @@ async def submit_turn(
             ),
             request_id=ctx.request_id,
         )
+    finally:
+        # Already released after STT on the happy path; this covers early
+        # returns, the transcript retry flow and failures before STT
+        if audio_bytes is not None:
+            audio_bytes.close()
@@ -1,6 +1,19 @@
 """Domain package - Business logic and entities."""
 
-from src.domain.session_state import SessionState, SessionStatus
+from src.domain.session_state import (
+    RubricScores,
+    SessionState,
+    SessionStatus,
+    SummaryStatus,
+    TurnRecord,
+)
 from src.domain.stages import Stage
 
-__all__ = ["SessionState", "SessionStatus", "Stage"]
+__all__ = [
+    "RubricScores",
+    "SessionState",
+    "SessionStatus",
+    "Stage",
+    "SummaryStatus",
+    "TurnRecord",
+]
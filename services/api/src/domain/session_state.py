@@ -6,11 +6,16 @@ from typing import Literal
 
 
 SessionStatus = Literal["active", "completed", "expired"]
+SummaryStatus = Literal["pending", "ready", "failed"]
 
 
-@dataclass
+@dataclass(frozen=True)
 class TurnRecord:
-    """Per-turn data required for end-of-session summary generation."""
+    """Per-turn data required for end-of-session summary generation.
+
+    Immutable so session copies can share records instead of copying the
+    whole history; treat ``coaching_feedback`` as read-only too.
+    """
 
     turn_number: int
     transcript: str
@@ -18,6 +23,52 @@ class TurnRecord:
     coaching_feedback: dict | None = None
 
 
+@dataclass
+class RubricScores:
+    """Running per-dimension rubric score sums and counts for a session.
+
+    Updated once per turn so averages and the weakest dimensions are available
+    at summary time without walking the turn history.
+    """
+
+    sums: dict[str, int] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def record(self, coaching_feedback: dict | None) -> None:
+        """Add one turn's ``coaching_feedback`` dimension scores."""
+        if not isinstance(coaching_feedback, dict):
+            return
+        dimensions = coaching_feedback.get("dimensions")
+        if not isinstance(dimensions, list):
+            return
+
+        for dimension in dimensions:
+            if not isinstance(dimension, dict):
+                continue
+            label = dimension.get("label")
+            score = dimension.get("score")
+            if not isinstance(label, str):
+                continue
+            if not isinstance(score, (int, float)):
+                continue
+
+            normalized_label = label.strip().lower().replace(" ", "_")
+            self.sums[normalized_label] = self.sums.get(normalized_label, 0) + int(
+                score
+            )
+            self.counts[normalized_label] = self.counts.get(normalized_label, 0) + 1
+
+    def averages(self) -> dict[str, float]:
+        """Average score per normalized dimension label, rounded to 2 places."""
+        return {
+            label: round(self.sums[label] / self.counts[label], 2)
+            for label in self.sums
+        }
+
+    def copy(self) -> "RubricScores":
+        return RubricScores(sums=dict(self.sums), counts=dict(self.counts))
+
+
 @dataclass
 class SessionState:
     """Domain model representing interview session state."""
@@ -32,4 +83,10 @@ class SessionState:
     turn_count: int = 0
     asked_questions: list[str] = field(default_factory=list)
     turn_history: list[TurnRecord] = field(default_factory=list)
+    rubric_scores: RubricScores = field(default_factory=RubricScores)
+    # Compact strengths/improvements for turns 1..covered_turns (rolling mode)
+    rolling_summary: dict | None = None
+    # End-of-session summary; None until the final turn
+    session_summary: dict | None = None
+    summary_status: SummaryStatus | None = None
     status: SessionStatus = "active"
@@ -16,8 +16,12 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
+from src.api.middleware import UploadLimitMiddleware
 from src.api.models import ApiEnvelope, ApiError
-from src.api.routes import health, session, turn, tts
+from src.api.routes import health, metrics, profiling, session, turn, tts
+from src.observability.profiler import get_continuous_sampler
+from src.observability.tracing import get_tracer
+from src.settings.config import get_settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -28,9 +32,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup/shutdown events."""
     # Startup
     logger.info("VoiceMock API starting up...")
+    sampler = get_continuous_sampler()
+    if sampler is not None:
+        sampler.start()
     yield
     # Shutdown
     logger.info("VoiceMock API shutting down...")
+    if sampler is not None:
+        sampler.stop()
 
 
 def create_app() -> FastAPI:
@@ -52,13 +61,30 @@ def create_app() -> FastAPI:
         allow_headers=["Content-Type", "X-Session-Token"],
     )
 
+    # Upload limits - added before the request ID middleware so it runs inside
+    # it and rejections still carry the request ID
+    settings = get_settings()
+    app.add_middleware(
+        UploadLimitMiddleware,
+        max_bytes=settings.max_upload_bytes,
+        read_timeout_seconds=settings.upload_read_timeout_seconds,
+        total_timeout_seconds=settings.upload_total_timeout_seconds,
+    )
+
     # Request ID middleware
     @app.middleware("http")
     async def add_request_id(request: Request, call_next):
         """Add X-Request-ID to all responses and request state."""
         request_id = str(uuid.uuid4())
         request.state.request_id = request_id
-        response = await call_next(request)
+        # Root span shares the request id as its trace id for correlation
+        with get_tracer().start_as_current_span(
+            f"{request.method} {request.url.path}",
+            attributes={"http.method": request.method, "request_id": request_id},
+            trace_id=request_id,
+        ) as span:
+            response = await call_next(request)
+            span.set_attribute("http.status_code", response.status_code)
         response.headers["X-Request-ID"] = request_id
         return response
 
@@ -155,6 +181,8 @@ def create_app() -> FastAPI:
 
     # Register routers
     app.include_router(health.router, tags=["Health"])
+    app.include_router(metrics.router, tags=["Observability"])
+    app.include_router(profiling.router, prefix="/debug", tags=["Observability"])
     app.include_router(session.router, prefix="/session", tags=["Session Management"])
     app.include_router(turn.router, prefix="/turn", tags=["Turn Management"])
     app.include_router(tts.router, prefix="/tts", tags=["TTS Audio"])
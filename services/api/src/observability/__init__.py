@@ -1 +1,10 @@
 """Observability package - Logging, metrics, and tracing."""
+
+from src.observability.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+__all__ = ["Counter", "Histogram", "MetricsRegistry", "get_metrics_registry"]
@@ -0,0 +1,313 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Provides counters and bucketed histograms keyed by label values. Each uvicorn
+worker runs a single event loop, so observations are plain in-place updates
+on per-series lists without taking a lock; only the creation of a new label
+series is guarded.
+"""
+
+from __future__ import annotations
+
+import bisect
+from functools import lru_cache
+from threading import Lock
+
+# Latency buckets in milliseconds, tuned for the STT → LLM → TTS pipeline
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2000.0,
+    3000.0,
+    5000.0,
+    10000.0,
+    30000.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Shared label handling for counters and histograms."""
+
+    metric_type = ""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._series_lock = Lock()
+
+    def _new_series(self) -> list[float]:
+        raise NotImplementedError
+
+    def _get_series(self, labels: dict[str, str]) -> list[float]:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        series = self._series.get(key)
+        if series is None:
+            with self._series_lock:
+                series = self._series.setdefault(key, self._new_series())
+        return series
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for key, series in sorted(self._series.items()):
+            lines.extend(self._render_series(key, series))
+        return lines
+
+    def _render_series(self, key: tuple[str, ...], series: list[float]) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def _new_series(self) -> list[float]:
+        return [0.0]
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter for the given label values."""
+        self._get_series(labels)[0] += amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given label values."""
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        series = self._series.get(key)
+        return series[0] if series else 0.0
+
+    def _render_series(self, key: tuple[str, ...], series: list[float]) -> list[str]:
+        labels = _format_labels(self.label_names, key)
+        return [f"{self.name}{labels} {_format_value(series[0])}"]
+
+
+class Histogram(_Metric):
+    """Bucketed histogram compatible with Prometheus ``histogram_quantile``.
+
+    Series layout: one non-cumulative count per bucket, one overflow slot for
+    ``+Inf``, then the running sum and total count.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS,
+    ):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_series(self) -> list[float]:
+        return [0.0] * (len(self.buckets) + 3)
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record a single observation for the given label values."""
+        series = self._get_series(labels)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for the given label values."""
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        series = self._series.get(key)
+        return int(series[-1]) if series else 0
+
+    def _render_series(self, key: tuple[str, ...], series: list[float]) -> list[str]:
+        lines = []
+        cumulative = 0.0
+        bucket_bounds = self.buckets + (float("inf"),)
+        for index, bound in enumerate(bucket_bounds):
+            cumulative += series[index]
+            labels = _format_labels(
+                self.label_names + ("le",), key + (_format_value(bound),)
+            )
+            lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+        labels = _format_labels(self.label_names, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+        lines.append(f"{self.name}_count{labels} {_format_value(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registry of named metrics rendered together on ``/metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    def counter(
+        self, name: str, help_text: str, label_names: tuple[str, ...] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, help_text, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, help_text, label_names, buckets))
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(
+                        f"Metric {metric.name} already registered as "
+                        f"{existing.metric_type}"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return MetricsRegistry()
+
+
+def turn_stage_latency() -> Histogram:
+    """Per-stage latency histogram for ``/turn`` (milliseconds)."""
+    return get_metrics_registry().histogram(
+        "voicemock_turn_stage_duration_ms",
+        "Turn pipeline stage latency in milliseconds.",
+        ("stage", "model", "outcome"),
+    )
+
+
+PROMPT_SIZE_BUCKETS_BYTES: tuple[float, ...] = (
+    256,
+    512,
+    1024,
+    2048,
+    4096,
+    8192,
+    16384,
+    32768,
+    65536,
+)
+
+
+def llm_prompt_bytes() -> Histogram:
+    """Size of LLM prompt sections sent per request (UTF-8 bytes)."""
+    return get_metrics_registry().histogram(
+        "voicemock_llm_prompt_bytes",
+        "LLM prompt size in bytes by prompt and section.",
+        ("prompt", "section"),
+        buckets=PROMPT_SIZE_BUCKETS_BYTES,
+    )
+
+
+def llm_prompt_prefix_cache_total() -> Counter:
+    """Counter of memoized system prompt prefix lookups by result."""
+    return get_metrics_registry().counter(
+        "voicemock_llm_prompt_prefix_cache_total",
+        "System prompt prefix memo lookups by result (hit or miss).",
+        ("result",),
+    )
+
+
+def llm_response_cache_total() -> Counter:
+    """Counter of LLM response cache lookups by prompt and result."""
+    return get_metrics_registry().counter(
+        "voicemock_llm_response_cache_total",
+        "LLM response cache lookups by prompt and result (hit or miss).",
+        ("prompt", "result"),
+    )
+
+
+def llm_response_cache_evictions_total() -> Counter:
+    """Counter of LLM response cache evictions by reason."""
+    return get_metrics_registry().counter(
+        "voicemock_llm_response_cache_evictions_total",
+        "LLM response cache evictions by reason (ttl or lru).",
+        ("reason",),
+    )
+
+
+def turn_requests_total() -> Counter:
+    """Counter of processed ``/turn`` requests by outcome code."""
+    return get_metrics_registry().counter(
+        "voicemock_turn_requests_total",
+        "Total /turn requests by failing stage and outcome code.",
+        ("stage", "outcome"),
+    )
+
+
+def llm_router_requests_total() -> Counter:
+    """Counter of routed LLM calls by route, backend and outcome."""
+    return get_metrics_registry().counter(
+        "voicemock_llm_router_requests_total",
+        "LLM router calls by route, backend and outcome (ok, fallback or error).",
+        ("route", "backend", "outcome"),
+    )
+
+
+AUDIO_SIZE_BUCKETS_BYTES: tuple[float, ...] = (
+    16384,
+    65536,
+    262144,
+    524288,
+    1048576,
+    2097152,
+    4194304,
+    8388608,
+    16777216,
+)
+
+
+def stt_audio_bytes() -> Histogram:
+    """Size of turn audio as received and as sent to STT (bytes)."""
+    return get_metrics_registry().histogram(
+        "voicemock_stt_audio_bytes",
+        "Turn audio size in bytes, as uploaded (received) and as sent to STT.",
+        ("stage",),
+        buckets=AUDIO_SIZE_BUCKETS_BYTES,
+    )
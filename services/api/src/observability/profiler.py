@@ -0,0 +1,152 @@
+"""Statistical stack-sampling profiler for the running worker.
+
+A background thread periodically snapshots the event loop thread's stack via
+``sys._current_frames()`` and counts identical stacks. Output is in collapsed
+stack format (``frame;frame;frame count``), which ``flamegraph.pl``,
+speedscope and inferno render directly.
+
+Each sample is prefixed with the pipeline stage of the asyncio task that was
+running at that instant. The orchestrator marks stages with ``pipeline_stage``;
+samples taken while the loop is idle are tagged ``idle``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from types import CodeType, FrameType
+from typing import Iterator
+from weakref import WeakKeyDictionary
+
+from src.settings.config import get_settings
+
+_MAX_STACK_DEPTH = 128
+
+_task_stages: "WeakKeyDictionary[asyncio.Task, str]" = WeakKeyDictionary()
+
+
+@contextmanager
+def pipeline_stage(stage: str) -> Iterator[None]:
+    """Tag the current asyncio task with a pipeline stage for profiling."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is None:
+        yield
+        return
+
+    previous = _task_stages.get(task)
+    _task_stages[task] = stage
+    try:
+        yield
+    finally:
+        if previous is None:
+            _task_stages.pop(task, None)
+        else:
+            _task_stages[task] = previous
+
+
+def _frame_label(code: CodeType) -> str:
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_name}"
+
+
+class StackSampler:
+    """Samples one thread's stack at a fixed interval on a daemon thread."""
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.01,
+        loop: asyncio.AbstractEventLoop | None = None,
+        thread_id: int | None = None,
+    ):
+        self._interval = interval_seconds
+        self._loop = loop
+        self._thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._counts: Counter[tuple[str, tuple[CodeType, ...]]] = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.samples = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="voicemock-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _current_stage(self) -> str:
+        if self._loop is None:
+            return "unknown"
+        task = asyncio.current_task(self._loop)
+        if task is None:
+            return "idle"
+        return _task_stages.get(task, "other")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.sample_once()
+
+    def sample_once(self) -> None:
+        """Take a single sample of the target thread's stack."""
+        frame: FrameType | None = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        stage = self._current_stage()
+        codes = []
+        while frame is not None and len(codes) < _MAX_STACK_DEPTH:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        with self._lock:
+            self._counts[(stage, tuple(codes))] += 1
+            self.samples += 1
+
+    def collapsed(self, reset: bool = False) -> str:
+        """Render samples in collapsed stack format, stage first."""
+        with self._lock:
+            counts = self._counts
+            if reset:
+                self._counts = Counter()
+                self.samples = 0
+            else:
+                counts = Counter(counts)
+
+        merged: Counter[str] = Counter()
+        for (stage, codes), count in counts.items():
+            frames = ";".join(_frame_label(code) for code in codes)
+            merged[f"stage:{stage};{frames}" if frames else f"stage:{stage}"] += count
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(merged.items()))
+
+
+@lru_cache
+def get_continuous_sampler() -> StackSampler | None:
+    """Get the always-on sampler, or None when continuous profiling is off.
+
+    Must be first called from the event loop thread (the app lifespan) so the
+    sampler targets that thread.
+    """
+    settings = get_settings()
+    if not (settings.profiling_enabled and settings.profiling_continuous):
+        return None
+    return StackSampler(
+        interval_seconds=settings.profiling_continuous_interval_ms / 1000,
+        loop=asyncio.get_running_loop(),
+    )
@@ -0,0 +1,461 @@
+"""Lightweight span tracing with OTLP/JSON file export.
+
+Spans follow the OpenTelemetry data model (trace id, span id, parent span id,
+attributes, status) and are exported as OTLP/JSON ``ResourceSpans`` documents,
+one line per finished trace, which the OpenTelemetry Collector's
+``otlpjsonfile`` receiver can ingest directly.
+
+The trace id is derived from the request id assigned by the request-id
+middleware so traces and logs share one correlation handle. Sampling is decided
+once per trace from the trace id, so every span of a trace is either recorded
+or dropped together.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import ipaddress
+import os
+import ssl
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Iterator
+
+import httpx
+
+from src.settings.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_SERVICE_NAME = "voicemock-api"
+_STATUS_UNSET = 0
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+# Friendly names for httpcore trace phases. DNS resolution happens inside
+# connect_tcp, so "http.connect" covers both resolution and TCP connect.
+_HTTP_PHASE_NAMES = {
+    "connect_tcp": "http.connect",
+    "start_tls": "http.tls",
+    "send_request_headers": "http.send_headers",
+    "send_request_body": "http.send_body",
+    "receive_response_headers": "http.ttfb",
+    "receive_response_body": "http.receive_body",
+}
+
+# httpx's own default pool limits (also what Groq's SDK client uses)
+_DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class Span:
+    """A single timed operation within a trace."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "sampled",
+        "attributes",
+        "start_time_ns",
+        "end_time_ns",
+        "status_code",
+        "status_message",
+        "_tracer",
+        "_root",
+        "_buffer",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer | None",
+        name: str,
+        trace_id: str,
+        parent: "Span | None",
+        sampled: bool,
+        attributes: dict[str, Any] | None = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent is not None else None
+        self.sampled = sampled
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: int | None = None
+        self.status_code = _STATUS_UNSET
+        self.status_message = ""
+        self._tracer = tracer
+        self._root: Span = parent._root if parent is not None else self
+        self._buffer: list[Span] | None = [] if parent is None else None
+
+    @property
+    def is_recording(self) -> bool:
+        return self.sampled and self.end_time_ns is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        if self.sampled:
+            self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        """Mark the span as failed, keeping stage-aware error codes."""
+        if not self.sampled:
+            return
+        self.status_code = _STATUS_ERROR
+        self.status_message = type(exc).__name__
+        code = getattr(exc, "code", None)
+        if isinstance(code, str):
+            self.attributes["error.code"] = code
+
+    def end(self) -> None:
+        """Finish the span and hand finished traces to the exporter."""
+        if not self.is_recording or self._tracer is None:
+            return
+        self.end_time_ns = time.time_ns()
+        if self.status_code == _STATUS_UNSET:
+            self.status_code = _STATUS_OK
+
+        root = self._root
+        if root is self:
+            spans = (self._buffer or []) + [self]
+            self._buffer = None
+            self._tracer.export(spans)
+        elif root._buffer is not None:
+            root._buffer.append(self)
+        else:
+            # Root already exported (e.g. a background task outlived the request)
+            self._tracer.export([self])
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Serialize to an OTLP/JSON span object."""
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or self.start_time_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+_NOOP_SPAN = Span(None, "noop", "0" * 32, None, sampled=False)
+
+_current_span: ContextVar[Span | None] = ContextVar(
+    "voicemock_current_span", default=None
+)
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        wrapped = {"boolValue": value}
+    elif isinstance(value, int):
+        wrapped = {"intValue": str(value)}
+    elif isinstance(value, float):
+        wrapped = {"doubleValue": value}
+    else:
+        wrapped = {"stringValue": str(value)}
+    return {"key": key, "value": wrapped}
+
+
+def current_span() -> Span:
+    """Return the active span, or a non-recording span if none is active."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+class FileSpanExporter:
+    """Append finished traces to a file as OTLP/JSON lines."""
+
+    def __init__(self, path: str, service_name: str = _SERVICE_NAME):
+        self._path = path
+        self._service_name = service_name
+        self._lock = Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        document = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            _otlp_attribute("service.name", self._service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "voicemock.tracing"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(document, separators=(",", ":"))
+        try:
+            with self._lock, open(self._path, "a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+        except OSError as exc:
+            logger.warning("Failed to export trace to %s: %s", self._path, exc)
+
+
+class InMemorySpanExporter:
+    """Collect finished spans in memory (useful for tests and local debugging)."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class Tracer:
+    """Creates spans and decides per-trace sampling."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_ratio: float = 1.0,
+        exporter: FileSpanExporter | InMemorySpanExporter | None = None,
+    ):
+        self._enabled = enabled and exporter is not None
+        self._sample_ratio = min(max(sample_ratio, 0.0), 1.0)
+        self._exporter = exporter
+
+    @classmethod
+    def from_settings(cls) -> "Tracer":
+        """Construct tracer from app settings."""
+        settings = get_settings()
+        exporter = None
+        if settings.tracing_enabled:
+            if settings.tracing_export_path:
+                exporter = FileSpanExporter(settings.tracing_export_path)
+            else:
+                logger.warning("Tracing enabled without tracing_export_path")
+        return cls(
+            enabled=settings.tracing_enabled,
+            sample_ratio=settings.tracing_sample_ratio,
+            exporter=exporter,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def export(self, spans: list[Span]) -> None:
+        if self._exporter is not None:
+            self._exporter.export(spans)
+
+    def _should_sample(self, trace_id: str) -> bool:
+        if self._sample_ratio >= 1.0:
+            return True
+        if self._sample_ratio <= 0.0:
+            return False
+        # Same decision as OTel's TraceIdRatioBased sampler: compare the low
+        # 8 bytes of the trace id against the ratio bound.
+        return int(trace_id[-16:], 16) < int(self._sample_ratio * (1 << 64))
+
+    def start_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        trace_id: str | None = None,
+        parent: Span | None = None,
+    ) -> Span:
+        """Start a span without making it current; caller must call ``end()``."""
+        if not self._enabled:
+            return _NOOP_SPAN
+        if parent is None:
+            parent = _current_span.get()
+        if parent is not None and parent is not _NOOP_SPAN:
+            if not parent.sampled:
+                return parent
+            return Span(self, name, parent.trace_id, parent, True, attributes)
+
+        resolved_trace_id = _normalize_trace_id(trace_id)
+        sampled = self._should_sample(resolved_trace_id)
+        return Span(self, name, resolved_trace_id, None, sampled, attributes)
+
+    @contextmanager
+    def start_as_current_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        trace_id: str | None = None,
+    ) -> Iterator[Span]:
+        """Start a span, make it current for the block, and end it on exit."""
+        if not self._enabled:
+            yield _NOOP_SPAN
+            return
+
+        span = self.start_span(name, attributes, trace_id=trace_id)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+
+def _normalize_trace_id(trace_id: str | None) -> str:
+    if trace_id:
+        candidate = trace_id.replace("-", "").lower()
+        if len(candidate) == 32 and all(c in "0123456789abcdef" for c in candidate):
+            return candidate
+    return os.urandom(16).hex()
+
+
+@lru_cache
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer configured from settings."""
+    return Tracer.from_settings()
+
+
+class _HttpTraceRecorder:
+    """httpcore ``trace`` extension callback that emits per-phase child spans."""
+
+    def __init__(self, tracer: Tracer, parent: Span):
+        self._tracer = tracer
+        self._parent = parent
+        self._open: dict[str, Span] = {}
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        prefix, _, suffix = event_name.rpartition(".")
+        phase = prefix.split(".", 1)[-1]
+        if suffix == "started":
+            name = _HTTP_PHASE_NAMES.get(phase, f"http.{phase}")
+            self._open[phase] = self._tracer.start_span(name, parent=self._parent)
+        elif suffix in ("complete", "failed"):
+            span = self._open.pop(phase, None)
+            if span is None:
+                return
+            if suffix == "failed":
+                span.status_code = _STATUS_ERROR
+                exception = info.get("exception")
+                if exception is not None:
+                    span.status_message = type(exception).__name__
+            span.end()
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that wraps provider calls in spans.
+
+    Each request becomes an ``http.request`` child of the current span, with
+    connect/TLS/TTFB phases recorded from httpcore's trace events.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        tracer = get_tracer()
+        if not tracer.enabled or not current_span().is_recording:
+            return await self._transport.handle_async_request(request)
+
+        span = tracer.start_span(
+            "http.request",
+            attributes={
+                "http.method": request.method,
+                "server.address": request.url.host,
+                "url.path": request.url.path,
+            },
+        )
+        request.extensions["trace"] = _HttpTraceRecorder(tracer, span)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as exc:
+            span.record_error(exc)
+            span.end()
+            raise
+        span.set_attribute("http.status_code", response.status_code)
+        span.end()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@lru_cache
+def _ssl_context() -> ssl.SSLContext:
+    """One client SSL context per process; building one loads the CA bundle."""
+    return httpx.create_ssl_context()
+
+
+def _env_proxy_mounts(
+    limits: httpx.Limits,
+) -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Proxy mounts from HTTP(S)_PROXY/ALL_PROXY/NO_PROXY, as httpx builds them.
+
+    httpx only reads proxy env vars when no custom transport is passed, so
+    a client with ``TracingTransport`` has to mount them explicitly. A None
+    mount sends matching hosts through the client's default transport.
+    """
+    proxies = urllib.request.getproxies()
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            url = url if "://" in url else f"http://{url}"
+            mounts[f"{scheme}://"] = TracingTransport(
+                httpx.AsyncHTTPTransport(
+                    verify=_ssl_context(), limits=limits, proxy=url
+                )
+            )
+    for host in proxies.get("no", "").split(","):
+        host = host.strip()
+        if not host:
+            continue
+        if host == "*":
+            return {}
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            ipaddress.ip_network(host, strict=False)
+        except ValueError:
+            is_ip = False
+        else:
+            is_ip = True
+        if is_ip or host.lower() == "localhost":
+            mounts[f"all://{host}"] = None
+        else:
+            mounts[f"all://*{host.lstrip('.')}"] = None
+    return mounts
+
+
+def http_client_options(limits: httpx.Limits = _DEFAULT_HTTP_LIMITS) -> dict[str, Any]:
+    """Extra ``httpx.AsyncClient`` arguments for provider clients.
+
+    Clients share one SSL context: the Deepgram providers open a client per
+    call, and building a context each time blocks the event loop for tens
+    of milliseconds.
+
+    Without tracing, httpx keeps its own transport (and with it proxy env
+    vars and connection limits). With tracing enabled the client gets a
+    ``TracingTransport`` built with ``limits`` plus mounts for any proxies
+    configured in the environment.
+
+    Args:
+        limits: Connection pool limits of the client being configured
+    """
+    if not get_tracer().enabled:
+        return {"verify": _ssl_context()}
+    return {
+        "transport": TracingTransport(
+            httpx.AsyncHTTPTransport(verify=_ssl_context(), limits=limits)
+        ),
+        "mounts": _env_proxy_mounts(limits),
+    }
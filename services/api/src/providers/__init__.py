@@ -10,6 +10,10 @@ from src.providers.stt_deepgram import (
     STTError,
 )
 from src.providers.llm_groq import GroqLLMProvider, LLMError
+from src.providers.llm_router import LLMBackend, LLMRouter
+from src.providers.protocols import STTProvider, TTSProvider
+from src.providers.stt_local import VoskSTTProvider
+from src.providers.tts_local import EspeakTTSProvider
 from src.providers.tts_deepgram import (
     DeepgramTTSProvider,
     TTSAuthError,
@@ -21,6 +25,8 @@ from src.providers.tts_deepgram import (
 )
 
 __all__ = [
+    "STTProvider",
+    "TTSProvider",
     "DeepgramSTTProvider",
     "EmptyTranscriptError",
     "STTAuthError",
@@ -28,8 +34,11 @@ __all__ = [
     "STTProviderError",
     "STTTimeoutError",
     "STTError",
+    "VoskSTTProvider",
     "GroqLLMProvider",
     "LLMError",
+    "LLMBackend",
+    "LLMRouter",
     "DeepgramTTSProvider",
     "TTSAuthError",
     "TTSBadRequestError",
@@ -37,4 +46,5 @@ __all__ = [
     "TTSTimeoutError",
     "TTSRateLimitError",
     "TTSError",
+    "EspeakTTSProvider",
 ]
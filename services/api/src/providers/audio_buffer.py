@@ -0,0 +1,40 @@
+"""Audio buffers handed to STT providers.
+
+Uploads above ``Settings.audio_spool_memory_bytes`` reach the providers as a
+read-only ``mmap`` over a spooled temp file (see
+``src.services.audio_spool``) rather than ``bytes``. Both types support
+``len()``, slicing and the buffer protocol; these helpers cover the two ways
+providers consume audio without copying the whole recording.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+from typing import AsyncIterator, BinaryIO
+
+AudioBuffer = bytes | mmap.mmap
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def open_buffer(audio: AudioBuffer) -> BinaryIO:
+    """File-like reader over ``audio``, positioned at the start.
+
+    A mapped buffer is returned as-is (``mmap`` has ``read``/``seek``), so
+    parsers such as ``wave`` don't copy the whole recording first.
+    """
+    if isinstance(audio, mmap.mmap):
+        audio.seek(0)
+        return audio  # type: ignore[return-value]
+    return io.BytesIO(audio)
+
+
+async def iter_chunks(
+    audio: AudioBuffer, chunk_size: int = STREAM_CHUNK_BYTES
+) -> AsyncIterator[bytes]:
+    """Yield ``audio`` in chunks for a streamed request body."""
+    # Slicing copies each chunk, so no buffer export outlives the generator
+    # and the map can be closed even if the request is abandoned mid-stream
+    for offset in range(0, len(audio), chunk_size):
+        yield audio[offset : offset + chunk_size]
@@ -0,0 +1,163 @@
+"""Token-budgeted context for LLM prompts.
+
+Interview sessions can run for many questions; without a bound, the asked
+questions list and the summary's turn history grow the prompt (and with it
+cost and latency) linearly. These helpers fit that context into a token
+budget, degrading step by step:
+
+1. keep everything when it fits
+2. keep rubric tips only for the weakest dimensions (and the latest turn's
+   summary tip)
+3. shorten the transcript and question of all but the most recent turns
+4. reduce older turns to their scores and weak-dimension tips
+5. drop the oldest turns (their scores are already in ``average_scores``)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Llama-family tokenizers average roughly four characters of English per token
+_CHARS_PER_TOKEN = 4
+
+_RECENT_TURNS = 2
+_TRANSCRIPT_WORDS = 40
+_QUESTION_WORDS = 25
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token count estimate for budgeting (no tokenizer dependency)."""
+    if not text:
+        return 0
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _truncate_words(text: str, max_words: int) -> str:
+    words = text.split()
+    if len(words) <= max_words:
+        return text
+    return " ".join(words[:max_words]) + " …"
+
+
+def _normalize_label(label: str) -> str:
+    return label.strip().lower().replace(" ", "_")
+
+
+def weakest_dimensions(average_scores: dict[str, float], count: int = 2) -> list[str]:
+    """Labels of the lowest-scoring rubric dimensions, weakest first."""
+    return [
+        label
+        for label, _ in sorted(average_scores.items(), key=lambda item: item[1])[
+            :count
+        ]
+    ]
+
+
+def fit_asked_questions(
+    asked_questions: list[str], budget_tokens: int
+) -> tuple[list[str], int]:
+    """Keep the most recent asked questions that fit the budget.
+
+    Returns the kept questions (in original order) and how many older ones
+    were omitted.
+    """
+    kept: list[str] = []
+    used = 0
+    for question in reversed(asked_questions):
+        cost = estimate_tokens(question) + 1  # "- " bullet and newline
+        if used + cost > budget_tokens and kept:
+            break
+        kept.append(question)
+        used += cost
+    kept.reverse()
+    return kept, len(asked_questions) - len(kept)
+
+
+def _compact_feedback(
+    feedback: Any, weakest: set[str], keep_summary_tip: bool
+) -> Any:
+    if not isinstance(feedback, dict):
+        return feedback
+    dimensions = feedback.get("dimensions")
+    compact: dict[str, Any] = {}
+    if isinstance(dimensions, list):
+        scores: dict[str, Any] = {}
+        tips: dict[str, Any] = {}
+        for dimension in dimensions:
+            if not isinstance(dimension, dict):
+                continue
+            label = dimension.get("label")
+            if not isinstance(label, str):
+                continue
+            scores[label] = dimension.get("score")
+            if _normalize_label(label) in weakest and dimension.get("tip"):
+                tips[label] = dimension["tip"]
+        compact["scores"] = scores
+        if tips:
+            compact["weak_dimension_tips"] = tips
+    if keep_summary_tip and feedback.get("summary_tip"):
+        compact["summary_tip"] = feedback["summary_tip"]
+    return compact
+
+
+def _turn_tokens(turns: list[dict[str, Any]]) -> int:
+    return estimate_tokens(json.dumps(turns))
+
+
+def fit_turn_history(
+    turn_history: list[dict[str, Any]],
+    average_scores: dict[str, float],
+    budget_tokens: int,
+) -> tuple[list[dict[str, Any]], int]:
+    """Fit summary turn history into ``budget_tokens``.
+
+    Returns the (possibly compressed) turns and how many of the oldest turns
+    were dropped entirely.
+    """
+    if _turn_tokens(turn_history) <= budget_tokens:
+        return turn_history, 0
+
+    weakest = set(weakest_dimensions(average_scores))
+    last = len(turn_history) - 1
+    recent_start = max(0, len(turn_history) - _RECENT_TURNS)
+
+    # Step 2: weak-dimension tips only
+    turns = [
+        {
+            **turn,
+            "coaching_feedback": _compact_feedback(
+                turn.get("coaching_feedback"), weakest, keep_summary_tip=i == last
+            ),
+        }
+        for i, turn in enumerate(turn_history)
+    ]
+    if _turn_tokens(turns) <= budget_tokens:
+        return turns, 0
+
+    # Step 3: shorten older turns' text
+    for turn in turns[:recent_start]:
+        turn["transcript"] = _truncate_words(
+            str(turn.get("transcript") or ""), _TRANSCRIPT_WORDS
+        )
+        turn["assistant_text"] = _truncate_words(
+            str(turn.get("assistant_text") or ""), _QUESTION_WORDS
+        )
+    if _turn_tokens(turns) <= budget_tokens:
+        return turns, 0
+
+    # Step 4: older turns keep only their scores and weak-dimension evidence
+    for i in range(recent_start):
+        turns[i] = {
+            "turn_number": turns[i].get("turn_number"),
+            "coaching_feedback": turns[i].get("coaching_feedback"),
+        }
+    if _turn_tokens(turns) <= budget_tokens:
+        return turns, 0
+
+    # Step 5: drop the oldest turns, never the most recent one
+    dropped = 0
+    while len(turns) > 1 and _turn_tokens(turns) > budget_tokens:
+        turns.pop(0)
+        dropped += 1
+    return turns, dropped
@@ -0,0 +1,28 @@
+"""JSON decoding for LLM output, using orjson when it is installed.
+
+orjson is an optional speedup (``pip install orjson``); without it the
+standard library decoder is used. Both raise ``JSONDecodeError`` (orjson's
+error subclasses the standard library one).
+"""
+
+from __future__ import annotations
+
+import json
+from json import JSONDecodeError
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+__all__ = ["JSONDecodeError", "backend", "loads"]
+
+backend = "orjson" if orjson is not None else "json"
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
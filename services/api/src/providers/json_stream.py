@@ -0,0 +1,156 @@
+"""Incremental parser for the follow-up JSON streamed by the LLM.
+
+The follow-up schema puts ``follow_up_question`` first and the coaching
+feedback (the bulk of the output tokens) after it. ``FollowUpStreamParser``
+scans the completion as chunks arrive and reports each field the moment its
+value is complete, so TTS for the question can start while the model is
+still writing coaching tips. The full response is still parsed and validated
+once the stream ends; this parser only provides early previews.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Literal
+
+FOLLOW_UP_QUESTION = "follow_up_question"
+COACHING_DIMENSION = "coaching_dimension"
+
+StreamEventKind = Literal["follow_up_question", "coaching_dimension"]
+
+_DIMENSION_PATH = ("coaching_feedback", "dimensions")
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+@dataclass
+class _Container:
+    """An open JSON object or array, and the path of the value inside it."""
+
+    kind: Literal["object", "array"]
+    start: int
+    path: tuple[str | int, ...]
+    key: str | None = None
+    expect_key: bool = True
+    index: int = 0
+
+    def child_path(self) -> tuple[str | int, ...]:
+        if self.kind == "object":
+            return (*self.path, self.key if self.key is not None else "")
+        return (*self.path, self.index)
+
+
+class FollowUpStreamParser:
+    """Emits ``(kind, value)`` events as follow-up fields complete.
+
+    Events:
+    - ``("follow_up_question", str)`` once the top-level question string is
+      closed (whitespace-stripped; empty questions are not reported)
+    - ``("coaching_dimension", dict)`` for each complete object in
+      ``coaching_feedback.dimensions``
+
+    Malformed input never raises; the parser just stops reporting.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._stack: list[_Container] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._string_is_key = False
+        self._failed = False
+
+    def feed(self, chunk: str) -> list[tuple[StreamEventKind, Any]]:
+        """Consume the next chunk of completion text and return new events."""
+        if self._failed or not chunk:
+            return []
+        self._text += chunk
+        events: list[tuple[StreamEventKind, Any]] = []
+        try:
+            self._scan(events)
+        except (ValueError, IndexError):
+            self._failed = True
+        return events
+
+    def _scan(self, events: list[tuple[StreamEventKind, Any]]) -> None:
+        text = self._text
+        end = len(text)
+        i = self._pos
+        while i < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                # Skip string contents in one step; only quotes and escapes matter
+                match = _STRING_SPECIAL.search(text, i)
+                if match is None:
+                    i = end
+                    break
+                i = match.start()
+                if text[i] == "\\":
+                    self._escape = True
+                else:
+                    self._in_string = False
+                    self._close_string(text, i, events)
+                i += 1
+                continue
+
+            char = text[i]
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+                top = self._stack[-1] if self._stack else None
+                self._string_is_key = (
+                    top is not None and top.kind == "object" and top.expect_key
+                )
+            elif char in "{[":
+                path = self._stack[-1].child_path() if self._stack else ()
+                kind: Literal["object", "array"] = "object" if char == "{" else "array"
+                self._stack.append(_Container(kind=kind, start=i, path=path))
+            elif char in "}]":
+                container = self._stack.pop()
+                self._value_complete(
+                    container.path, text, container.start, i + 1, events
+                )
+            elif char == ":" and self._stack:
+                self._stack[-1].expect_key = False
+            elif char == "," and self._stack:
+                top = self._stack[-1]
+                if top.kind == "object":
+                    top.expect_key = True
+                    top.key = None
+                else:
+                    top.index += 1
+            i += 1
+        self._pos = i
+
+    def _close_string(
+        self, text: str, end: int, events: list[tuple[StreamEventKind, Any]]
+    ) -> None:
+        literal = text[self._string_start : end + 1]
+        if self._string_is_key:
+            self._stack[-1].key = json.loads(literal)
+            return
+        path = self._stack[-1].child_path() if self._stack else ()
+        self._value_complete(path, text, self._string_start, end + 1, events)
+
+    def _value_complete(
+        self,
+        path: tuple[str | int, ...],
+        text: str,
+        start: int,
+        end: int,
+        events: list[tuple[StreamEventKind, Any]],
+    ) -> None:
+        if path == (FOLLOW_UP_QUESTION,):
+            value = json.loads(text[start:end])
+            if isinstance(value, str) and value.strip():
+                events.append((FOLLOW_UP_QUESTION, value.strip()))
+        elif len(path) == 3 and path[:2] == _DIMENSION_PATH:
+            value = json.loads(text[start:end])
+            if isinstance(value, dict):
+                events.append((COACHING_DIMENSION, value))
@@ -0,0 +1,76 @@
+"""Bounded in-memory cache of LLM completions.
+
+Replayed transcripts (the ``/turn`` retry flow) and load-test traffic send
+byte-identical chat requests. Keying on a hash of the full request (model,
+messages and sampling parameters) lets those repeats skip the upstream call.
+Entries expire after a TTL and the least recently used entry is evicted when
+the cache is full.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+from src.observability.metrics import (
+    llm_response_cache_evictions_total,
+    llm_response_cache_total,
+)
+
+
+class LLMResponseCache:
+    """Thread-safe TTL + LRU cache of raw completion content."""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 600.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached completions before LRU eviction
+            ttl_seconds: Time-to-live for each cached completion
+        """
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = Lock()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(request: dict[str, Any]) -> str:
+        """Hash a chat completion request (model, messages and parameters)."""
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, prompt: str = "unknown") -> str | None:
+        """Return cached content for ``key``, or None on a miss or expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] > self._ttl_seconds:
+                del self._entries[key]
+                llm_response_cache_evictions_total().inc(reason="ttl")
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        llm_response_cache_total().inc(
+            prompt=prompt, result="hit" if entry is not None else "miss"
+        )
+        return entry[0] if entry is not None else None
+
+    def put(self, key: str, content: str) -> None:
+        """Cache content, evicting the least recently used entry when full."""
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (content, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            llm_response_cache_evictions_total().inc(evicted, reason="lru")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
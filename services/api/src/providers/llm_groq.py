@@ -4,14 +4,34 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import Annotated, Any, Callable
+
+from pydantic import StrictBool, StringConstraints, TypeAdapter, ValidationError
+from typing_extensions import NotRequired, TypedDict
 
 from groq import AsyncGroq
+from groq import DEFAULT_CONNECTION_LIMITS, DefaultAsyncHttpxClient
 from groq import APIError
 from groq import APITimeoutError
 from groq import RateLimitError
 
 from src.api.models.turn_models import CoachingFeedback
+from src.domain.session_state import RubricScores
+from src.providers import json_codec
+from src.providers.json_stream import (
+    COACHING_DIMENSION,
+    FOLLOW_UP_QUESTION,
+    FollowUpStreamParser,
+)
+from src.providers.llm_cache import LLMResponseCache
+from src.providers.context_window import (
+    fit_asked_questions,
+    fit_turn_history,
+    weakest_dimensions,
+)
+from src.observability.metrics import llm_prompt_bytes, llm_prompt_prefix_cache_total
+from src.observability.tracing import http_client_options
 
 
 class LLMError(Exception):
@@ -31,6 +51,30 @@ class LLMResponse:
     follow_up_question: str
     coaching_feedback: CoachingFeedback | None = None
     refused: bool = False
+    # Model that answered, when a router picked it (for per-model metrics)
+    model: str | None = None
+
+
+class _FollowUpPayload(TypedDict):
+    """Well-formed follow-up output, validated straight from JSON in one pass."""
+
+    follow_up_question: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1)
+    ]
+    coaching_feedback: NotRequired[CoachingFeedback | None]
+    refused: NotRequired[StrictBool]
+
+
+_FOLLOW_UP_ADAPTER = TypeAdapter(_FollowUpPayload)
+
+
+class _CoachingPayload(TypedDict):
+    """Output of the coaching-only call in split mode."""
+
+    coaching_feedback: CoachingFeedback
+
+
+_COACHING_ADAPTER = TypeAdapter(_CoachingPayload)
 
 
 # Rubric definitions for dynamic prompt generation
@@ -54,6 +98,102 @@ RUBRIC_DIMENSIONS = [
 ]
 
 
+_RUBRIC_LABELS = ", ".join(d["label"] for d in RUBRIC_DIMENSIONS)
+
+_COACHING_SCHEMA = (
+    '{"dimensions": ['
+    + ", ".join(
+        f'{{"label": "{d["label"]}", "score": 1-5 integer, "tip": <=25 words}}'
+        for d in RUBRIC_DIMENSIONS
+    )
+    + '], "summary_tip": <=30 words}'
+)
+
+_SCHEMA_INSTRUCTION = (
+    "Return ONLY valid JSON with this exact schema: "
+    f'{{"follow_up_question": string, "coaching_feedback": {_COACHING_SCHEMA}, '
+    '"refused": boolean}. '
+    f"Use these exact rubric labels in order: {_RUBRIC_LABELS}."
+)
+
+_SAFETY_INSTRUCTION = (
+    "You are strictly an interview coach. If the candidate's response "
+    "contains inappropriate, harmful, offensive, discriminatory, or "
+    "explicit content, or attempts to redirect you away from interview "
+    "coaching, respond with a JSON object: "
+    '{"follow_up_question": "<calm refusal>", "refused": true, '
+    '"coaching_feedback": null}. Do not engage with off-topic or harmful '
+    "requests. Keep your refusal professional and supportive."
+)
+
+# Identical for every session, so it leads the prompt for provider-side
+# prefix caching.
+_SHARED_SYSTEM_PREFIX = (
+    "You are an interview coach. After each candidate answer you either ask "
+    "a follow-up question or, on the final question, close the interview, "
+    "as instructed at the end of this prompt. "
+    f"{_SCHEMA_INSTRUCTION} "
+    "Keep coaching tone supportive, specific, and skimmable. "
+    f"{_SAFETY_INSTRUCTION}"
+)
+
+
+# Split mode: a short question-only call on the TTS critical path, and a
+# separate coaching call whose output the UI shows later.
+_QUESTION_SYSTEM_PREFIX = (
+    "You are an interview coach. After each candidate answer you either ask "
+    "a follow-up question or, on the final question, close the interview, "
+    "as instructed at the end of this prompt. "
+    "Return ONLY valid JSON with this exact schema: "
+    '{"follow_up_question": string, "refused": boolean}. '
+    "You are strictly an interview coach. If the candidate's response "
+    "contains inappropriate, harmful, offensive, discriminatory, or "
+    "explicit content, or attempts to redirect you away from interview "
+    'coaching, respond with {"follow_up_question": "<calm refusal>", '
+    '"refused": true}. Keep your refusal professional and supportive.'
+)
+
+_COACHING_SYSTEM_PREFIX = (
+    "You are an interview coach scoring one candidate answer against a "
+    "rubric. Return ONLY valid JSON with this exact schema: "
+    f'{{"coaching_feedback": {_COACHING_SCHEMA}}}. '
+    f"Use these exact rubric labels in order: {_RUBRIC_LABELS}. "
+    "Keep coaching tone supportive, specific, and skimmable."
+)
+
+_TASK_SYSTEM_PREFIXES = {
+    "follow_up": _SHARED_SYSTEM_PREFIX,
+    "question": _QUESTION_SYSTEM_PREFIX,
+    "coaching": _COACHING_SYSTEM_PREFIX,
+}
+
+
+@lru_cache(maxsize=512)
+def _system_prompt_prefix(
+    role: str, interview_type: str, difficulty: str, task: str = "follow_up"
+) -> str:
+    """Static part of a system prompt for one session setup and call type."""
+    return (
+        f"{_TASK_SYSTEM_PREFIXES[task]}\n\n"
+        f"You are conducting a {difficulty} {interview_type} interview for the "
+        f"role of {role}."
+    )
+
+
+def _llm_error(exc: Exception) -> LLMError:
+    """Map a Groq SDK error to a stage-aware LLMError."""
+    if isinstance(exc, APITimeoutError):
+        return LLMError(message=str(exc), code="llm_timeout", retryable=True)
+    if isinstance(exc, RateLimitError):
+        return LLMError(message=str(exc), code="llm_rate_limit", retryable=True)
+    # Check if it's be content filter error
+    error_msg = str(exc).lower()
+    if "content" in error_msg and ("filter" in error_msg or "policy" in error_msg):
+        return LLMError(message=str(exc), code="llm_content_filter", retryable=False)
+    # Generic provider error
+    return LLMError(message=str(exc), code="llm_provider_error", retryable=True)
+
+
 class GroqLLMProvider:
     """Groq-based LLM provider for interview coaching.
 
@@ -67,6 +207,10 @@ class GroqLLMProvider:
         model: str = "llama-3.3-70b-versatile",
         timeout_seconds: int = 30,
         max_tokens: int = 400,
+        base_url: str | None = None,
+        context_budget_tokens: int = 1500,
+        response_cache: LLMResponseCache | None = None,
+        question_max_tokens: int = 120,
     ):
         """Initialize Groq LLM provider.
 
@@ -75,10 +219,36 @@ class GroqLLMProvider:
             model: Groq model to use (default: llama-3.3-70b-versatile)
             timeout_seconds: Timeout for LLM requests (default: 30s)
             max_tokens: Maximum tokens in LLM response (default: 400)
+            base_url: Groq API origin override (default: Groq's public API)
+            context_budget_tokens: Token budget for variable prompt context
+                (asked questions, summary turn history) (default: 1500)
+            response_cache: Optional cache for follow-up and session summary
+                completions; identical requests skip the Groq call
+            question_max_tokens: Maximum tokens for the question-only call
+                used in split mode (default: 120)
         """
-        self._client = AsyncGroq(api_key=api_key, timeout=timeout_seconds)
+        self._client = AsyncGroq(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout_seconds,
+            http_client=DefaultAsyncHttpxClient(
+                **http_client_options(DEFAULT_CONNECTION_LIMITS)
+            ),
+        )
         self._model = model
         self._max_tokens = max_tokens
+        self._context_budget_tokens = context_budget_tokens
+        self._response_cache = response_cache
+        self._question_max_tokens = question_max_tokens
+
+    def _cache_lookup(
+        self, request: dict[str, Any], prompt: str
+    ) -> tuple[str | None, str | None]:
+        """Return ``(cache_key, cached_content)``; both None without a cache."""
+        if self._response_cache is None:
+            return None, None
+        key = LLMResponseCache.key(request)
+        return key, self._response_cache.get(key, prompt=prompt)
 
     async def generate_follow_up(
         self,
@@ -89,9 +259,17 @@ class GroqLLMProvider:
         asked_questions: list[str],
         question_number: int,
         total_questions: int,
+        on_follow_up_question: Callable[[str], None] | None = None,
+        on_coaching_dimension: Callable[[dict[str, Any]], None] | None = None,
     ) -> LLMResponse:
         """Generate the next interview question based on context.
 
+        With either callback set, the completion is streamed and parsed
+        incrementally: ``on_follow_up_question`` fires as soon as the question
+        string is complete (before the coaching feedback is written) and
+        ``on_coaching_dimension`` once per complete rubric dimension. The
+        return value is the same fully validated response either way.
+
         Args:
             transcript: User's answer transcript from STT
             role: Interview role (e.g., "Software Engineer")
@@ -100,6 +278,8 @@ class GroqLLMProvider:
             asked_questions: List of previously asked questions (to avoid repeats)
             question_number: Current question number (1-indexed)
             total_questions: Total configured questions for the session
+            on_follow_up_question: Streaming callback for the early question
+            on_coaching_dimension: Streaming callback for each rubric dimension
 
         Returns:
             Structured response containing next question and optional coaching feedback
@@ -107,7 +287,8 @@ class GroqLLMProvider:
         Raises:
             LLMError: If LLM request fails with timeout or API error
         """
-        system_prompt = self._build_system_prompt(
+        system_prompt = self._turn_system_prompt(
+            "follow_up",
             role,
             interview_type,
             difficulty,
@@ -115,19 +296,33 @@ class GroqLLMProvider:
             question_number,
             total_questions,
         )
+        streaming = (
+            on_follow_up_question is not None or on_coaching_dimension is not None
+        )
+        request = {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": transcript},
+            ],
+            "max_tokens": self._max_tokens,
+            "temperature": 0.7,
+        }
+        if not streaming:
+            # Groq's JSON mode can't be streamed; the prompt still demands JSON
+            request["response_format"] = {"type": "json_object"}
+        cache_key, cached_content = self._cache_lookup(request, prompt="follow_up")
+        if cached_content is not None:
+            return self._parse_llm_response(cached_content)
 
         try:
-            response = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": transcript},
-                ],
-                max_tokens=self._max_tokens,
-                temperature=0.7,
-                response_format={"type": "json_object"},
-            )
-            raw_content = response.choices[0].message.content
+            if streaming:
+                raw_content = await self._stream_follow_up(
+                    request, on_follow_up_question, on_coaching_dimension
+                )
+            else:
+                response = await self._client.chat.completions.create(**request)
+                raw_content = response.choices[0].message.content
             if raw_content is None:
                 raise LLMError(
                     message="LLM returned null content",
@@ -143,43 +338,178 @@ class GroqLLMProvider:
                     retryable=False,
                 )
 
-            return self._parse_llm_response(content)
+            result = self._parse_llm_response(content)
+            # Refusals depend on the safety prompt, not just the answer; never replay them
+            if cache_key is not None and not result.refused:
+                self._response_cache.put(cache_key, content)
+            return result
 
-        except APITimeoutError as e:
-            raise LLMError(
-                message=str(e),
-                code="llm_timeout",
-                retryable=True,
-            ) from e
-        except RateLimitError as e:
-            raise LLMError(
-                message=str(e),
-                code="llm_rate_limit",
-                retryable=True,
-            ) from e
         except APIError as e:
-            # Check if it's be content filter error
-            error_msg = str(e).lower()
-            if "content" in error_msg and (
-                "filter" in error_msg or "policy" in error_msg
-            ):
-                raise LLMError(
-                    message=str(e),
-                    code="llm_content_filter",
-                    retryable=False,
-                ) from e
-            # Generic provider error
+            raise _llm_error(e) from e
+
+    async def generate_question(
+        self,
+        transcript: str,
+        role: str,
+        interview_type: str,
+        difficulty: str,
+        asked_questions: list[str],
+        question_number: int,
+        total_questions: int,
+    ) -> LLMResponse:
+        """Generate only the next question, without coaching feedback.
+
+        Used in split mode together with ``generate_coaching_feedback``. The
+        output is a single short JSON object capped at ``question_max_tokens``,
+        so the question can go to TTS well before coaching is ready.
+
+        Raises:
+            LLMError: If LLM request fails with timeout or API error
+        """
+        system_prompt = self._turn_system_prompt(
+            "question",
+            role,
+            interview_type,
+            difficulty,
+            asked_questions,
+            question_number,
+            total_questions,
+        )
+        request = {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": transcript},
+            ],
+            "max_tokens": self._question_max_tokens,
+            "temperature": 0.7,
+            "response_format": {"type": "json_object"},
+        }
+        cache_key, cached_content = self._cache_lookup(request, prompt="question")
+        if cached_content is not None:
+            return self._parse_llm_response(cached_content)
+
+        try:
+            response = await self._client.chat.completions.create(**request)
+        except APIError as e:
+            raise _llm_error(e) from e
+
+        content = (response.choices[0].message.content or "").strip()
+        if not content:
             raise LLMError(
-                message=str(e),
-                code="llm_provider_error",
-                retryable=True,
-            ) from e
+                message="LLM returned empty response",
+                code="empty_response",
+                retryable=False,
+            )
+        result = self._parse_llm_response(content)
+        if cache_key is not None and not result.refused:
+            self._response_cache.put(cache_key, content)
+        return result
+
+    async def generate_coaching_feedback(
+        self,
+        transcript: str,
+        role: str,
+        interview_type: str,
+        difficulty: str,
+        question: str | None = None,
+        raise_errors: bool = False,
+    ) -> CoachingFeedback | None:
+        """Score one answer against the rubric, for split mode.
+
+        Returns None if the call fails or the output is invalid; coaching is
+        optional and must never fail the turn. With ``raise_errors``, API
+        failures raise ``LLMError`` instead (used by ``LLMRouter``).
+        """
+        prefix = _system_prompt_prefix(role, interview_type, difficulty, "coaching")
+        suffix = (
+            f"\n\nThe question the candidate answered: {question}"
+            if question
+            else ""
+        )
+        llm_prompt_bytes().observe(
+            len(prefix.encode("utf-8")), prompt="coaching", section="prefix"
+        )
+        request = {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": prefix + suffix},
+                {"role": "user", "content": transcript},
+            ],
+            "max_tokens": self._max_tokens,
+            "temperature": 0.5,
+            "response_format": {"type": "json_object"},
+        }
+        cache_key, raw_content = self._cache_lookup(request, prompt="coaching")
+
+        try:
+            if raw_content is None:
+                response = await self._client.chat.completions.create(**request)
+                raw_content = response.choices[0].message.content
+                if raw_content is None:
+                    return None
+            else:
+                cache_key = None  # already cached
+
+            payload = _COACHING_ADAPTER.validate_json(raw_content.strip())
+            if cache_key is not None:
+                self._response_cache.put(cache_key, raw_content)
+            return payload["coaching_feedback"]
+
+        except APIError as e:
+            if raise_errors:
+                raise _llm_error(e) from e
+            return None
+        except Exception:
+            return None
+
+    async def _stream_follow_up(
+        self,
+        request: dict[str, Any],
+        on_follow_up_question: Callable[[str], None] | None,
+        on_coaching_dimension: Callable[[dict[str, Any]], None] | None,
+    ) -> str | None:
+        """Stream a completion, reporting follow-up fields as they complete."""
+        parser = FollowUpStreamParser()
+        parts: list[str] = []
+        stream = await self._client.chat.completions.create(**request, stream=True)
+        async with stream:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                for kind, value in parser.feed(delta):
+                    if kind == FOLLOW_UP_QUESTION and on_follow_up_question:
+                        on_follow_up_question(value)
+                    elif kind == COACHING_DIMENSION and on_coaching_dimension:
+                        on_coaching_dimension(value)
+        return "".join(parts) if parts else None
 
     def _parse_llm_response(self, content: str) -> LLMResponse:
-        """Parse LLM output JSON with graceful fallback to plain text."""
+        """Parse LLM output JSON with graceful fallback to plain text.
+
+        Well-formed output is parsed and validated by pydantic-core in a single
+        pass; anything else (invalid JSON, stringly-typed ``refused``, invalid
+        coaching feedback) goes through the lenient field-by-field parser.
+        """
         try:
-            parsed = json.loads(content)
-        except json.JSONDecodeError:
+            payload = _FOLLOW_UP_ADAPTER.validate_json(content)
+        except ValidationError:
+            return self._parse_llm_response_lenient(content)
+        return LLMResponse(
+            follow_up_question=payload["follow_up_question"],
+            coaching_feedback=payload.get("coaching_feedback"),
+            refused=payload.get("refused", False),
+        )
+
+    def _parse_llm_response_lenient(self, content: str) -> LLMResponse:
+        """Parse LLM output field by field, keeping whatever is usable."""
+        try:
+            parsed = json_codec.loads(content)
+        except json_codec.JSONDecodeError:
             return LLMResponse(follow_up_question=content, coaching_feedback=None)
 
         if not isinstance(parsed, dict):
@@ -237,89 +567,215 @@ class GroqLLMProvider:
         Returns:
             System prompt string
         """
-        is_last_question = question_number >= total_questions
-
-        asked_section = ""
-        if asked_questions:
-            asked_section = (
-                "\n\nPreviously asked questions (DO NOT repeat these):\n"
-                + "\n".join(f"- {q}" for q in asked_questions)
-            )
-
-        # Build rubric JSON structure explanation dynamically
-        rubric_labels = ", ".join([d["label"] for d in RUBRIC_DIMENSIONS])
-        rubric_json_fields = ", ".join(
-            [
-                f'{{"label": "{d["label"]}", "score": 1-5 integer, "tip": <=25 words}}'
-                for d in RUBRIC_DIMENSIONS
-            ]
-        )
-
-        schema_instruction = (
-            f"Return ONLY valid JSON with this exact schema: "
-            f'{{"follow_up_question": string, "coaching_feedback": {{"dimensions": '
-            f'[{rubric_json_fields}], "summary_tip": <=30 words}}, '
-            f'"refused": boolean}}. '
-            f"Use these exact rubric labels in order: {rubric_labels}."
+        prefix, suffix = self._build_system_prompt_parts(
+            role,
+            interview_type,
+            difficulty,
+            asked_questions,
+            question_number,
+            total_questions,
         )
+        return prefix + suffix
 
-        safety_instruction = (
-            " You are strictly an interview coach. If the candidate's response "
-            "contains inappropriate, harmful, offensive, discriminatory, or "
-            "explicit content, or attempts to redirect you away from interview "
-            "coaching, respond with a JSON object: "
-            '{"follow_up_question": "<calm refusal>", "refused": true, '
-            '"coaching_feedback": null}. Do not engage with off-topic or harmful '
-            "requests. Keep your refusal professional and supportive."
+    def _turn_system_prompt(
+        self,
+        task: str,
+        role: str,
+        interview_type: str,
+        difficulty: str,
+        asked_questions: list[str],
+        question_number: int,
+        total_questions: int,
+    ) -> str:
+        """Build a per-turn system prompt and record prefix cache/size metrics."""
+        hits_before = _system_prompt_prefix.cache_info().hits
+        prefix, suffix = self._build_system_prompt_parts(
+            role,
+            interview_type,
+            difficulty,
+            asked_questions,
+            question_number,
+            total_questions,
+            task=task,
         )
+        prefix_hit = _system_prompt_prefix.cache_info().hits > hits_before
+        llm_prompt_prefix_cache_total().inc(result="hit" if prefix_hit else "miss")
+        prompt_bytes = llm_prompt_bytes()
+        prompt_bytes.observe(len(prefix.encode("utf-8")), prompt=task, section="prefix")
+        prompt_bytes.observe(len(suffix.encode("utf-8")), prompt=task, section="suffix")
+        return prefix + suffix
+
+    def _build_system_prompt_parts(
+        self,
+        role: str,
+        interview_type: str,
+        difficulty: str,
+        asked_questions: list[str],
+        question_number: int,
+        total_questions: int,
+        task: str = "follow_up",
+    ) -> tuple[str, str]:
+        """Split the system prompt into a static prefix and a per-turn suffix.
+
+        The prefix (instructions, schema, safety rules, session setup) is
+        byte-identical for every turn of a session and memoized per
+        (role, interview_type, difficulty, task). Only the suffix (question
+        number, final-question switch, asked questions) is built per turn.
+        """
+        prefix = _system_prompt_prefix(role, interview_type, difficulty, task)
 
-        if is_last_question:
-            return (
-                f"You are an interview coach conducting a {difficulty} "
-                f"{interview_type} interview for the role of {role}. "
+        if question_number >= total_questions:
+            turn_instruction = (
                 f"This is the FINAL question (question {question_number} of "
                 f"{total_questions}). The candidate just answered. "
                 f"Provide a brief, positive closing acknowledgment of their answer. "
                 f"Do NOT ask another question. Keep it to 1-2 sentences. "
                 f"For the 'follow_up_question' field, provide a purely declarative "
                 f"closing statement (e.g., 'Thank you for that answer. That concludes "
-                f"our interview.'). do NOT phrase it as a question. "
-                f"{schema_instruction}"
-                f"{safety_instruction}"
-                f"{asked_section}"
+                f"our interview.'). do NOT phrase it as a question."
             )
         else:
-            return (
-                f"You are an interview coach conducting a {difficulty} "
-                f"{interview_type} interview for the role of {role}. "
+            turn_instruction = (
                 f"This is question {question_number} of {total_questions}. "
                 f"Based on the candidate's answer, generate a relevant "
                 f"follow-up question. The question should be natural, "
-                f"conversational, and appropriate for the difficulty level. "
-                f"{schema_instruction} "
-                f"Keep coaching tone supportive, specific, and skimmable."
-                f"{safety_instruction}"
-                f"{asked_section}"
+                f"conversational, and appropriate for the difficulty level."
             )
 
+        asked_section = ""
+        if asked_questions:
+            recent_questions, omitted = fit_asked_questions(
+                asked_questions, self._context_budget_tokens
+            )
+            omitted_note = (
+                f" ({omitted} earlier questions not shown)" if omitted else ""
+            )
+            asked_section = (
+                f"\n\nPreviously asked questions (DO NOT repeat these){omitted_note}:\n"
+                + "\n".join(f"- {q}" for q in recent_questions)
+            )
+
+        return prefix, f"\n\n{turn_instruction}{asked_section}"
+
     async def generate_session_summary(
         self,
         turn_history: list[dict[str, Any]],
         role: str,
         interview_type: str,
         difficulty: str,
+        average_scores: dict[str, float] | None = None,
+        rolling_summary: dict[str, Any] | None = None,
+        raise_errors: bool = False,
     ) -> dict[str, Any] | None:
         """Generate end-of-session summary JSON from all turn records.
 
-        Returns None if parsing fails or model output is invalid.
+        ``average_scores`` are the session's running rubric averages; they are
+        recomputed from ``turn_history`` when not provided. With a
+        ``rolling_summary`` (see ``update_rolling_summary``), ``turn_history``
+        only needs the turns it doesn't cover yet.
+
+        Returns None if the call fails or model output is invalid. With
+        ``raise_errors``, API failures raise ``LLMError`` instead.
         """
-        average_scores = self._compute_average_scores(turn_history)
+        if average_scores is None:
+            average_scores = self._compute_average_scores(turn_history)
+        fitted_history, omitted_turns = fit_turn_history(
+            turn_history, average_scores, self._context_budget_tokens
+        )
         prompt = self._build_session_summary_prompt(
-            turn_history=turn_history,
+            turn_history=fitted_history,
             role=role,
             interview_type=interview_type,
             difficulty=difficulty,
             average_scores=average_scores,
+            omitted_turns=omitted_turns,
+            rolling_summary=rolling_summary,
+        )
+        llm_prompt_bytes().observe(
+            len(prompt.encode("utf-8")), prompt="session_summary", section="system"
+        )
+        request = {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": prompt},
+                {
+                    "role": "user",
+                    "content": "Generate the session summary JSON now.",
+                },
+            ],
+            "max_tokens": self._max_tokens,
+            "temperature": 0.5,
+            "response_format": {"type": "json_object"},
+        }
+        cache_key, raw_content = self._cache_lookup(request, prompt="session_summary")
+
+        try:
+            if raw_content is None:
+                response = await self._client.chat.completions.create(**request)
+                raw_content = response.choices[0].message.content
+                if raw_content is None:
+                    return None
+            else:
+                cache_key = None  # already cached
+
+            parsed = json_codec.loads(raw_content.strip())
+            if not isinstance(parsed, dict):
+                return None
+
+            parsed["average_scores"] = average_scores
+
+            required_keys = {
+                "overall_assessment",
+                "strengths",
+                "improvements",
+                "average_scores",
+            }
+            if not required_keys.issubset(parsed.keys()):
+                return None
+
+            parsed.setdefault("recommended_actions", [])
+
+            if cache_key is not None:
+                self._response_cache.put(cache_key, raw_content)
+            return parsed
+
+        except APIError as e:
+            if raise_errors:
+                raise _llm_error(e) from e
+            return None
+        except Exception:
+            return None
+
+    async def update_rolling_summary(
+        self,
+        previous_summary: dict[str, Any] | None,
+        turn: dict[str, Any],
+        role: str,
+        interview_type: str,
+        difficulty: str,
+        raise_errors: bool = False,
+    ) -> dict[str, Any] | None:
+        """Merge one turn into the session's compact running summary.
+
+        Returns a dict with ``strengths``, ``improvements`` and ``notes``, or
+        None if the call fails or the output is invalid. With
+        ``raise_errors``, API failures raise ``LLMError`` instead.
+        """
+        prompt = (
+            "You maintain a compact running summary of an in-progress "
+            f"{difficulty} {interview_type} interview for role {role}. "
+            "Merge the latest turn into the running summary. "
+            "Return ONLY valid JSON with this exact schema: "
+            '{"strengths": array of 0-3 strings each <=20 words, '
+            '"improvements": array of 0-3 strings each <=20 words, '
+            '"notes": string <=60 words}. '
+            "Replace or merge overlapping points instead of appending, so the "
+            "summary stays the same size as the interview grows. "
+            f"Running summary JSON: {json.dumps(previous_summary or {})}. "
+            f"Latest turn JSON: {json.dumps(turn)}"
+        )
+        llm_prompt_bytes().observe(
+            len(prompt.encode("utf-8")), prompt="rolling_summary", section="system"
         )
 
         try:
@@ -329,36 +785,35 @@ class GroqLLMProvider:
                     {"role": "system", "content": prompt},
                     {
                         "role": "user",
-                        "content": "Generate the session summary JSON now.",
+                        "content": "Return the updated running summary JSON now.",
                     },
                 ],
                 max_tokens=self._max_tokens,
-                temperature=0.5,
+                temperature=0.3,
                 response_format={"type": "json_object"},
             )
             raw_content = response.choices[0].message.content
             if raw_content is None:
                 return None
 
-            parsed = json.loads(raw_content.strip())
+            parsed = json_codec.loads(raw_content.strip())
             if not isinstance(parsed, dict):
                 return None
-
-            parsed["average_scores"] = average_scores
-
-            required_keys = {
-                "overall_assessment",
-                "strengths",
-                "improvements",
-                "average_scores",
-            }
-            if not required_keys.issubset(parsed.keys()):
+            if not isinstance(parsed.get("strengths"), list) or not isinstance(
+                parsed.get("improvements"), list
+            ):
                 return None
 
-            parsed.setdefault("recommended_actions", [])
-
-            return parsed
+            return {
+                "strengths": parsed["strengths"][:3],
+                "improvements": parsed["improvements"][:3],
+                "notes": str(parsed.get("notes") or ""),
+            }
 
+        except APIError as e:
+            if raise_errors:
+                raise _llm_error(e) from e
+            return None
         except Exception:
             return None
 
@@ -369,13 +824,26 @@ class GroqLLMProvider:
         interview_type: str,
         difficulty: str,
         average_scores: dict[str, float],
+        omitted_turns: int = 0,
+        rolling_summary: dict[str, Any] | None = None,
     ) -> str:
         rubric_labels = ", ".join([d["label"] for d in RUBRIC_DIMENSIONS])
 
         # Identify the 2 weakest rubric dimensions deterministically from average_scores
-        sorted_dims = sorted(average_scores.items(), key=lambda x: x[1])
-        weakest_dims = [d[0] for d in sorted_dims[:2]]
+        weakest_dims = weakest_dimensions(average_scores)
         weakest_text = ", ".join(weakest_dims) if weakest_dims else "all dimensions"
+        history_note = (
+            f"The {omitted_turns} earliest turns are omitted for length; their "
+            "scores are included in average_scores. "
+            if omitted_turns
+            else ""
+        )
+        if rolling_summary is not None:
+            history_note += (
+                "Running summary of turns 1-"
+                f"{rolling_summary.get('covered_turns', 0)} JSON: "
+                f"{json.dumps(rolling_summary)}. Merge it with the remaining turns. "
+            )
 
         return (
             f"You are an interview coach summarizing a completed {difficulty} "
@@ -399,48 +867,14 @@ class GroqLLMProvider:
             "actions are needed, return an empty array for recommended_actions. "
             "Use this deterministic average_scores exactly as provided without "
             f"changes: {json.dumps(average_scores)}. "
-            f"Turn history JSON: {json.dumps(turn_history)}"
+            f"{history_note}Turn history JSON: {json.dumps(turn_history)}"
         )
 
     def _compute_average_scores(
         self,
         turn_history: list[dict[str, Any]],
     ) -> dict[str, float]:
-        score_totals: dict[str, int] = {}
-        score_counts: dict[str, int] = {}
-
+        rubric_scores = RubricScores()
         for turn in turn_history:
-            coaching_feedback = turn.get("coaching_feedback")
-            if not isinstance(coaching_feedback, dict):
-                continue
-
-            dimensions = coaching_feedback.get("dimensions")
-            if not isinstance(dimensions, list):
-                continue
-
-            for dimension in dimensions:
-                if not isinstance(dimension, dict):
-                    continue
-
-                label = dimension.get("label")
-                score = dimension.get("score")
-                if not isinstance(label, str):
-                    continue
-                if not isinstance(score, (int, float)):
-                    continue
-
-                normalized_label = label.strip().lower().replace(" ", "_")
-                score_totals[normalized_label] = score_totals.get(
-                    normalized_label, 0
-                ) + int(score)
-                score_counts[normalized_label] = (
-                    score_counts.get(normalized_label, 0) + 1
-                )
-
-        if not score_totals:
-            return {}
-
-        return {
-            label: round(score_totals[label] / score_counts[label], 2)
-            for label in score_totals
-        }
+            rubric_scores.record(turn.get("coaching_feedback"))
+        return rubric_scores.averages()
@@ -0,0 +1,255 @@
+"""Latency-aware routing across several LLM backends.
+
+``LLMRouter`` exposes the same methods as ``GroqLLMProvider`` and forwards
+each call to one of several backends (e.g. a small fast model and a larger
+one); ``LLMResponse.model`` says which one answered. Every method belongs
+to a route: latency-critical turn calls use the ``follow_up`` route,
+summaries and coaching use the ``summary`` route. Each route lists its
+backends in preference order.
+
+Per route and backend, the router keeps a rolling window of call latencies
+and outcomes, so slow summary calls never push follow-up traffic off a
+backend. A backend is skipped in favour of the next one while it is cooling
+down after a rate limit (shared by every route, since provider rate limits
+are per model), while its p95 latency on the route is over that route's
+latency budget, or while its error rate there is over the limit. If a call
+fails with a retryable error (or, for methods that return None on failure,
+returns None) the next backend is tried. Those methods are called with
+``raise_errors=True`` so rate limits and timeouts reach the router instead
+of being flattened to None. When every backend is unhealthy, the least bad
+one is still tried, so routing never refuses a call on its own.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any, Literal
+
+from src.api.models.turn_models import CoachingFeedback
+from src.observability.metrics import llm_router_requests_total
+from src.providers.llm_groq import LLMError, LLMResponse
+
+LLMRoute = Literal["follow_up", "summary"]
+
+
+class BackendStats:
+    """Rolling latency and outcome window for one backend."""
+
+    def __init__(self, window: int = 50):
+        """Initialize the stats window.
+
+        Args:
+            window: Number of most recent calls considered
+        """
+        self._latencies_ms: deque[float] = deque(maxlen=window)
+        self._failures: deque[bool] = deque(maxlen=window)
+        self._cooldown_until = 0.0
+        self._lock = Lock()
+
+    def record(self, latency_ms: float, failed: bool) -> None:
+        """Record one completed call."""
+        with self._lock:
+            self._latencies_ms.append(latency_ms)
+            self._failures.append(failed)
+
+    def cool_down(self, seconds: float) -> None:
+        """Skip this backend (when alternatives exist) for ``seconds``."""
+        with self._lock:
+            self._cooldown_until = max(
+                self._cooldown_until, time.monotonic() + seconds
+            )
+
+    @property
+    def samples(self) -> int:
+        return len(self._failures)
+
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self._cooldown_until
+
+    def p95_ms(self) -> float | None:
+        """95th percentile latency over the window, or None without samples."""
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+        if not latencies:
+            return None
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+    def error_rate(self) -> float:
+        """Share of failed calls over the window."""
+        with self._lock:
+            failures = list(self._failures)
+        return sum(failures) / len(failures) if failures else 0.0
+
+
+@dataclass
+class LLMBackend:
+    """A named LLM provider with ``GroqLLMProvider``'s methods."""
+
+    name: str
+    provider: Any
+    # Model name reported in metrics (default: the backend name)
+    model: str | None = None
+
+
+class LLMRouter:
+    """Routes LLM calls to the healthiest backend for each route."""
+
+    def __init__(
+        self,
+        backends: list[LLMBackend],
+        routes: dict[LLMRoute, list[str]],
+        latency_budget_ms: float = 2500.0,
+        route_latency_budgets_ms: dict[LLMRoute, float] | None = None,
+        max_error_rate: float = 0.5,
+        cooldown_seconds: float = 30.0,
+        window: int = 50,
+        min_samples: int = 5,
+    ):
+        """Initialize the router.
+
+        Args:
+            backends: Available backends, by unique name
+            routes: Backend names per route, in preference order
+            latency_budget_ms: p95 latency above which a backend is slow
+            route_latency_budgets_ms: Per-route overrides of latency_budget_ms
+            max_error_rate: Error rate above which a backend is unhealthy
+            cooldown_seconds: How long a rate-limited backend is skipped
+            window: Number of recent calls tracked per route and backend
+            min_samples: Calls needed before p95 and error rate are trusted
+        """
+        self._backends = {backend.name: backend for backend in backends}
+        for route, names in routes.items():
+            unknown = [name for name in names if name not in self._backends]
+            if not names or unknown:
+                raise ValueError(f"Invalid backends for route {route!r}: {names}")
+        self._routes = routes
+        self._stats = {
+            (route, name): BackendStats(window)
+            for route, names in routes.items()
+            for name in names
+        }
+        self._latency_budgets_ms = {route: latency_budget_ms for route in routes}
+        self._latency_budgets_ms.update(route_latency_budgets_ms or {})
+        self._max_error_rate = max_error_rate
+        self._cooldown_seconds = cooldown_seconds
+        self._min_samples = min_samples
+
+    def stats(self, name: str, route: LLMRoute = "follow_up") -> BackendStats:
+        """Live stats for the backend called ``name`` on ``route``."""
+        return self._stats[(route, name)]
+
+    def _cool_down(self, name: str) -> None:
+        # Rate limits are per model, so every route skips the backend
+        for (_, backend_name), stats in self._stats.items():
+            if backend_name == name:
+                stats.cool_down(self._cooldown_seconds)
+
+    def _healthy(self, route: LLMRoute, stats: BackendStats) -> bool:
+        if stats.cooling_down():
+            return False
+        if stats.samples < self._min_samples:
+            return True
+        p95 = stats.p95_ms()
+        return (
+            stats.error_rate() <= self._max_error_rate
+            and (p95 is None or p95 <= self._latency_budgets_ms[route])
+        )
+
+    def candidates(self, route: LLMRoute) -> list[LLMBackend]:
+        """Backends to try for ``route``, best first.
+
+        Healthy backends keep the route's preference order; unhealthy ones
+        follow, least bad first.
+        """
+        names = self._routes[route]
+        stats = {name: self._stats[(route, name)] for name in names}
+        healthy = [name for name in names if self._healthy(route, stats[name])]
+        unhealthy = sorted(
+            (name for name in names if name not in healthy),
+            key=lambda name: (
+                stats[name].cooling_down(),
+                stats[name].error_rate(),
+                stats[name].p95_ms() or 0.0,
+            ),
+        )
+        return [self._backends[name] for name in healthy + unhealthy]
+
+    async def _call(self, route: LLMRoute, method: str, **kwargs: Any) -> Any:
+        """Call ``method`` on the best backend, falling back on failure.
+
+        Retryable ``LLMError``s and None results move on to the next backend;
+        the last error (or None) is returned once every backend has failed.
+        """
+        last_error: LLMError | None = None
+        requests_total = llm_router_requests_total()
+        for backend in self.candidates(route):
+            stats = self._stats[(route, backend.name)]
+            start = time.perf_counter()
+            try:
+                result = await getattr(backend.provider, method)(**kwargs)
+            except LLMError as exc:
+                stats.record((time.perf_counter() - start) * 1000, exc.retryable)
+                if not exc.retryable:
+                    # Input-dependent (e.g. content filter); a fallback won't help
+                    requests_total.inc(
+                        route=route, backend=backend.name, outcome="error"
+                    )
+                    raise
+                if exc.code == "llm_rate_limit":
+                    self._cool_down(backend.name)
+                last_error = exc
+                result = None
+            else:
+                stats.record((time.perf_counter() - start) * 1000, result is None)
+            outcome = "fallback" if result is None else "ok"
+            requests_total.inc(route=route, backend=backend.name, outcome=outcome)
+            if isinstance(result, LLMResponse):
+                return replace(result, model=backend.model or backend.name)
+            if result is not None:
+                return result
+        if last_error is not None:
+            raise last_error
+        return None
+
+    async def _call_optional(self, route: LLMRoute, method: str, **kwargs: Any) -> Any:
+        """``_call`` for methods that return None instead of raising.
+
+        Backends are asked to raise so failures are classified (and rate
+        limits start the cooldown); callers still get None on failure.
+        """
+        try:
+            return await self._call(route, method, raise_errors=True, **kwargs)
+        except LLMError:
+            return None
+
+    async def generate_follow_up(self, **kwargs: Any) -> LLMResponse:
+        """Route ``GroqLLMProvider.generate_follow_up``."""
+        return await self._call("follow_up", "generate_follow_up", **kwargs)
+
+    async def generate_question(self, **kwargs: Any) -> LLMResponse:
+        """Route ``GroqLLMProvider.generate_question``."""
+        return await self._call("follow_up", "generate_question", **kwargs)
+
+    async def generate_coaching_feedback(
+        self, **kwargs: Any
+    ) -> CoachingFeedback | None:
+        """Route ``GroqLLMProvider.generate_coaching_feedback``."""
+        return await self._call_optional(
+            "summary", "generate_coaching_feedback", **kwargs
+        )
+
+    async def generate_session_summary(self, **kwargs: Any) -> dict[str, Any] | None:
+        """Route ``GroqLLMProvider.generate_session_summary``."""
+        return await self._call_optional(
+            "summary", "generate_session_summary", **kwargs
+        )
+
+    async def update_rolling_summary(self, **kwargs: Any) -> dict[str, Any] | None:
+        """Route ``GroqLLMProvider.update_rolling_summary``."""
+        return await self._call_optional(
+            "summary", "update_rolling_summary", **kwargs
+        )
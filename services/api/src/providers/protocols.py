@@ -0,0 +1,40 @@
+"""Provider interfaces for the speech stages of the turn pipeline.
+
+The orchestrator only depends on these protocols. ``DeepgramSTTProvider`` and
+``DeepgramTTSProvider`` call Deepgram's hosted APIs; ``VoskSTTProvider`` and
+``EspeakTTSProvider`` run on the local CPU for on-prem deployments and
+network-free benchmarking. ``Settings.stt_backend`` / ``tts_backend`` select
+the implementation.
+"""
+
+from typing import Protocol
+
+from src.providers.audio_buffer import AudioBuffer
+
+
+class STTProvider(Protocol):
+    """Transcribes one recorded answer."""
+
+    async def transcribe_audio(self, audio_bytes: AudioBuffer, mime_type: str) -> str:
+        """Return the transcript of ``audio_bytes``.
+
+        ``audio_bytes`` may be a memory-mapped spool file; read it in chunks
+        rather than copying it whole.
+
+        Raises:
+            STTError: Stage-aware error (``EmptyTranscriptError`` when nothing
+                was recognized)
+        """
+        ...
+
+
+class TTSProvider(Protocol):
+    """Synthesizes the assistant's reply."""
+
+    async def synthesize(self, text: str) -> bytes:
+        """Return encoded audio (MP3 or WAV) for ``text``.
+
+        Raises:
+            TTSError: Stage-aware error
+        """
+        ...
@@ -2,6 +2,12 @@
 
 import httpx
 
+from src.observability.tracing import http_client_options
+from src.providers.audio_buffer import AudioBuffer, iter_chunks
+
+# Deepgram pre-recorded model used for all transcriptions
+DEEPGRAM_STT_MODEL = "nova-2"
+
 
 class STTError(Exception):
     """Base exception for STT provider errors."""
@@ -91,22 +97,29 @@ class DeepgramSTTProvider:
     Uses Deepgram's pre-recorded audio API with the Nova-2 model.
     """
 
-    def __init__(self, api_key: str, timeout_seconds: int = 30):
+    def __init__(
+        self,
+        api_key: str,
+        timeout_seconds: int = 30,
+        base_url: str = "https://api.deepgram.com",
+    ):
         """Initialize Deepgram STT provider.
 
         Args:
             api_key: Deepgram API key
             timeout_seconds: Timeout for transcription requests (default: 30s)
+            base_url: Deepgram API origin (overridable for stub servers)
         """
         self._api_key = api_key
         self._timeout = timeout_seconds
-        self._base_url = "https://api.deepgram.com/v1/listen"
+        self._base_url = f"{base_url.rstrip('/')}/v1/listen"
 
-    async def transcribe_audio(self, audio_bytes: bytes, mime_type: str) -> str:
+    async def transcribe_audio(self, audio_bytes: AudioBuffer, mime_type: str) -> str:
         """Transcribe audio bytes using Deepgram Nova-2.
 
         Args:
-            audio_bytes: Raw audio data to transcribe
+            audio_bytes: Raw audio data to transcribe; a memory-mapped spool
+                file is streamed in chunks instead of being copied
             mime_type: MIME type of the audio (e.g., 'audio/webm', 'audio/wav')
 
         Returns:
@@ -124,19 +137,24 @@ class DeepgramSTTProvider:
             "Authorization": f"Token {self._api_key}",
             "Content-Type": mime_type,
         }
+        if isinstance(audio_bytes, bytes):
+            content = audio_bytes
+        else:
+            content = iter_chunks(audio_bytes)
+            headers["Content-Length"] = str(len(audio_bytes))
         params = {
-            "model": "nova-2",
+            "model": DEEPGRAM_STT_MODEL,
             "smart_format": "true",
             "punctuate": "true",
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(**http_client_options()) as client:
                 response = await client.post(
                     self._base_url,
                     headers=headers,
                     params=params,
-                    content=audio_bytes,
+                    content=content,
                     timeout=self._timeout,
                 )
                 response.raise_for_status()
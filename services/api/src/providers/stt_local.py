@@ -0,0 +1,197 @@
+"""Local (offline, CPU-only) speech-to-text provider backed by Vosk.
+
+Vosk is optional (``pip install vosk``). Point ``local_stt_model_path`` at an
+unpacked model directory (e.g. ``vosk-model-small-en-us-0.15``); without it
+Vosk downloads its small English model on first use. Mono 16-bit PCM WAV is
+fed to Vosk directly; anything else (e.g. the mobile client's AAC .m4a) is
+first decoded to mono 16 kHz PCM with the ``ffmpeg`` executable
+(``apt install ffmpeg``). Recognition runs in a worker thread.
+"""
+
+import asyncio
+import json
+import logging
+import tempfile
+import wave
+from functools import lru_cache
+from typing import IO, Any
+
+from src.providers.stt_deepgram import (
+    EmptyTranscriptError,
+    STTBadRequestError,
+    STTError,
+    STTTimeoutError,
+)
+from src.providers.audio_buffer import AudioBuffer, open_buffer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import vosk
+except ImportError:  # pragma: no cover - depends on the environment
+    vosk = None
+
+# Frames passed to the recognizer per call
+_CHUNK_FRAMES = 4000
+
+# Sample rate ffmpeg decodes non-WAV uploads to (Vosk's models are 16 kHz)
+_DECODE_SAMPLE_RATE = 16000
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_path: str | None) -> Any:
+    """Load a Vosk model once per process (loading takes seconds)."""
+    if model_path is None:
+        return vosk.Model(lang="en-us")
+    return vosk.Model(model_path)
+
+
+def _is_mono_pcm16_wav(audio_bytes: AudioBuffer) -> bool:
+    try:
+        with wave.open(open_buffer(audio_bytes), "rb") as wav:
+            return wav.getnchannels() == 1 and wav.getsampwidth() == 2
+    except (wave.Error, EOFError):
+        return False
+
+
+def _write_temp_file(audio_bytes: AudioBuffer) -> IO[bytes]:
+    temp_file = tempfile.NamedTemporaryFile(prefix="voicemock-stt-")
+    try:
+        temp_file.write(audio_bytes)
+        temp_file.flush()
+    except BaseException:
+        temp_file.close()
+        raise
+    return temp_file
+
+
+class VoskSTTProvider:
+    """Vosk speech-to-text provider; non-WAV uploads are decoded with ffmpeg."""
+
+    def __init__(
+        self,
+        model_path: str | None = None,
+        timeout_seconds: int = 30,
+        ffmpeg_executable: str = "ffmpeg",
+    ):
+        """Initialize the local STT provider.
+
+        Args:
+            model_path: Unpacked Vosk model directory (default: None =
+                Vosk's small English model)
+            timeout_seconds: Timeout for one transcription, including
+                decoding (default: 30s)
+            ffmpeg_executable: ffmpeg binary used to decode audio that isn't
+                mono 16-bit PCM WAV (default: ffmpeg on PATH)
+        """
+        self._model_path = model_path
+        self._timeout = timeout_seconds
+        self._ffmpeg = ffmpeg_executable
+
+    async def transcribe_audio(self, audio_bytes: AudioBuffer, mime_type: str) -> str:
+        """Transcribe audio with Vosk.
+
+        Args:
+            audio_bytes: Audio file bytes (or a memory-mapped spool file)
+            mime_type: MIME type of the audio (unused; ffmpeg probes the
+                container itself)
+
+        Returns:
+            Transcript text
+
+        Raises:
+            EmptyTranscriptError: If nothing was recognized
+            STTBadRequestError: If ffmpeg can't decode the audio
+            STTTimeoutError: If recognition takes longer than the timeout
+            STTError: If Vosk or ffmpeg isn't installed (not retryable)
+        """
+        if vosk is None:
+            raise STTError(
+                message="Local STT requires the 'vosk' package",
+                stage="stt",
+                code="stt_provider_error",
+                retryable=False,
+            )
+        try:
+            transcript = await asyncio.wait_for(
+                self._transcribe(audio_bytes), timeout=self._timeout
+            )
+        except asyncio.TimeoutError:
+            raise STTTimeoutError()
+
+        if not transcript.strip():
+            raise EmptyTranscriptError()
+        return transcript
+
+    async def _transcribe(self, audio_bytes: AudioBuffer) -> str:
+        if await asyncio.to_thread(_is_mono_pcm16_wav, audio_bytes):
+            return await asyncio.to_thread(self._recognize_wav, audio_bytes)
+        pcm = await self._decode(audio_bytes)
+        return await asyncio.to_thread(self._recognize_pcm, pcm, _DECODE_SAMPLE_RATE)
+
+    async def _decode(self, audio_bytes: AudioBuffer) -> bytes:
+        """Decode any ffmpeg-readable audio to mono 16 kHz 16-bit PCM."""
+        # ffmpeg reads a file rather than stdin: MP4/M4A recordings usually
+        # keep their index (moov atom) at the end, which needs seeking
+        temp_file = await asyncio.to_thread(_write_temp_file, audio_bytes)
+        try:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self._ffmpeg,
+                    "-nostdin",
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-i",
+                    temp_file.name,
+                    "-f",
+                    "s16le",
+                    "-acodec",
+                    "pcm_s16le",
+                    "-ac",
+                    "1",
+                    "-ar",
+                    str(_DECODE_SAMPLE_RATE),
+                    "pipe:1",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError:
+                raise STTError(
+                    message=f"Local STT decoder not found: {self._ffmpeg}",
+                    stage="stt",
+                    code="stt_provider_error",
+                    retryable=False,
+                )
+            try:
+                pcm, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                # Timed out or the request was abandoned
+                process.kill()
+                raise
+        finally:
+            await asyncio.to_thread(temp_file.close)
+
+        if process.returncode != 0:
+            logger.info(
+                "ffmpeg could not decode upload: %s",
+                stderr.decode("utf-8", "replace").strip(),
+            )
+            raise STTBadRequestError("Local STT could not decode the audio")
+        return pcm
+
+    def _recognize_wav(self, audio_bytes: AudioBuffer) -> str:
+        with wave.open(open_buffer(audio_bytes), "rb") as wav:
+            recognizer = vosk.KaldiRecognizer(
+                _load_model(self._model_path), wav.getframerate()
+            )
+            while frames := wav.readframes(_CHUNK_FRAMES):
+                recognizer.AcceptWaveform(frames)
+        return json.loads(recognizer.FinalResult()).get("text", "")
+
+    def _recognize_pcm(self, pcm: bytes, sample_rate: int) -> str:
+        recognizer = vosk.KaldiRecognizer(_load_model(self._model_path), sample_rate)
+        chunk_bytes = _CHUNK_FRAMES * 2
+        for offset in range(0, len(pcm), chunk_bytes):
+            recognizer.AcceptWaveform(pcm[offset : offset + chunk_bytes])
+        return json.loads(recognizer.FinalResult()).get("text", "")
@@ -2,6 +2,8 @@
 
 import httpx
 
+from src.observability.tracing import http_client_options
+
 
 class TTSError(Exception):
     """Base exception for TTS provider errors."""
@@ -87,6 +89,7 @@ class DeepgramTTSProvider:
         api_key: str,
         timeout_seconds: int = 30,
         model: str = "aura-2-thalia-en",
+        base_url: str = "https://api.deepgram.com",
     ):
         """Initialize Deepgram TTS provider.
 
@@ -94,11 +97,12 @@ class DeepgramTTSProvider:
             api_key: Deepgram API key
             timeout_seconds: Timeout for TTS requests (default: 30s)
             model: Deepgram voice model (default: aura-2-thalia-en)
+            base_url: Deepgram API origin (overridable for stub servers)
         """
         self._api_key = api_key
         self._timeout = timeout_seconds
         self._model = model
-        self._base_url = "https://api.deepgram.com/v1/speak"
+        self._base_url = f"{base_url.rstrip('/')}/v1/speak"
 
     async def synthesize(self, text: str) -> bytes:
         """Synthesize text to audio using Deepgram Aura-2.
@@ -127,7 +131,7 @@ class DeepgramTTSProvider:
         payload = {"text": text}
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(**http_client_options()) as client:
                 response = await client.post(
                     self._base_url,
                     headers=headers,
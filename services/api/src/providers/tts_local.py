@@ -0,0 +1,88 @@
+"""Local (offline, CPU-only) text-to-speech provider backed by eSpeak NG.
+
+Runs the ``espeak-ng`` executable (``apt install espeak-ng``) and returns its
+WAV output. Voice quality is well below Deepgram Aura, but synthesis takes
+milliseconds and needs no network.
+"""
+
+import asyncio
+
+from src.providers.tts_deepgram import TTSError, TTSProviderError, TTSTimeoutError
+
+
+class EspeakTTSProvider:
+    """eSpeak NG text-to-speech provider (WAV output)."""
+
+    def __init__(
+        self,
+        voice: str = "en-us",
+        words_per_minute: int = 175,
+        executable: str = "espeak-ng",
+        timeout_seconds: int = 30,
+    ):
+        """Initialize the local TTS provider.
+
+        Args:
+            voice: eSpeak voice name (default: en-us)
+            words_per_minute: Speaking rate (default: 175)
+            executable: eSpeak NG binary (default: espeak-ng on PATH)
+            timeout_seconds: Timeout for one synthesis (default: 30s)
+        """
+        self._voice = voice
+        self._words_per_minute = words_per_minute
+        self._executable = executable
+        self._timeout = timeout_seconds
+
+    async def synthesize(self, text: str) -> bytes:
+        """Synthesize text to audio with eSpeak NG.
+
+        Args:
+            text: Text to synthesize to speech
+
+        Returns:
+            Raw audio bytes (WAV format)
+
+        Raises:
+            TTSTimeoutError: If synthesis takes longer than the timeout
+            TTSProviderError: If eSpeak NG exits with an error
+            TTSError: If the executable isn't installed (not retryable)
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self._executable,
+                "--stdout",
+                "--stdin",
+                "-v",
+                self._voice,
+                "-s",
+                str(self._words_per_minute),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise TTSError(
+                message=f"Local TTS executable not found: {self._executable}",
+                stage="tts",
+                code="tts_provider_error",
+                retryable=False,
+            )
+
+        try:
+            audio, stderr = await asyncio.wait_for(
+                process.communicate(text.encode("utf-8")), timeout=self._timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise TTSTimeoutError()
+        except asyncio.CancelledError:
+            # e.g. an early TTS task dropped after a refusal
+            process.kill()
+            raise
+
+        if process.returncode != 0 or not audio:
+            raise TTSProviderError(
+                stderr.decode("utf-8", "replace").strip() or "eSpeak NG failed"
+            )
+        return audio
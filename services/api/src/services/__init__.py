@@ -4,19 +4,37 @@ from src.services.session_store import SessionStore
 from src.services.prompt_generator import generate_opening_prompt
 from src.services.orchestrator import (
     process_turn,
+    summarize_session,
+    SessionSummaryRequest,
     TurnResult,
     TurnProcessingError,
 )
 from src.services.tts_cache import TTSCache
+from src.services.tts_disk_store import DiskTTSStore
+from src.services.rolling_summary import RollingSummarizer
+from src.services.summary_jobs import SessionSummaryJobs
 from src.services.safety_filter import SafetyFilter, SafetyCheckResult
+from src.services.safety_classifier import (
+    BatchingSafetyClassifier,
+    HashedLinearClassifier,
+    SafetyClassifier,
+)
 
 __all__ = [
     "SessionStore",
     "generate_opening_prompt",
     "process_turn",
+    "summarize_session",
+    "SessionSummaryRequest",
     "TurnResult",
     "TurnProcessingError",
     "TTSCache",
+    "DiskTTSStore",
+    "RollingSummarizer",
+    "SessionSummaryJobs",
     "SafetyFilter",
     "SafetyCheckResult",
+    "SafetyClassifier",
+    "HashedLinearClassifier",
+    "BatchingSafetyClassifier",
 ]
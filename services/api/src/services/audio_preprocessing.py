@@ -0,0 +1,303 @@
+"""Server-side audio preprocessing before STT.
+
+Recorded answers often carry long leading and trailing silences and arrive
+as 44.1/48 kHz (sometimes stereo) audio, none of which helps transcription
+but all of which is uploaded to the STT provider. ``preprocess_audio``
+decodes WAV (integer PCM) and raw ``audio/L16`` uploads, trims leading and
+trailing silence with a frame-energy VAD, downmixes to mono, resamples to
+16 kHz and re-encodes as 16-bit PCM WAV.
+
+Compressed formats (webm/opus, m4a, mp3) are passed through unchanged, as is
+any upload the pipeline wouldn't make smaller.
+
+``measure_audio`` is the cheap pre-STT check: duration and loudest-frame
+level, so clearly silent or too-short recordings can be rejected without an
+STT round trip.
+"""
+
+from __future__ import annotations
+
+import io
+import wave
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+import numpy as np
+
+from src.providers.audio_buffer import AudioBuffer, open_buffer
+
+TARGET_SAMPLE_RATE = 16000
+
+# VAD frame length and the audio kept around the first/last voiced frame
+_FRAME_MS = 20
+_PAD_MS = 200
+# Frames quieter than this are silence no matter how quiet the recording is
+_SILENCE_FLOOR_DBFS = -60.0
+_LOWPASS_TAPS = 31
+# VAD frames decoded at a time by measure_audio (1 s)
+_MEASURE_BLOCK_VAD_FRAMES = 50
+
+
+@dataclass(frozen=True)
+class AudioLevel:
+    """Result of ``measure_audio``."""
+
+    duration_ms: float
+    peak_rms_dbfs: float
+
+
+@dataclass(frozen=True)
+class PreprocessedAudio:
+    """Result of ``preprocess_audio``."""
+
+    audio_bytes: AudioBuffer
+    mime_type: str
+    original_bytes: int
+    trimmed_ms: float = 0.0
+    applied: bool = False
+
+
+def _parse_mime(mime_type: str) -> tuple[str, dict[str, str]]:
+    base, *params = (part.strip() for part in mime_type.lower().split(";"))
+    return base, dict(param.split("=", 1) for param in params if "=" in param)
+
+
+def _pcm_to_float(frames: bytes, sample_width: int) -> np.ndarray | None:
+    """Convert little-endian integer PCM to float32 in [-1, 1)."""
+    if sample_width == 1:  # 8-bit WAV is unsigned
+        return (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    if sample_width == 2:
+        return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    if sample_width == 3:
+        raw = np.frombuffer(frames[: len(frames) - len(frames) % 3], dtype=np.uint8)
+        raw = raw.reshape(-1, 3).astype(np.int32)
+        ints = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        ints = (ints << 8) >> 8  # sign-extend 24-bit
+        return ints.astype(np.float32) / 8388608
+    if sample_width == 4:
+        return np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    return None
+
+
+def _open_pcm(
+    audio_bytes: AudioBuffer, mime_type: str
+) -> tuple[int, int, Callable[[int | None], Iterator[np.ndarray]]] | None:
+    """Parse the header of a WAV or ``audio/L16`` upload.
+
+    Returns:
+        ``(sample_rate, channels, blocks)``, or None for unsupported formats.
+        ``blocks(n)`` yields float32 samples shaped ``(frames, channels)``,
+        ``n`` frames at a time (None = everything in one block), so callers
+        can walk long recordings without decoding them whole.
+    """
+    base, params = _parse_mime(mime_type)
+    if base == "audio/l16":
+        # RFC 2586: big-endian 16-bit PCM, rate/channels as MIME parameters
+        try:
+            rate = int(params.get("rate", TARGET_SAMPLE_RATE))
+            channels = int(params.get("channels", 1))
+        except ValueError:
+            return None
+        if rate <= 0 or channels <= 0:
+            return None
+        frame_bytes = 2 * channels
+        usable = len(audio_bytes) - len(audio_bytes) % frame_bytes
+
+        def l16_blocks(n: int | None) -> Iterator[np.ndarray]:
+            step = n * frame_bytes if n else max(usable, 1)
+            for start in range(0, usable, step):
+                # Slicing copies one block, never the whole buffer
+                chunk = audio_bytes[start : min(start + step, usable)]
+                samples = np.frombuffer(chunk, dtype=">i2").astype(np.float32)
+                yield samples.reshape(-1, channels) / 32768
+
+        return rate, channels, l16_blocks
+
+    if audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        return None
+    try:
+        wav = wave.open(open_buffer(audio_bytes), "rb")
+    except (wave.Error, EOFError):
+        return None
+    channels = wav.getnchannels()
+    sample_width = wav.getsampwidth()
+    rate = wav.getframerate()
+    if channels <= 0 or rate <= 0 or sample_width not in (1, 2, 3, 4):
+        wav.close()
+        return None
+
+    def wav_blocks(n: int | None) -> Iterator[np.ndarray]:
+        with wav:
+            while frames := wav.readframes(n or wav.getnframes()):
+                samples = _pcm_to_float(frames, sample_width)
+                usable = len(samples) - len(samples) % channels
+                yield samples[:usable].reshape(-1, channels)
+                if not n:
+                    break
+
+    return rate, channels, wav_blocks
+
+
+def decode_pcm(
+    audio_bytes: AudioBuffer, mime_type: str
+) -> tuple[np.ndarray, int] | None:
+    """Decode WAV or ``audio/L16`` audio.
+
+    Returns:
+        ``(samples, sample_rate)`` with float32 samples shaped
+        ``(frames, channels)``, or None for unsupported formats
+    """
+    opened = _open_pcm(audio_bytes, mime_type)
+    if opened is None:
+        return None
+    rate, channels, blocks = opened
+    samples = next(blocks(None), None)
+    if samples is None:
+        samples = np.zeros((0, channels), dtype=np.float32)
+    return samples, rate
+
+
+def _frame_rms(mono: np.ndarray, sample_rate: int) -> np.ndarray:
+    """RMS energy of each complete VAD frame."""
+    frame = max(1, sample_rate * _FRAME_MS // 1000)
+    n_frames = len(mono) // frame
+    frames = mono[: n_frames * frame].reshape(n_frames, frame)
+    return np.sqrt(np.mean(np.square(frames), axis=1))
+
+
+def measure_audio(audio_bytes: AudioBuffer, mime_type: str) -> AudioLevel | None:
+    """Measure duration and loudest 20 ms frame of a WAV/L16 upload.
+
+    Decodes about a second at a time, so memory stays flat however long
+    the recording is.
+
+    Returns:
+        AudioLevel, or None for formats that can't be decoded locally
+    """
+    opened = _open_pcm(audio_bytes, mime_type)
+    if opened is None:
+        return None
+    sample_rate, _, blocks = opened
+    frame = max(1, sample_rate * _FRAME_MS // 1000)
+    total_frames = 0
+    peak = 0.0
+    # Whole VAD frames per block, so frame boundaries match a single pass
+    for block in blocks(frame * _MEASURE_BLOCK_VAD_FRAMES):
+        total_frames += len(block)
+        energy = _frame_rms(to_mono(block), sample_rate)
+        if energy.size:
+            peak = max(peak, float(energy.max()))
+    return AudioLevel(
+        duration_ms=total_frames / sample_rate * 1000,
+        peak_rms_dbfs=20 * np.log10(peak) if peak > 0 else float("-inf"),
+    )
+
+
+def to_mono(samples: np.ndarray) -> np.ndarray:
+    """Downmix ``(frames, channels)`` samples to a 1-D mono signal."""
+    if samples.shape[1] == 1:
+        return samples[:, 0]
+    return samples.mean(axis=1, dtype=np.float32)
+
+
+def trim_silence(
+    mono: np.ndarray, sample_rate: int, threshold_db: float = -35.0
+) -> np.ndarray:
+    """Cut leading and trailing silence using per-frame RMS energy.
+
+    A frame is voiced when its RMS is within ``threshold_db`` of the loudest
+    frame (and above an absolute floor). Audio with no voiced frame is
+    returned unchanged; deciding that it is empty is left to the caller.
+    """
+    frame = max(1, sample_rate * _FRAME_MS // 1000)
+    energy = _frame_rms(mono, sample_rate)
+    if energy.size == 0:
+        return mono
+    threshold = max(
+        float(energy.max()) * 10 ** (threshold_db / 20),
+        10 ** (_SILENCE_FLOOR_DBFS / 20),
+    )
+    voiced = np.flatnonzero(energy >= threshold)
+    if voiced.size == 0:
+        return mono
+    pad = sample_rate * _PAD_MS // 1000
+    start = max(0, int(voiced[0]) * frame - pad)
+    end = min(len(mono), (int(voiced[-1]) + 1) * frame + pad)
+    return mono[start:end]
+
+
+def resample(
+    mono: np.ndarray, sample_rate: int, target_rate: int = TARGET_SAMPLE_RATE
+) -> tuple[np.ndarray, int]:
+    """Downsample to ``target_rate`` (audio at or below it is left alone).
+
+    A windowed-sinc low-pass below the new Nyquist frequency runs before
+    linear interpolation, so high frequencies don't alias into the speech band.
+    """
+    if sample_rate <= target_rate or len(mono) == 0:
+        return mono, sample_rate
+    ratio = target_rate / sample_rate
+    cutoff = 0.45 * ratio  # cycles per input sample, just under the new Nyquist
+    offsets = np.arange(_LOWPASS_TAPS) - (_LOWPASS_TAPS - 1) / 2
+    taps = np.sinc(2 * cutoff * offsets) * np.hamming(_LOWPASS_TAPS)
+    taps /= taps.sum()
+    filtered = np.convolve(mono, taps.astype(np.float32), mode="same")
+    positions = np.arange(int(len(mono) * ratio)) / ratio
+    resampled = np.interp(positions, np.arange(len(mono)), filtered)
+    return resampled.astype(np.float32), target_rate
+
+
+def encode_wav(mono: np.ndarray, sample_rate: int) -> bytes:
+    """Encode a mono float signal as 16-bit PCM WAV."""
+    pcm = (np.clip(mono, -1.0, 1.0) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def preprocess_audio(
+    audio_bytes: AudioBuffer,
+    mime_type: str,
+    target_sample_rate: int = TARGET_SAMPLE_RATE,
+    vad_threshold_db: float = -35.0,
+) -> PreprocessedAudio:
+    """Trim, downmix, resample and re-encode an upload for STT.
+
+    CPU-bound; call it from a worker thread on the request path.
+
+    Args:
+        audio_bytes: Uploaded audio
+        mime_type: Upload MIME type
+        target_sample_rate: Output sample rate (default: 16 kHz)
+        vad_threshold_db: Silence threshold relative to the loudest frame
+
+    Returns:
+        PreprocessedAudio; ``applied`` is False (and the original bytes and
+        MIME type are returned) for unsupported formats or when the result
+        wouldn't be smaller
+    """
+    unchanged = PreprocessedAudio(
+        audio_bytes=audio_bytes, mime_type=mime_type, original_bytes=len(audio_bytes)
+    )
+    decoded = decode_pcm(audio_bytes, mime_type)
+    if decoded is None or decoded[0].size == 0:
+        return unchanged
+    samples, sample_rate = decoded
+
+    mono = to_mono(samples)
+    trimmed = trim_silence(mono, sample_rate, vad_threshold_db)
+    resampled, output_rate = resample(trimmed, sample_rate, target_sample_rate)
+    encoded = encode_wav(resampled, output_rate)
+    if len(encoded) >= len(audio_bytes):
+        return unchanged
+    return PreprocessedAudio(
+        audio_bytes=encoded,
+        mime_type="audio/wav",
+        original_bytes=len(audio_bytes),
+        trimmed_ms=(len(mono) - len(trimmed)) / sample_rate * 1000,
+        applied=True,
+    )
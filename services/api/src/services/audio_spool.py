@@ -0,0 +1,138 @@
+"""Upload spooling for recorded answers.
+
+Reading an upload with ``await audio.read()`` keeps the whole recording in a
+Python ``bytes`` object for the rest of the request, including the LLM and
+TTS stages that never look at it. ``spool_upload`` instead memory-maps
+uploads larger than a memory threshold straight from the framework's own
+``SpooledTemporaryFile`` (rolled over to disk first, never copied), so the
+pages are file-backed (the kernel can drop them under pressure) and STT
+providers can stream them in chunks. Small uploads stay in memory.
+
+The orchestrator calls ``SpooledAudio.close()`` as soon as STT finishes,
+which unmaps and deletes the temp file (or drops the in-memory bytes)
+instead of holding the recording until the response is sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import mmap
+import shutil
+import tempfile
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+from src.providers.audio_buffer import STREAM_CHUNK_BYTES, AudioBuffer
+
+
+class SpooledAudio:
+    """An uploaded recording, held in memory or in a memory-mapped temp file."""
+
+    def __init__(self, data: bytes | None = None, file: BinaryIO | None = None):
+        """Initialize from in-memory bytes or a temp file holding the audio.
+
+        Args:
+            data: Audio bytes (small uploads)
+            file: Temp file containing the audio; it is mapped read-only and
+                closed together with this object
+        """
+        self._data = data
+        self._file = file
+        self._map: mmap.mmap | None = None
+        if file is not None:
+            file.flush()
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def on_disk(self) -> bool:
+        return self._map is not None
+
+    @property
+    def closed(self) -> bool:
+        return self._data is None and self._map is None
+
+    @property
+    def buffer(self) -> AudioBuffer:
+        """The audio without copying it."""
+        if self._map is not None:
+            return self._map
+        if self._data is None:
+            raise ValueError("Spooled audio has been released")
+        return self._data
+
+    def __len__(self) -> int:
+        return 0 if self.closed else len(self.buffer)
+
+    def close(self) -> None:
+        """Release the audio; safe to call more than once."""
+        self._data = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _file_backed(source: BinaryIO) -> BinaryIO:
+    """Return ``source`` if it has a file descriptor, else a temp-file copy."""
+    rollover = getattr(source, "rollover", None)
+    if rollover is not None:
+        # Starlette's SpooledTemporaryFile: move its in-memory part to the
+        # underlying anonymous temp file (a no-op if already on disk)
+        rollover()
+        return source
+    try:
+        source.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return _copy_to_temp_file(source)
+    return source
+
+
+def _copy_to_temp_file(source: BinaryIO) -> BinaryIO:
+    source.seek(0)
+    target = tempfile.TemporaryFile()
+    try:
+        shutil.copyfileobj(source, target, STREAM_CHUNK_BYTES)
+    except BaseException:
+        target.close()
+        raise
+    return target  # type: ignore[return-value]
+
+
+async def spool_upload(upload: UploadFile, memory_limit_bytes: int) -> SpooledAudio:
+    """Move an upload into a ``SpooledAudio``.
+
+    Args:
+        upload: Uploaded audio file
+        memory_limit_bytes: Uploads up to this size stay in memory; larger
+            ones are memory-mapped from the upload's temp file
+
+    Returns:
+        SpooledAudio owning the recording (and, for mapped uploads, the
+        upload's file)
+    """
+    owned: BinaryIO | None = None
+    try:
+        size = upload.size
+        if size is None:
+            size = await asyncio.to_thread(upload.file.seek, 0, io.SEEK_END)
+        if size == 0:
+            return SpooledAudio(data=b"")
+        if size <= memory_limit_bytes:
+            await upload.seek(0)
+            return SpooledAudio(data=await upload.read())
+        file = await asyncio.to_thread(_file_backed, upload.file)
+        try:
+            spooled = SpooledAudio(file=file)
+        except BaseException:
+            file.close()
+            raise
+        owned = file
+        return spooled
+    finally:
+        if owned is not upload.file:
+            # Drop the framework's copy now rather than when the request ends
+            await upload.close()
@@ -34,25 +34,35 @@ TTS stage:
 - tts_bad_request: Invalid text or parameters (non-retryable)
 """
 
+import asyncio
 import logging
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterator
 
 from src.providers.stt_deepgram import (
     DeepgramSTTProvider,
     STTError,
 )
+from src.providers.llm_cache import LLMResponseCache
 from src.providers.llm_groq import GroqLLMProvider, LLMError
-from src.providers.tts_deepgram import (
-    DeepgramTTSProvider,
-    TTSError,
-    TTSAuthError,
-    TTSBadRequestError,
-)
+from src.providers.llm_router import LLMBackend, LLMRouter
+from src.providers.protocols import STTProvider, TTSProvider
+from src.providers.stt_local import VoskSTTProvider
+from src.providers.tts_deepgram import DeepgramTTSProvider, TTSError
+from src.providers.tts_local import EspeakTTSProvider
+from src.domain.session_state import RubricScores, TurnRecord
+from src.observability.metrics import stt_audio_bytes
+from src.observability.profiler import pipeline_stage
+from src.observability.tracing import Span, Tracer, get_tracer
 from src.settings.config import get_settings
-from src.services.safety_filter import SafetyFilter
+from src.services.audio_preprocessing import preprocess_audio
+from src.services.audio_spool import SpooledAudio
+from src.services.safety_classifier import BatchingSafetyClassifier
+from src.services.safety_filter import SafetyCheckResult, SafetyFilter
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +84,23 @@ class TurnResult:
     tts_audio_url: str | None = None
     coaching_feedback: CoachingFeedback | None = None
     session_summary: dict[str, Any] | None = None
+    # Set instead of session_summary when the final turn defers the summary
+    pending_summary: "SessionSummaryRequest | None" = None
+    # Model the LLM router chose for the turn's follow-up, if routed
+    llm_model: str | None = None
+
+
+@dataclass
+class SessionSummaryRequest:
+    """Inputs for the end-of-session summary, prepared on the final turn."""
+
+    turn_history: list[dict[str, Any]]
+    role: str
+    interview_type: str
+    difficulty: str
+    average_scores: dict[str, float] | None = None
+    rolling_summary: dict[str, Any] | None = None
+    request_id: str | None = None
 
 
 class TurnProcessingError(Exception):
@@ -96,38 +123,212 @@ class TurnProcessingError(Exception):
         self.request_id = request_id
 
 
-def get_stt_provider() -> DeepgramSTTProvider:
-    """Get STT provider instance with settings."""
+@contextmanager
+def _stage_scope(
+    tracer: Tracer, stage: str, attributes: dict[str, Any] | None = None
+) -> Iterator[Span]:
+    """Trace a pipeline stage and tag it for the sampling profiler."""
+    with pipeline_stage(stage):
+        with tracer.start_as_current_span(stage, attributes) as span:
+            yield span
+
+
+async def summarize_session(
+    request: SessionSummaryRequest, llm_provider: Any = None
+) -> dict[str, Any] | None:
+    """Generate the end-of-session summary.
+
+    Failures are logged and return None; a missing summary never fails the
+    turn that completed the session.
+    """
+    if llm_provider is None:
+        llm_provider = get_llm_provider()
+    try:
+        with _stage_scope(
+            get_tracer(),
+            "llm.session_summary",
+            {"summary.turns": len(request.turn_history)},
+        ):
+            return await llm_provider.generate_session_summary(
+                turn_history=request.turn_history,
+                role=request.role,
+                interview_type=request.interview_type,
+                difficulty=request.difficulty,
+                average_scores=request.average_scores,
+                rolling_summary=request.rolling_summary,
+            )
+    except Exception as summary_exc:
+        logger.warning(
+            "Session summary generation failed: %s (request_id=%s)",
+            str(summary_exc),
+            request.request_id,
+        )
+        return None
+
+
+async def _cancel_task(task: asyncio.Task) -> None:
+    """Cancel a task and wait for it, discarding its outcome."""
+    task.cancel()
+    await asyncio.wait([task])
+    if not task.cancelled():
+        task.exception()  # mark retrieved so asyncio doesn't log it
+
+
+def _content_refused_by_filter(
+    reason: str | None, request_id: str | None
+) -> TurnProcessingError:
+    logger.warning(
+        "Turn refused by transcript safety filter",
+        extra={
+            "request_id": request_id,
+            "stage": "llm",
+            "code": "content_refused",
+            "reason": reason,
+        },
+    )
+    return TurnProcessingError(
+        message="Transcript blocked by safety filter",
+        message_safe=(
+            "Your response couldn't be processed. Please rephrase your "
+            "answer to focus on the interview question."
+        ),
+        stage="llm",
+        code="content_refused",
+        retryable=False,
+        request_id=request_id,
+    )
+
+
+def _turn_dict(turn: TurnRecord | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(turn, dict):
+        return turn
+    return {
+        "turn_number": turn.turn_number,
+        "transcript": turn.transcript,
+        "assistant_text": turn.assistant_text,
+        "coaching_feedback": turn.coaching_feedback,
+    }
+
+
+def get_stt_provider() -> STTProvider:
+    """Get the configured STT provider instance with settings."""
     settings = get_settings()
+    if settings.stt_backend == "local":
+        return VoskSTTProvider(
+            model_path=settings.local_stt_model_path,
+            timeout_seconds=settings.stt_timeout_seconds,
+            ffmpeg_executable=settings.local_stt_ffmpeg_executable,
+        )
     return DeepgramSTTProvider(
         api_key=settings.deepgram_api_key,
         timeout_seconds=settings.stt_timeout_seconds,
+        base_url=settings.deepgram_base_url,
     )
 
 
-def get_llm_provider() -> GroqLLMProvider:
-    """Get LLM provider instance with settings."""
+_llm_response_cache: LLMResponseCache | None = None
+_llm_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache | None:
+    """Get the process-wide LLM response cache, or None when disabled."""
+    global _llm_response_cache
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    if _llm_response_cache is None:
+        with _llm_response_cache_lock:
+            if _llm_response_cache is None:
+                _llm_response_cache = LLMResponseCache(
+                    max_entries=settings.llm_cache_max_entries,
+                    ttl_seconds=settings.llm_cache_ttl_seconds,
+                )
+    return _llm_response_cache
+
+
+def _groq_llm_provider(model: str) -> GroqLLMProvider:
+    """Build a Groq LLM provider for ``model`` with settings."""
     settings = get_settings()
     return GroqLLMProvider(
         api_key=settings.groq_api_key,
-        model=settings.llm_model,
+        model=model,
         timeout_seconds=settings.llm_timeout_seconds,
         max_tokens=settings.llm_max_tokens,
+        base_url=settings.groq_base_url,
+        context_budget_tokens=settings.llm_context_budget_tokens,
+        response_cache=get_llm_response_cache(),
+        question_max_tokens=settings.llm_question_max_tokens,
     )
 
 
-def get_tts_provider() -> DeepgramTTSProvider:
-    """Get TTS provider instance with settings."""
+_llm_router: LLMRouter | None = None
+_llm_router_lock = threading.Lock()
+
+
+def get_llm_router() -> LLMRouter:
+    """Get the process-wide LLM router (its latency stats outlive requests).
+
+    Follow-up questions prefer ``llm_fast_model``; summaries and coaching
+    prefer ``llm_model``. Each falls back to the other model.
+    """
+    global _llm_router
+    if _llm_router is None:
+        with _llm_router_lock:
+            if _llm_router is None:
+                settings = get_settings()
+                _llm_router = LLMRouter(
+                    backends=[
+                        LLMBackend(
+                            "fast",
+                            _groq_llm_provider(settings.llm_fast_model),
+                            model=settings.llm_fast_model,
+                        ),
+                        LLMBackend(
+                            "main",
+                            _groq_llm_provider(settings.llm_model),
+                            model=settings.llm_model,
+                        ),
+                    ],
+                    routes={"follow_up": ["fast", "main"], "summary": ["main", "fast"]},
+                    latency_budget_ms=settings.llm_router_latency_budget_ms,
+                    route_latency_budgets_ms={
+                        "summary": settings.llm_router_summary_latency_budget_ms
+                    },
+                    max_error_rate=settings.llm_router_max_error_rate,
+                    cooldown_seconds=settings.llm_router_cooldown_seconds,
+                    window=settings.llm_router_window,
+                )
+    return _llm_router
+
+
+def get_llm_provider() -> GroqLLMProvider | LLMRouter:
+    """Get LLM provider instance with settings."""
+    settings = get_settings()
+    if settings.llm_router_enabled:
+        return get_llm_router()
+    return _groq_llm_provider(settings.llm_model)
+
+
+def get_tts_provider() -> TTSProvider:
+    """Get the configured TTS provider instance with settings."""
     settings = get_settings()
+    if settings.tts_backend == "local":
+        return EspeakTTSProvider(
+            voice=settings.local_tts_voice,
+            words_per_minute=settings.local_tts_words_per_minute,
+            executable=settings.local_tts_executable,
+            timeout_seconds=settings.tts_timeout_seconds,
+        )
     return DeepgramTTSProvider(
         api_key=settings.deepgram_api_key,
         timeout_seconds=settings.tts_timeout_seconds,
         model=settings.tts_model,
+        base_url=settings.deepgram_base_url,
     )
 
 
 async def process_turn(
-    audio_bytes: bytes | None,
+    audio_bytes: bytes | SpooledAudio | None,
     mime_type: str | None,
     session: Any,  # SessionState type
     role: str,
@@ -137,14 +338,19 @@ async def process_turn(
     question_count: int,
     tts_cache: Any,  # TTSCache instance
     safety_filter: SafetyFilter | None = None,
+    safety_classifier: BatchingSafetyClassifier | None = None,
     transcript: str | None = None,
     request_id: str | None = None,
-    turn_history: list[dict[str, Any]] | None = None,
+    turn_history: list[TurnRecord] | list[dict[str, Any]] | None = None,
+    rubric_scores: RubricScores | None = None,
+    rolling_summary: dict[str, Any] | None = None,
+    defer_summary: bool = False,
 ) -> TurnResult:
     """Process a turn through the STT → LLM → TTS pipeline.
 
     Args:
-        audio_bytes: Raw audio data to transcribe
+        audio_bytes: Raw audio data to transcribe; a SpooledAudio is closed
+            as soon as STT finishes
         mime_type: MIME type of the audio
         session: Active session state (for updating turn_count and last_activity_at)
         role: Interview role (e.g., "Software Engineer")
@@ -152,8 +358,17 @@ async def process_turn(
         difficulty: Difficulty level (e.g., "Entry", "Mid", "Senior")
         asked_questions: List of previously asked questions (to avoid repeats)
         turn_history: Existing session turn history records prior to current turn
+            (only read when the session completes)
+        rubric_scores: Session's running rubric totals prior to current turn;
+            used for summary averages instead of rescanning turn_history
+        rolling_summary: Running summary of earlier turns (rolling summary
+            mode); the final summary then only merges the turns it doesn't cover
+        defer_summary: On the final turn, return the summary inputs as
+            ``pending_summary`` instead of generating the summary inline
         question_count: Total configured questions for the session
         tts_cache: TTSCache instance for storing generated audio
+        safety_filter: Regex safety filter (defaults to one built from settings)
+        safety_classifier: Optional local classifier run after the regex filter
         transcript: Optional transcript (skips STT if provided)
         request_id: Request ID for error tracing and TTS cache key (optional)
 
@@ -164,11 +379,13 @@ async def process_turn(
         TurnProcessingError: If STT, LLM, or non-retryable TTS errors occur
     """
     start_time = time.perf_counter()
+    tracer = get_tracer()
 
     try:
         if turn_history is None:
             turn_history = []
 
+        preprocess_ms = 0.0
         if transcript:
             # Skip STT if transcript provided (retry flow)
             stt_ms = 0.0
@@ -184,77 +401,225 @@ async def process_turn(
                     request_id=request_id,
                 )
 
-            stt_provider = get_stt_provider()
-            stt_start = time.perf_counter()
-            transcript = await stt_provider.transcribe_audio(audio_bytes, mime_type)
-            stt_end = time.perf_counter()
+            spool = audio_bytes if isinstance(audio_bytes, SpooledAudio) else None
+            audio = spool.buffer if spool is not None else audio_bytes
+            try:
+                settings = get_settings()
+                audio_size = stt_audio_bytes()
+                audio_size.observe(len(audio), stage="received")
+                preprocessed = False
+                if settings.audio_preprocessing_enabled:
+                    preprocess_start = time.perf_counter()
+                    with _stage_scope(tracer, "audio.preprocess") as span:
+                        processed = await asyncio.to_thread(
+                            preprocess_audio,
+                            audio,
+                            mime_type,
+                            target_sample_rate=settings.audio_target_sample_rate,
+                            vad_threshold_db=settings.audio_vad_threshold_db,
+                        )
+                        span.set_attribute(
+                            "audio.bytes_in", processed.original_bytes
+                        )
+                        span.set_attribute(
+                            "audio.bytes_out", len(processed.audio_bytes)
+                        )
+                        span.set_attribute("audio.trimmed_ms", processed.trimmed_ms)
+                    audio, mime_type = processed.audio_bytes, processed.mime_type
+                    preprocessed = processed.applied
+                    del processed
+                    preprocess_ms = (time.perf_counter() - preprocess_start) * 1000
+                audio_size.observe(len(audio), stage="sent")
+
+                stt_provider = get_stt_provider()
+                stt_start = time.perf_counter()
+                with _stage_scope(
+                    tracer,
+                    "stt",
+                    {
+                        "stt.audio_bytes": len(audio),
+                        "stt.preprocessed": preprocessed,
+                        "stt.spooled": spool is not None and spool.on_disk,
+                    },
+                ):
+                    transcript = await stt_provider.transcribe_audio(
+                        audio, mime_type
+                    )
+                stt_end = time.perf_counter()
+            finally:
+                # LLM and TTS never look at the recording; free it now
+                # rather than when the request ends
+                audio = None
+                if spool is not None:
+                    spool.close()
 
             stt_ms = (stt_end - stt_start) * 1000
 
         active_safety_filter = safety_filter or SafetyFilter.from_settings()
-        safety_result = active_safety_filter.check_transcript(transcript)
-        if not safety_result.is_safe:
-            logger.warning(
-                "Turn refused by transcript safety filter",
-                extra={
-                    "request_id": request_id,
-                    "stage": "llm",
-                    "code": "content_refused",
-                    "reason": safety_result.reason,
-                },
-            )
-            raise TurnProcessingError(
-                message="Transcript blocked by safety filter",
-                message_safe=(
-                    "Your response couldn't be processed. Please rephrase your "
-                    "answer to focus on the interview question."
-                ),
-                stage="llm",
-                code="content_refused",
-                retryable=False,
-                request_id=request_id,
-            )
 
-        # LLM processing
-        llm_provider = get_llm_provider()
-        llm_start = time.perf_counter()
-        llm_response = await llm_provider.generate_follow_up(
-            transcript=transcript,
-            role=role,
-            interview_type=interview_type,
-            difficulty=difficulty,
-            asked_questions=asked_questions,
-            question_number=session.turn_count + 1,  # 1-indexed
-            total_questions=question_count,
-        )
-        if isinstance(llm_response, str):
-            assistant_text = llm_response
-            coaching_feedback = None
-        else:
-            assistant_text = llm_response.follow_up_question
-            coaching_feedback = llm_response.coaching_feedback
+        async def screen_transcript(offload: bool) -> SafetyCheckResult:
+            if offload:
+                result = await asyncio.to_thread(
+                    active_safety_filter.check_transcript, transcript
+                )
+            else:
+                result = active_safety_filter.check_transcript(transcript)
+            if not result.is_safe or safety_classifier is None:
+                return result
+            try:
+                with _stage_scope(tracer, "safety_classifier"):
+                    return await safety_classifier.check(transcript)
+            except Exception as exc:
+                # The classifier is an early reject; the LLM's refused flag
+                # still backstops the turn, so fail open.
+                logger.warning(
+                    "Safety classifier failed: %s (request_id=%s)", exc, request_id
+                )
+                return result
+
+        # Streaming mode: TTS for the question starts as soon as the question
+        # is complete, while the model is still writing coaching feedback
+        response_mode = get_settings().llm_response_mode
+        streaming = response_mode == "streaming"
+        early_tts: asyncio.Task | None = None
+        early_tts_text: str | None = None
+        # Set once the transcript passed screening; with concurrent safety
+        # checks the question can stream in before the verdict
+        transcript_screened = asyncio.Event()
+        # Split mode: coaching runs as its own LLM call next to a short
+        # question-only call, and is awaited only after TTS
+        coaching_task: asyncio.Task | None = None
+        # llm_ms covers only the question call in split mode
+        coaching_ms = 0.0
+
+        async def synthesize(text: str) -> tuple[bytes, float]:
+            tts_provider = get_tts_provider()
+            tts_start = time.perf_counter()
+            with _stage_scope(tracer, "tts"):
+                audio = await tts_provider.synthesize(text)
+            return audio, (time.perf_counter() - tts_start) * 1000
+
+        async def synthesize_when_screened(text: str) -> tuple[bytes, float]:
+            await transcript_screened.wait()
+            return await synthesize(text)
+
+        def start_early_tts(question: str) -> None:
+            nonlocal early_tts, early_tts_text
+            if early_tts is None:
+                early_tts_text = question
+                early_tts = asyncio.create_task(synthesize_when_screened(question))
+
+        async def generate_coaching() -> Any:
+            nonlocal coaching_ms
+            coaching_start = time.perf_counter()
+            try:
+                with _stage_scope(tracer, "llm.coaching"):
+                    return await llm_provider.generate_coaching_feedback(
+                        transcript=transcript,
+                        role=role,
+                        interview_type=interview_type,
+                        difficulty=difficulty,
+                        question=asked_questions[-1] if asked_questions else None,
+                    )
+            finally:
+                coaching_ms = (time.perf_counter() - coaching_start) * 1000
+
+        async def generate_follow_up() -> Any:
+            nonlocal coaching_task
+            if response_mode == "split":
+                coaching_task = asyncio.create_task(generate_coaching())
+                with _stage_scope(tracer, "llm.follow_up", {"llm.mode": "split"}):
+                    return await llm_provider.generate_question(
+                        transcript=transcript,
+                        role=role,
+                        interview_type=interview_type,
+                        difficulty=difficulty,
+                        asked_questions=asked_questions,
+                        question_number=session.turn_count + 1,  # 1-indexed
+                        total_questions=question_count,
+                    )
+            with _stage_scope(tracer, "llm.follow_up", {"llm.streaming": streaming}):
+                return await llm_provider.generate_follow_up(
+                    transcript=transcript,
+                    role=role,
+                    interview_type=interview_type,
+                    difficulty=difficulty,
+                    asked_questions=asked_questions,
+                    question_number=session.turn_count + 1,  # 1-indexed
+                    total_questions=question_count,
+                    **({"on_follow_up_question": start_early_tts} if streaming else {}),
+                )
 
-        if not isinstance(llm_response, str) and llm_response.refused:
-            logger.warning(
-                "Turn refused by LLM safety response",
-                extra={
-                    "request_id": request_id,
-                    "stage": "llm",
-                    "code": "content_refused",
-                },
-            )
-            raise TurnProcessingError(
-                message="LLM refused content",
-                message_safe=(
-                    assistant_text
-                    or "Let's stay focused on the interview. Please try answering "
-                    "the question again."
-                ),
-                stage="llm",
-                code="content_refused",
-                retryable=False,
-                request_id=request_id,
-            )
+        try:
+            # The classifier exists to reject turns before any upstream spend,
+            # so with a classifier configured screening always comes first
+            if get_settings().safety_check_concurrent and safety_classifier is None:
+                # Optimistic mode: start the LLM call and run the regex filter
+                # meanwhile; a refusal cancels the LLM call before anything is
+                # returned. Early TTS waits for the verdict, so a refused
+                # transcript never reaches the TTS provider or cache.
+                llm_provider = get_llm_provider()
+                llm_start = time.perf_counter()
+                llm_task = asyncio.create_task(generate_follow_up())
+                try:
+                    with _stage_scope(
+                        tracer, "safety_check", {"safety.concurrent": True}
+                    ):
+                        safety_result = await screen_transcript(offload=True)
+                except BaseException:
+                    await _cancel_task(llm_task)
+                    raise
+                if not safety_result.is_safe:
+                    await _cancel_task(llm_task)
+                    raise _content_refused_by_filter(safety_result.reason, request_id)
+                transcript_screened.set()
+                llm_response = await llm_task
+            else:
+                with _stage_scope(tracer, "safety_check"):
+                    safety_result = await screen_transcript(offload=False)
+                if not safety_result.is_safe:
+                    raise _content_refused_by_filter(safety_result.reason, request_id)
+                transcript_screened.set()
+
+                # LLM processing
+                llm_provider = get_llm_provider()
+                llm_start = time.perf_counter()
+                llm_response = await generate_follow_up()
+
+            if isinstance(llm_response, str):
+                assistant_text = llm_response
+                coaching_feedback = None
+            else:
+                assistant_text = llm_response.follow_up_question
+                coaching_feedback = llm_response.coaching_feedback
+
+            if not isinstance(llm_response, str) and llm_response.refused:
+                logger.warning(
+                    "Turn refused by LLM safety response",
+                    extra={
+                        "request_id": request_id,
+                        "stage": "llm",
+                        "code": "content_refused",
+                    },
+                )
+                raise TurnProcessingError(
+                    message="LLM refused content",
+                    message_safe=(
+                        assistant_text
+                        or "Let's stay focused on the interview. Please try "
+                        "answering the question again."
+                    ),
+                    stage="llm",
+                    code="content_refused",
+                    retryable=False,
+                    request_id=request_id,
+                )
+        except BaseException:
+            if early_tts is not None:
+                await _cancel_task(early_tts)
+            if coaching_task is not None:
+                await _cancel_task(coaching_task)
+            raise
         llm_end = time.perf_counter()
 
         llm_ms = (llm_end - llm_start) * 1000
@@ -264,30 +629,36 @@ async def process_turn(
         tts_ms = 0.0
 
         try:
-            tts_provider = get_tts_provider()
-            tts_start = time.perf_counter()
-            audio_bytes_result = await tts_provider.synthesize(assistant_text)
-            tts_end = time.perf_counter()
-
-            tts_ms = (tts_end - tts_start) * 1000
-
-            # Store in cache and set URL
+            if early_tts is not None and early_tts_text == assistant_text:
+                audio_bytes_result, tts_ms = await early_tts
+            else:
+                if early_tts is not None:
+                    # The final question differs from the streamed preview
+                    await _cancel_task(early_tts)
+                audio_bytes_result, tts_ms = await synthesize(assistant_text)
+
+            # Store in cache and set URL; only audio awaited to completion
+            # above gets here, never a cancelled early TTS result
             if request_id:
-                tts_cache.store(request_id, audio_bytes_result)
+                # The disk store writes files; keep that off the event loop
+                await asyncio.to_thread(tts_cache.store, request_id, audio_bytes_result)
                 tts_audio_url = f"/tts/{request_id}"
 
-        except (TTSAuthError, TTSBadRequestError) as e:
-            # Non-retryable TTS errors: propagate as TurnProcessingError
-            raise TurnProcessingError(
-                message=str(e),
-                message_safe="TTS generation failed",
-                stage=e.stage,
-                code=e.code,
-                retryable=e.retryable,
-                request_id=request_id,
-            ) from e
-
         except TTSError as e:
+            if not e.retryable:
+                # Non-retryable TTS errors (auth, bad request, a missing local
+                # TTS binary): propagate as TurnProcessingError
+                if coaching_task is not None:
+                    await _cancel_task(coaching_task)
+                raise TurnProcessingError(
+                    message=str(e),
+                    message_safe="TTS generation failed",
+                    stage=e.stage,
+                    code=e.code,
+                    retryable=e.retryable,
+                    request_id=request_id,
+                ) from e
+
             # Retryable TTS errors: log and degrade gracefully
             logger.warning(
                 f"TTS generation failed (retryable): {e.code} - {str(e)} "
@@ -295,52 +666,80 @@ async def process_turn(
             )
             # tts_audio_url remains None (graceful degradation)
 
+        if coaching_task is not None:
+            try:
+                coaching_feedback = await coaching_task
+            except Exception as exc:
+                # Coaching is optional; the question and audio are already done
+                logger.warning(
+                    "Coaching feedback failed: %s (request_id=%s)", exc, request_id
+                )
+                coaching_feedback = None
+
         # Update session state
         session.turn_count += 1
         session.last_activity_at = datetime.now(timezone.utc)
 
         is_complete = session.turn_count >= question_count
         session_summary = None
+        pending_summary = None
         if is_complete:
-            summary_turn_history = list(turn_history)
+            coaching_feedback_dict = (
+                coaching_feedback.model_dump()
+                if coaching_feedback is not None
+                else None
+            )
+            covered_turns = (
+                rolling_summary.get("covered_turns", 0) if rolling_summary else 0
+            )
+            summary_turn_history = [
+                turn
+                for turn in map(_turn_dict, turn_history)
+                if turn["turn_number"] > covered_turns
+            ]
             summary_turn_history.append(
                 {
                     "turn_number": session.turn_count,
                     "transcript": transcript,
                     "assistant_text": assistant_text,
-                    "coaching_feedback": (
-                        coaching_feedback.model_dump()
-                        if coaching_feedback is not None
-                        else None
-                    ),
+                    "coaching_feedback": coaching_feedback_dict,
                 }
             )
 
-            try:
-                session_summary = await llm_provider.generate_session_summary(
-                    turn_history=summary_turn_history,
-                    role=role,
-                    interview_type=interview_type,
-                    difficulty=difficulty,
-                )
-            except Exception as summary_exc:
-                logger.warning(
-                    "Session summary generation failed: %s (request_id=%s)",
-                    str(summary_exc),
-                    request_id,
+            average_scores = None
+            if rubric_scores is not None:
+                session_scores = rubric_scores.copy()
+                session_scores.record(coaching_feedback_dict)
+                average_scores = session_scores.averages()
+
+            pending_summary = SessionSummaryRequest(
+                turn_history=summary_turn_history,
+                role=role,
+                interview_type=interview_type,
+                difficulty=difficulty,
+                average_scores=average_scores,
+                rolling_summary=rolling_summary,
+                request_id=request_id,
+            )
+            if not defer_summary:
+                session_summary = await summarize_session(
+                    pending_summary, llm_provider
                 )
-                session_summary = None
+                pending_summary = None
 
         # Calculate total time
         end_time = time.perf_counter()
         total_ms = (end_time - start_time) * 1000
 
         timings = {
+            "preprocess_ms": preprocess_ms,
             "stt_ms": stt_ms,
             "llm_ms": llm_ms,
             "tts_ms": tts_ms,
             "total_ms": total_ms,
         }
+        if coaching_task is not None:
+            timings["coaching_ms"] = coaching_ms
 
         return TurnResult(
             transcript=transcript,
@@ -349,6 +748,8 @@ async def process_turn(
             tts_audio_url=tts_audio_url,
             coaching_feedback=coaching_feedback,
             session_summary=session_summary,
+            pending_summary=pending_summary,
+            llm_model=getattr(llm_response, "model", None),
         )
 
     except STTError as e:
@@ -0,0 +1,112 @@
+"""Background rolling session summaries.
+
+In ``summary_mode=rolling`` each completed turn schedules a background update
+of the session's compact running summary (strengths, improvements, notes).
+Updates for a session run one at a time, in order, and each one merges every
+turn the stored summary doesn't cover yet, so a failed update is caught up by
+the next. The final turn then only merges the running summary with the last
+turn(s), keeping its prompt size and latency constant.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+from typing import Any, Callable
+
+from src.observability.profiler import pipeline_stage
+from src.observability.tracing import get_tracer
+from src.services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+
+def _default_llm_provider() -> Any:
+    from src.services.orchestrator import get_llm_provider
+
+    return get_llm_provider()
+
+
+class RollingSummarizer:
+    """Schedules and serializes per-session running summary updates."""
+
+    def __init__(
+        self, llm_provider_factory: Callable[[], Any] = _default_llm_provider
+    ):
+        self._llm_provider_factory = llm_provider_factory
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def schedule(self, session_store: SessionStore, session_id: str) -> asyncio.Task:
+        """Queue a running summary update covering the session's latest turns."""
+        previous = self._pending.get(session_id)
+        # Fresh context: the job outlives the request and gets its own trace
+        task = asyncio.get_running_loop().create_task(
+            self._update(session_store, session_id, previous),
+            context=contextvars.Context(),
+        )
+        self._pending[session_id] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if self._pending.get(session_id) is done:
+                del self._pending[session_id]
+
+        task.add_done_callback(_forget)
+        return task
+
+    async def wait(self, session_id: str, timeout: float | None = None) -> bool:
+        """Wait for queued updates of a session; False if still running."""
+        task = self._pending.get(session_id)
+        if task is None:
+            return True
+        done, _ = await asyncio.wait([task], timeout=timeout)
+        return bool(done)
+
+    async def _update(
+        self,
+        session_store: SessionStore,
+        session_id: str,
+        previous: asyncio.Task | None,
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        session = session_store.get_session(session_id)
+        if session is None:
+            return
+        rolling_summary = session.rolling_summary
+        covered = rolling_summary.get("covered_turns", 0) if rolling_summary else 0
+        new_turns = [
+            turn for turn in session.turn_history if turn.turn_number > covered
+        ]
+        if not new_turns:
+            return
+
+        summary = rolling_summary
+        try:
+            with pipeline_stage("llm.rolling_summary"):
+                with get_tracer().start_as_current_span(
+                    "llm.rolling_summary", {"summary.new_turns": len(new_turns)}
+                ):
+                    provider = self._llm_provider_factory()
+                    for turn in new_turns:
+                        summary = await provider.update_rolling_summary(
+                            previous_summary=summary,
+                            turn={
+                                "turn_number": turn.turn_number,
+                                "transcript": turn.transcript,
+                                "assistant_text": turn.assistant_text,
+                                "coaching_feedback": turn.coaching_feedback,
+                            },
+                            role=session.role,
+                            interview_type=session.interview_type,
+                            difficulty=session.difficulty,
+                        )
+                        if summary is None:
+                            break
+                        summary["covered_turns"] = turn.turn_number
+                        session_store.set_rolling_summary(session_id, summary)
+        except Exception:
+            logger.exception(
+                "Rolling summary update failed (session_id=%s)", session_id
+            )
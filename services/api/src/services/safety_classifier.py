@@ -0,0 +1,199 @@
+"""Pluggable local safety classifier for transcripts.
+
+The regex ``SafetyFilter`` only catches exact phrasings. A ``SafetyClassifier``
+scores transcripts with a local model so paraphrased abuse is rejected before
+any upstream LLM spend. Classifiers score whole batches at once; concurrent
+turns are micro-batched by ``BatchingSafetyClassifier`` so the per-transcript
+cost of running the model (and of the worker-thread hop) is amortized.
+
+``HashedLinearClassifier`` is the CPU-only reference implementation: a
+logistic regression over hashed word unigrams and bigrams, stored as JSON.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import re
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Protocol, Sequence
+
+from src.services.safety_filter import SafetyCheckResult
+from src.settings.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+class SafetyClassifier(Protocol):
+    """Scores transcripts with the probability that they are harmful."""
+
+    def score_batch(self, texts: Sequence[str]) -> list[float]:
+        """Return one harm probability in [0, 1] per text, in order."""
+        ...
+
+
+class HashedLinearClassifier:
+    """Logistic regression over hashed unigram and bigram counts.
+
+    Model file format (JSON)::
+
+        {"n_features": 4096, "bias": -2.5, "weights": {"17": 1.3, ...}}
+
+    ``weights`` is sparse: feature bucket index → weight.
+    """
+
+    def __init__(
+        self,
+        weights: dict[int, float],
+        bias: float = 0.0,
+        n_features: int = 4096,
+    ):
+        self._weights = weights
+        self._bias = bias
+        self._n_features = n_features
+
+    @classmethod
+    def from_file(cls, path: str) -> "HashedLinearClassifier":
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            weights={int(k): float(v) for k, v in payload["weights"].items()},
+            bias=float(payload.get("bias", 0.0)),
+            n_features=int(payload.get("n_features", 4096)),
+        )
+
+    def save(self, path: str) -> None:
+        payload = {
+            "n_features": self._n_features,
+            "bias": self._bias,
+            "weights": {str(k): v for k, v in sorted(self._weights.items()) if v},
+        }
+        Path(path).write_text(json.dumps(payload), encoding="utf-8")
+
+    @classmethod
+    def fit(
+        cls,
+        texts: Sequence[str],
+        labels: Sequence[int],
+        n_features: int = 4096,
+        epochs: int = 30,
+        learning_rate: float = 0.5,
+    ) -> "HashedLinearClassifier":
+        """Train with plain SGD on log loss; labels are 1 (harmful) or 0."""
+        model = cls(weights={}, bias=0.0, n_features=n_features)
+        samples = [(model._features(text), label) for text, label in zip(texts, labels)]
+        for _ in range(epochs):
+            for features, label in samples:
+                gradient = model._predict(features) - label
+                model._bias -= learning_rate * gradient
+                for index, count in features.items():
+                    model._weights[index] = (
+                        model._weights.get(index, 0.0) - learning_rate * gradient * count
+                    )
+        return model
+
+    def score_batch(self, texts: Sequence[str]) -> list[float]:
+        return [self._predict(self._features(text)) for text in texts]
+
+    def _features(self, text: str) -> Counter[int]:
+        tokens = _TOKEN_RE.findall(text.lower())
+        grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        return Counter(zlib.crc32(gram.encode()) % self._n_features for gram in grams)
+
+    def _predict(self, features: Counter[int]) -> float:
+        weights = self._weights
+        z = self._bias + sum(
+            weights.get(index, 0.0) * count for index, count in features.items()
+        )
+        if z < -60:
+            return 0.0
+        return 1.0 / (1.0 + math.exp(-z))
+
+
+class BatchingSafetyClassifier:
+    """Micro-batches concurrent ``check`` calls into one ``score_batch`` call.
+
+    A batch is flushed when it reaches ``max_batch_size`` or ``max_wait_ms``
+    after its first transcript arrived, and scored on a worker thread so the
+    event loop keeps serving other turns.
+    """
+
+    def __init__(
+        self,
+        classifier: SafetyClassifier,
+        threshold: float = 0.8,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        reason: str = "classifier_flagged",
+    ):
+        self._classifier = classifier
+        self._threshold = threshold
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._reason = reason
+        self._pending: list[tuple[str, asyncio.Future[float]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(cls) -> "BatchingSafetyClassifier | None":
+        """Build from app settings, or None when no model file is configured."""
+        settings = get_settings()
+        if not settings.safety_classifier_model_file:
+            return None
+        return cls(
+            HashedLinearClassifier.from_file(settings.safety_classifier_model_file),
+            threshold=settings.safety_classifier_threshold,
+            max_batch_size=settings.safety_classifier_batch_size,
+            max_wait_ms=settings.safety_classifier_batch_wait_ms,
+        )
+
+    async def check(self, transcript: str) -> SafetyCheckResult:
+        """Classify one transcript, batched with concurrent callers."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[float] = loop.create_future()
+        self._pending.append((transcript, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_wait, self._flush)
+
+        score = await future
+        if score >= self._threshold:
+            return SafetyCheckResult(is_safe=False, reason=self._reason)
+        return SafetyCheckResult(is_safe=True)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        batch = [(text, future) for text, future in batch if not future.done()]
+        if not batch:
+            return
+        task = asyncio.create_task(self._score(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _score(self, batch: list[tuple[str, asyncio.Future[float]]]) -> None:
+        try:
+            scores = await asyncio.to_thread(
+                self._classifier.score_batch, [text for text, _ in batch]
+            )
+            if len(scores) != len(batch):
+                raise ValueError(
+                    f"Classifier returned {len(scores)} scores for {len(batch)} texts"
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), score in zip(batch, scores):
+            if not future.done():
+                future.set_result(score)
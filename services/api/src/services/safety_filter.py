@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import logging
 import re
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,6 +15,199 @@ from src.settings.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+# Word runs as the regex engine sees them for \b boundaries
+_WORD_RE = re.compile(r"\w+")
+
+# \bterm\b, \b(a|b|c)\b and \b(?:a|b|c)\b over plain word characters
+_LITERAL_TERMS_RE = re.compile(r"\\b(\((?:\?:)?)?(\w+(?:\|\w+)*)(\))?\\b")
+
+# Below this many indexable patterns, tokenizing the transcript costs more
+# than the regex searches it saves (the three defaults, for example)
+_MIN_INDEXED_PATTERNS = 4
+
+# Leading \b, optionally a group opener, then a run of plain word characters
+_LITERAL_PREFIX_RE = re.compile(r"\\b(\((?:\?:)?)?(\w+)")
+
+
+def _scan_groups(pattern: str, start: int = 0) -> tuple[bool, int | None]:
+    """Scan ``pattern[start:]`` at group depth 0.
+
+    Returns whether a ``|`` occurs at that depth and the index of the ``)``
+    closing the enclosing group (None if the pattern ends first).
+    """
+    depth = 0
+    in_class = False
+    escaped = False
+    alternation = False
+    for index in range(start, len(pattern)):
+        char = pattern[index]
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            if depth == 0:
+                return alternation, index
+            depth -= 1
+        elif char == "|" and depth == 0:
+            alternation = True
+    return alternation, None
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    return _scan_groups(pattern)[0]
+
+
+def _literal_terms(pattern: str) -> list[str] | None:
+    """Return the words of a pure word-bounded ASCII literal pattern, else None."""
+    if not pattern.isascii():
+        return None
+    match = _LITERAL_TERMS_RE.fullmatch(pattern)
+    if match is None:
+        return None
+    opened, terms, closed = match.groups()
+    if bool(opened) != bool(closed):
+        return None
+    if "|" in terms and not opened:
+        return None
+    return [term.lower() for term in terms.split("|")]
+
+
+def _literal_prefix(pattern: str) -> str | None:
+    """Return the ASCII word prefix every match of the pattern must start with."""
+    if not pattern.isascii() or _has_top_level_alternation(pattern):
+        return None
+    match = _LITERAL_PREFIX_RE.match(pattern)
+    if match is None:
+        return None
+    opened, prefix = match.groups()
+    if opened:
+        # \b(tell\s+me ...)\b: the group must be mandatory and not alternate
+        alternation, close = _scan_groups(pattern, match.end(1))
+        if alternation or close is None:
+            return None
+        if pattern[close + 1 : close + 2] in ("*", "+", "?", "{"):
+            return None
+    if pattern[match.end() : match.end() + 1] in ("*", "+", "?", "{"):
+        prefix = prefix[:-1]
+    return prefix.lower() if len(prefix) >= 2 else None
+
+
+class PatternMatcher:
+    """Multi-pattern matcher compiled once per pattern set.
+
+    Scanning a transcript once per pattern is O(patterns x text). Most
+    operator-supplied patterns are word-bounded literal terms (slurs, PII
+    keywords) or start with a literal word, so they are indexed instead:
+
+    - ``\\bterm\\b`` / ``\\b(a|b)\\b`` patterns become a word → pattern lookup,
+      answered by tokenizing the transcript once into word runs.
+    - Patterns starting with ``\\b`` + a literal word (optionally inside a
+      leading group without alternation, like ``\\b(tell\\s+me ...)``) are only
+      run when some word in the transcript starts with that literal.
+    - Everything else is searched one by one, as before.
+
+    Sets with fewer than ``_MIN_INDEXED_PATTERNS`` indexable patterns are
+    searched one by one too, since the index only pays off past that point.
+
+    Only ASCII patterns are indexed, and only ASCII transcripts use the index:
+    ``str.lower()`` plus ``\\w+`` tokenization disagrees with ``re.IGNORECASE``
+    for some non-ASCII characters (``İ`` lowercases to two code points, for
+    example), so non-ASCII patterns always run one by one and a non-ASCII
+    transcript is searched with every pattern in order.
+
+    A single combined alternation was measured to be slower than the per-pattern
+    loop in CPython's backtracking ``re`` (it loses per-pattern literal prefix
+    scanning), so it is not used. The reported reason is always the first
+    pattern in list order that matches, identical to a sequential scan.
+    """
+
+    def __init__(self, patterns: list[tuple[str, str]]):
+        self._reasons: list[str] = []
+        self._compiled: list[re.Pattern[str]] = []
+        self._term_index: dict[str, int] = {}
+        self._prefix_index: dict[str, list[int]] = {}
+        self._sequential: list[int] = []
+
+        for name, pattern in patterns:
+            try:
+                compiled = re.compile(pattern, flags=re.IGNORECASE)
+            except re.error as exc:
+                logger.warning("Skipping invalid safety pattern %s: %s", name, exc)
+                continue
+
+            index = len(self._reasons)
+            self._reasons.append(name)
+            self._compiled.append(compiled)
+
+            terms = _literal_terms(pattern)
+            if terms is not None:
+                for term in terms:
+                    self._term_index.setdefault(term, index)
+                continue
+
+            prefix = _literal_prefix(pattern)
+            if prefix is not None:
+                self._prefix_index.setdefault(prefix, []).append(index)
+            else:
+                self._sequential.append(index)
+
+        if len(self._reasons) - len(self._sequential) < _MIN_INDEXED_PATTERNS:
+            self._term_index.clear()
+            self._prefix_index.clear()
+            self._sequential = list(range(len(self._reasons)))
+        self._prefix_lengths = sorted({len(p) for p in self._prefix_index})
+        self._needs_tokens = bool(self._term_index or self._prefix_index)
+
+    def __len__(self) -> int:
+        return len(self._reasons)
+
+    def search(self, text: str) -> str | None:
+        """Return the reason of the first matching pattern, or None."""
+        if not text.isascii():
+            for index, compiled in enumerate(self._compiled):
+                if compiled.search(text):
+                    return self._reasons[index]
+            return None
+
+        best = len(self._reasons)
+        candidates = self._sequential
+
+        if self._needs_tokens:
+            tokens = set(_WORD_RE.findall(text.lower()))
+            term_index = self._term_index
+            for token in tokens.intersection(term_index):
+                if term_index[token] < best:
+                    best = term_index[token]
+
+            if self._prefix_index:
+                prefixed: list[int] = []
+                for token in tokens:
+                    for length in self._prefix_lengths:
+                        if length > len(token):
+                            break
+                        hit = self._prefix_index.get(token[:length])
+                        if hit:
+                            prefixed.extend(hit)
+                if prefixed:
+                    candidates = sorted(set(prefixed).union(candidates))
+
+        for index in candidates:
+            if index >= best:
+                break
+            if self._compiled[index].search(text):
+                best = index
+                break
+
+        return self._reasons[best] if best < len(self._reasons) else None
+
+
 @dataclass(frozen=True)
 class SafetyCheckResult:
     """Result of safety validation for a transcript."""
@@ -22,7 +217,15 @@ class SafetyCheckResult:
 
 
 class SafetyFilter:
-    """Lightweight regex-based safety filter for transcript checks."""
+    """Lightweight regex-based safety filter for transcript checks.
+
+    With a ``patterns_file`` and ``reload_interval_seconds`` > 0, the file's
+    mtime/size is re-checked at most once per interval (triggered by
+    ``check_transcript``). A changed file is parsed and compiled on a background
+    thread and the new matcher is swapped in with a single reference
+    assignment, so checks never wait on compilation or see a partial set. If
+    the new file is missing or invalid, the last good set stays active.
+    """
 
     _DEFAULT_PATTERNS: tuple[tuple[str, str], ...] = (
         (
@@ -43,9 +246,15 @@ class SafetyFilter:
         self,
         enabled: bool = True,
         patterns_file: str | None = None,
+        reload_interval_seconds: float = 0.0,
     ) -> None:
         self._enabled = enabled
-        self._compiled_patterns = self._load_patterns(patterns_file)
+        self._patterns_file = patterns_file
+        self._reload_interval = reload_interval_seconds
+        self._reload_lock = threading.Lock()
+        self._next_reload_check = time.monotonic() + reload_interval_seconds
+        self._file_signature = self._stat_patterns_file()
+        self._matcher = self._load_patterns(patterns_file)
 
     @classmethod
     def from_settings(cls) -> "SafetyFilter":
@@ -54,6 +263,7 @@ class SafetyFilter:
         return cls(
             enabled=settings.safety_enabled,
             patterns_file=settings.safety_patterns_file,
+            reload_interval_seconds=settings.safety_patterns_reload_seconds,
         )
 
     def check_transcript(self, transcript: str) -> SafetyCheckResult:
@@ -65,15 +275,70 @@ class SafetyFilter:
         if not text:
             return SafetyCheckResult(is_safe=True)
 
-        for reason, pattern in self._compiled_patterns:
-            if pattern.search(text):
-                return SafetyCheckResult(is_safe=False, reason=reason)
+        if self._reload_interval > 0 and self._patterns_file:
+            self._schedule_reload_check()
+
+        reason = self._matcher.search(text)
+        if reason is not None:
+            return SafetyCheckResult(is_safe=False, reason=reason)
 
         return SafetyCheckResult(is_safe=True)
 
-    def _load_patterns(
-        self, patterns_file: str | None
-    ) -> list[tuple[str, re.Pattern[str]]]:
+    def reload_if_changed(self) -> bool:
+        """Recompile and swap in the patterns file if it changed on disk.
+
+        Returns True when a new pattern set was swapped in.
+        """
+        signature = self._stat_patterns_file()
+        if signature is None or signature == self._file_signature:
+            return False
+
+        loaded = self._load_patterns_from_file(self._patterns_file)
+        if not loaded:
+            logger.warning(
+                "Keeping previous safety patterns; reload of %s failed",
+                self._patterns_file,
+            )
+            self._file_signature = signature
+            return False
+
+        matcher = PatternMatcher(loaded)
+        self._file_signature = signature
+        self._matcher = matcher
+        logger.info(
+            "Reloaded %d safety patterns from %s", len(matcher), self._patterns_file
+        )
+        return True
+
+    def _schedule_reload_check(self) -> None:
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        self._next_reload_check = now + self._reload_interval
+        threading.Thread(
+            target=self._run_reload, name="voicemock-safety-reload", daemon=True
+        ).start()
+
+    def _run_reload(self) -> None:
+        try:
+            self.reload_if_changed()
+        except Exception:
+            logger.exception("Safety pattern reload failed")
+        finally:
+            self._reload_lock.release()
+
+    def _stat_patterns_file(self) -> tuple[int, int] | None:
+        if not self._patterns_file:
+            return None
+        try:
+            stat = Path(self._patterns_file).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_patterns(self, patterns_file: str | None) -> PatternMatcher:
         base_patterns = list(self._DEFAULT_PATTERNS)
 
         if patterns_file:
@@ -81,10 +346,7 @@ class SafetyFilter:
             if loaded:
                 base_patterns = loaded
 
-        return [
-            (name, re.compile(pattern, flags=re.IGNORECASE))
-            for name, pattern in base_patterns
-        ]
+        return PatternMatcher(base_patterns)
 
     def _load_patterns_from_file(
         self, patterns_file: str
@@ -6,7 +6,7 @@ from threading import Lock
 from typing import Optional
 
 from src.api.models.session_models import SessionStartRequest
-from src.domain.session_state import SessionState, TurnRecord
+from src.domain.session_state import SessionState, SummaryStatus, TurnRecord
 
 
 class SessionStore:
@@ -87,16 +87,92 @@ class SessionStore:
             if not session:
                 return None
 
-            # Update last_activity_at automatically unless explicitly provided
-            if "last_activity_at" not in updates:
-                updates["last_activity_at"] = datetime.now(timezone.utc)
+            self._apply_updates(session, updates)
+            return self._deep_copy_session(session)
 
-            # Apply updates
-            for key, value in updates.items():
-                if hasattr(session, key):
-                    setattr(session, key, value)
+    def append_turn(self, session_id: str, turn: TurnRecord, **updates) -> bool:
+        """
+        Append a turn to the stored history in place and update other fields.
 
-            return self._deep_copy_session(session)
+        Unlike update_session, the history is never rebuilt and no copy of
+        the session is returned, so recording a turn costs the same on the
+        twentieth turn as on the first.
+
+        Args:
+            session_id: The session identifier
+            turn: The completed turn
+            **updates: Other field names and values to update
+
+        Returns:
+            True if the session exists, False otherwise
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if not session:
+                return False
+            session.turn_history.append(turn)
+            self._apply_updates(session, updates)
+            return True
+
+    @staticmethod
+    def _apply_updates(session: SessionState, updates: dict) -> None:
+        # Update last_activity_at automatically unless explicitly provided
+        if "last_activity_at" not in updates:
+            updates["last_activity_at"] = datetime.now(timezone.utc)
+
+        for key, value in updates.items():
+            if hasattr(session, key):
+                setattr(session, key, value)
+
+    def set_rolling_summary(self, session_id: str, summary: dict) -> bool:
+        """
+        Store a newer running summary without touching other session fields.
+
+        Unlike update_session, this does not bump last_activity_at (it runs in
+        the background between turns) and ignores summaries covering fewer
+        turns than the stored one.
+
+        Args:
+            session_id: The session identifier
+            summary: Running summary dict including ``covered_turns``
+
+        Returns:
+            True if the summary was stored, False otherwise
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if not session:
+                return False
+            current = session.rolling_summary or {}
+            if summary.get("covered_turns", 0) <= current.get("covered_turns", 0):
+                return False
+            session.rolling_summary = summary
+            return True
+
+    def set_session_summary(
+        self, session_id: str, summary: dict | None, status: SummaryStatus
+    ) -> bool:
+        """
+        Store the end-of-session summary and its status.
+
+        Like set_rolling_summary, this does not bump last_activity_at since
+        background summary jobs finish after the final turn.
+
+        Args:
+            session_id: The session identifier
+            summary: Summary payload, or None if generation failed
+            status: Summary status ("pending", "ready" or "failed")
+
+        Returns:
+            True if the session exists, False otherwise
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if not session:
+                return False
+            session.session_summary = summary
+            session.summary_status = status
+            return True
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -151,18 +227,19 @@ class SessionStore:
             turn_count=session.turn_count,
             # Create a new list copy
             asked_questions=list(session.asked_questions),
-            turn_history=[
-                TurnRecord(
-                    turn_number=turn.turn_number,
-                    transcript=turn.transcript,
-                    assistant_text=turn.assistant_text,
-                    coaching_feedback=(
-                        dict(turn.coaching_feedback)
-                        if turn.coaching_feedback is not None
-                        else None
-                    ),
-                )
-                for turn in session.turn_history
-            ],
+            # TurnRecords are immutable, so copies share them
+            turn_history=list(session.turn_history),
+            rubric_scores=session.rubric_scores.copy(),
+            rolling_summary=(
+                dict(session.rolling_summary)
+                if session.rolling_summary is not None
+                else None
+            ),
+            session_summary=(
+                dict(session.session_summary)
+                if session.session_summary is not None
+                else None
+            ),
+            summary_status=session.summary_status,
             status=session.status,
         )
@@ -0,0 +1,71 @@
+"""Background end-of-session summary jobs.
+
+With ``session_summary_async`` enabled the final turn returns as soon as its
+closing text and TTS are ready, with ``summary_status: pending``. The summary
+is generated here, stored on the session, and fetched from
+``GET /session/{id}/summary``; clients can long-poll that endpoint, which
+waits on the job's completion event instead of re-reading the store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+
+from src.services.orchestrator import SessionSummaryRequest, summarize_session
+from src.services.session_store import SessionStore
+
+
+class SessionSummaryJobs:
+    """Runs deferred session summaries and wakes long-polling readers."""
+
+    def __init__(self) -> None:
+        self._done: dict[str, asyncio.Event] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def start(
+        self,
+        session_store: SessionStore,
+        session_id: str,
+        request: SessionSummaryRequest,
+    ) -> asyncio.Task:
+        """Generate and store a session's summary in the background."""
+        session_store.set_session_summary(session_id, None, "pending")
+        done = self._done.setdefault(session_id, asyncio.Event())
+        # Fresh context: the job outlives the request and gets its own trace
+        task = asyncio.get_running_loop().create_task(
+            self._run(session_store, session_id, request, done),
+            context=contextvars.Context(),
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def wait(self, session_id: str, timeout: float) -> None:
+        """Wait up to ``timeout`` seconds for a running job of the session."""
+        done = self._done.get(session_id)
+        if done is None or timeout <= 0:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(done.wait(), timeout)
+
+    async def _run(
+        self,
+        session_store: SessionStore,
+        session_id: str,
+        request: SessionSummaryRequest,
+        done: asyncio.Event,
+    ) -> None:
+        try:
+            summary = await summarize_session(request)
+            session_store.set_session_summary(
+                session_id, summary, "ready" if summary is not None else "failed"
+            )
+        except BaseException:
+            session_store.set_session_summary(session_id, None, "failed")
+            raise
+        finally:
+            if self._done.get(session_id) is done:
+                del self._done[session_id]
+            done.set()
@@ -5,6 +5,13 @@ from threading import Lock
 from typing import Optional
 
 
+def audio_media_type(audio_bytes: bytes) -> str:
+    """Deepgram returns MP3; the local eSpeak backend returns WAV."""
+    if audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE":
+        return "audio/wav"
+    return "audio/mpeg"
+
+
 class TTSCache:
     """Thread-safe in-memory cache for TTS audio bytes with TTL management.
 
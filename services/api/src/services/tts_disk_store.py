@@ -0,0 +1,236 @@
+"""Disk-backed TTS audio store shared by all workers on a host.
+
+``TTSCache`` keeps every reply in process memory, so memory grows with audio
+volume, replies are lost on restart and each worker only sees its own.
+``DiskTTSStore`` keeps the same TTL semantics on disk:
+
+- ``audio/<sha256>`` holds each distinct clip once (content-addressed, so a
+  repeated question reuses the file)
+- ``index/<sha256 of request_id>`` maps a request to its clip as a small JSON
+  document ``{"sha256", "media_type", "stored_at"}``
+
+Files are written to a temp name and renamed into place, so concurrent
+workers never see partial writes. ``store`` also sweeps expired files at most
+once per ``sweep_interval_seconds``, so the directory stays bounded even when
+no session is ever explicitly deleted. ``/tts/{request_id}`` serves the clip with
+``FileResponse`` (sendfile) instead of copying it through Python.
+
+All methods do blocking file I/O; call them via ``asyncio.to_thread`` from
+async code.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.services.tts_cache import audio_media_type
+
+logger = logging.getLogger(__name__)
+
+_SHA256_RE = re.compile(r"[0-9a-f]{64}")
+
+# Unreferenced clips outlive the TTL by this long, so a clip located just
+# before its entry expired is still on disk when the response opens it
+_CLIP_GRACE_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class StoredAudio:
+    """A stored TTS clip on disk."""
+
+    path: Path
+    media_type: str
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+class DiskTTSStore:
+    """Content-addressed TTS audio files with a per-request index and TTL.
+
+    Drop-in replacement for ``TTSCache`` (``store``/``get``/``cleanup``);
+    ``locate`` returns the file path for zero-copy serving.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl_seconds: int = 300,
+        sweep_interval_seconds: float | None = None,
+    ):
+        """Initialize the store, creating its directories if needed.
+
+        Args:
+            directory: Root directory; share it between workers on one host
+            ttl_seconds: Time-to-live for stored audio in seconds
+                (default: 300 = 5 minutes)
+            sweep_interval_seconds: Minimum time between the ``cleanup``
+                sweeps ``store`` runs (default: ``ttl_seconds``)
+        """
+        self._audio_dir = Path(directory) / "audio"
+        self._index_dir = Path(directory) / "index"
+        self._audio_dir.mkdir(parents=True, exist_ok=True)
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._sweep_interval = (
+            ttl_seconds if sweep_interval_seconds is None else sweep_interval_seconds
+        )
+        self._sweep_lock = threading.Lock()
+        self._next_sweep = time.monotonic() + self._sweep_interval
+
+    def _index_path(self, request_id: str) -> Path:
+        # Hashed so a request_id from the URL can never escape the directory
+        key = hashlib.sha256(request_id.encode("utf-8")).hexdigest()
+        return self._index_dir / key
+
+    def store(self, request_id: str, audio_bytes: bytes) -> None:
+        """Write the clip (if new) and index it under ``request_id``.
+
+        Args:
+            request_id: Unique request identifier (index key)
+            audio_bytes: Encoded audio (MP3 or WAV)
+        """
+        digest = hashlib.sha256(audio_bytes).hexdigest()
+        audio_path = self._audio_dir / digest
+        try:
+            # Refresh mtime so cleanup() doesn't race this new reference
+            os.utime(audio_path)
+        except FileNotFoundError:
+            # New clip, or one a concurrent cleanup just removed
+            _write_atomic(audio_path, audio_bytes)
+        entry = {
+            "sha256": digest,
+            "media_type": audio_media_type(audio_bytes),
+            "stored_at": time.time(),
+        }
+        _write_atomic(self._index_path(request_id), json.dumps(entry).encode())
+        self._maybe_sweep()
+
+    def _maybe_sweep(self) -> None:
+        # Non-blocking so only one caller per interval pays for the sweep
+        if time.monotonic() < self._next_sweep or not self._sweep_lock.acquire(
+            blocking=False
+        ):
+            return
+        try:
+            if time.monotonic() < self._next_sweep:
+                return
+            self._next_sweep = time.monotonic() + self._sweep_interval
+            try:
+                removed = self.cleanup()
+            except OSError:
+                logger.warning("TTS store sweep failed", exc_info=True)
+                return
+            if removed:
+                logger.info("TTS store sweep removed %d expired entries", removed)
+        finally:
+            self._sweep_lock.release()
+
+    def _read_entry(self, index_path: Path) -> Optional[dict]:
+        try:
+            entry = json.loads(index_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Unreadable TTS index entry: %s", index_path.name)
+            return None
+        if not (
+            isinstance(entry, dict)
+            and isinstance(entry.get("sha256"), str)
+            and _SHA256_RE.fullmatch(entry["sha256"])
+            and isinstance(entry.get("media_type"), str)
+            and isinstance(entry.get("stored_at"), (int, float))
+        ):
+            logger.warning("Malformed TTS index entry: %s", index_path.name)
+            return None
+        return entry
+
+    def locate(self, request_id: str) -> Optional[StoredAudio]:
+        """Find the stored clip for ``request_id`` if not expired.
+
+        Expired index entries are removed on access, like ``TTSCache.get``.
+
+        Returns:
+            StoredAudio with the file path and media type, None otherwise
+        """
+        index_path = self._index_path(request_id)
+        entry = self._read_entry(index_path)
+        if entry is None:
+            return None
+        if time.time() - entry["stored_at"] > self._ttl_seconds:
+            index_path.unlink(missing_ok=True)
+            return None
+        audio_path = self._audio_dir / entry["sha256"]
+        if not audio_path.is_file():
+            return None
+        return StoredAudio(path=audio_path, media_type=entry["media_type"])
+
+    def get(self, request_id: str) -> Optional[bytes]:
+        """Read the stored clip for ``request_id`` if not expired.
+
+        Returns:
+            Audio bytes if found and not expired, None otherwise
+        """
+        stored = self.locate(request_id)
+        if stored is None:
+            return None
+        try:
+            return stored.path.read_bytes()
+        except FileNotFoundError:  # removed by a concurrent cleanup
+            return None
+
+    def cleanup(self) -> int:
+        """Remove expired index entries and clips no entry refers to.
+
+        Safe to run from several workers at once.
+
+        Returns:
+            Number of expired index entries removed
+        """
+        now = time.time()
+        removed = 0
+        live: set[str] = set()
+        for index_path in self._index_dir.iterdir():
+            if index_path.name.startswith(".tmp-"):
+                self._unlink_if_stale(index_path, now)  # left by a crashed write
+                continue
+            entry = self._read_entry(index_path)
+            if entry is None:
+                # Unreadable or malformed; never matches, so drop it eventually
+                self._unlink_if_stale(index_path, now)
+                continue
+            if now - entry["stored_at"] > self._ttl_seconds:
+                index_path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                live.add(entry["sha256"])
+
+        for audio_path in self._audio_dir.iterdir():
+            if audio_path.name not in live:
+                # Recent clips may belong to a store() whose index entry
+                # isn't written yet, or to a response about to open them
+                self._unlink_if_stale(audio_path, now, grace=_CLIP_GRACE_SECONDS)
+        return removed
+
+    def _unlink_if_stale(self, path: Path, now: float, grace: float = 0) -> None:
+        try:
+            if now - path.stat().st_mtime > self._ttl_seconds + grace:
+                path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
@@ -4,7 +4,10 @@ This module provides application configuration via pydantic-settings,
 allowing settings to be loaded from environment variables and .env files.
 """
 
+import os
+import tempfile
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -25,14 +28,121 @@ class Settings(BaseSettings):
         secret_key: Secret key for session token signing (REQUIRED, no default)
         session_ttl_minutes: Session time-to-live in minutes (default: 60)
         deepgram_api_key: Deepgram API key for STT (REQUIRED at runtime for /turn)
+        deepgram_base_url: Deepgram API origin (default: https://api.deepgram.com)
         stt_timeout_seconds: Timeout for STT requests in seconds (default: 30)
+        stt_backend: "deepgram" (hosted Nova-2) or "local" (offline Vosk;
+            requires the vosk package) (default: deepgram)
+        local_stt_model_path: Unpacked Vosk model directory (default: None =
+            Vosk's small English model, downloaded on first use)
+        local_stt_ffmpeg_executable: ffmpeg binary the local backend uses to
+            decode uploads other than mono 16-bit WAV, such as the mobile
+            client's AAC .m4a (default: ffmpeg)
+        max_upload_bytes: Largest accepted /turn request body; checked against
+            Content-Length up front and while streaming (default: 25 MiB)
+        upload_read_timeout_seconds: Longest wait for the next chunk of a /turn
+            upload before it is rejected with upload_timeout (default: 15)
+        upload_total_timeout_seconds: Longest time to receive a whole /turn
+            upload, however steadily it trickles in, before it is rejected
+            with upload_timeout (default: 60)
+        audio_spool_memory_bytes: Uploads larger than this are spooled to a
+            memory-mapped temp file and streamed to STT instead of being held
+            as bytes; either way the audio is released once STT finishes
+            (default: 1 MiB)
+        audio_silence_check_enabled: Reject WAV/L16 uploads that are too short or
+            silent with stt_empty_transcript before calling STT (default: True)
+        audio_min_duration_ms: Shortest accepted recording (default: 300)
+        audio_silence_threshold_dbfs: Recordings whose loudest 20 ms frame is
+            below this level are treated as silent (default: -50)
+        audio_preprocessing_enabled: Trim silence from WAV/L16 uploads, downmix
+            them to mono and resample to audio_target_sample_rate before STT
+            (default: False). Other formats pass through untouched; the mobile
+            client records AAC .m4a, so neither this nor the silence check
+            applies to its uploads
+        audio_target_sample_rate: Sample rate uploads are downsampled to
+            (default: 16000)
+        audio_vad_threshold_db: Frames quieter than this, relative to the
+            loudest frame, count as silence when trimming (default: -35)
         groq_api_key: Groq API key for LLM (REQUIRED at runtime for /turn)
+        groq_base_url: Groq API origin override (default: None = Groq public API)
         llm_model: Groq model to use (default: llama-3.3-70b-versatile)
         llm_timeout_seconds: Timeout for LLM requests in seconds (default: 30)
         llm_max_tokens: Maximum tokens for LLM response (default: 400)
+        summary_mode: "final" builds the session summary from the full history on
+            the last turn; "rolling" keeps a running summary updated in the
+            background after each turn so the last turn only merges it
+        rolling_summary_final_wait_seconds: Longest the final turn waits for a
+            queued rolling summary update before merging from the last
+            completed one (default: 2)
+        session_summary_async: Return the final turn without waiting for the
+            session summary; clients fetch it from GET /session/{id}/summary
+            (default: False)
+        session_summary_max_wait_seconds: Longest a summary request may
+            long-poll for a pending summary (default: 25)
+        llm_response_mode: "buffered" waits for the complete follow-up JSON;
+            "streaming" streams it and starts TTS for the question as soon as
+            that field is complete; "split" runs a short question-only call in
+            parallel with a separate coaching call, so TTS starts on the
+            question while coaching is still being written (default: buffered)
+        llm_question_max_tokens: Maximum tokens for the question-only call in
+            split mode (default: 120)
+        llm_cache_enabled: Serve repeated identical follow-up and summary
+            requests from an in-memory response cache (default: False)
+        llm_cache_max_entries: Cached LLM responses kept before LRU eviction
+            (default: 512)
+        llm_cache_ttl_seconds: TTL for cached LLM responses (default: 600)
+        llm_router_enabled: Route LLM calls between llm_fast_model (follow-up
+            questions) and llm_model (summaries, coaching) by live p95 latency
+            and error rate, falling back to the other model (default: False)
+        llm_fast_model: Small model preferred for follow-up questions when
+            routing is enabled (default: llama-3.1-8b-instant)
+        llm_router_latency_budget_ms: p95 follow-up latency above which a
+            model is considered slow for follow-up questions and the other one
+            is preferred (default: 2500)
+        llm_router_summary_latency_budget_ms: The same budget for summary and
+            coaching calls, which are tracked separately (default: 10000)
+        llm_router_max_error_rate: Error rate above which a model is considered
+            unhealthy (default: 0.5)
+        llm_router_cooldown_seconds: How long a rate-limited model is skipped
+            (default: 30)
+        llm_router_window: Recent calls per model used for p95 and error rate
+            (default: 50)
+        llm_context_budget_tokens: Token budget for prompt context that grows with
+            the session (asked questions, summary turn history) (default: 1500)
         tts_timeout_seconds: Timeout for TTS requests in seconds (default: 30)
         tts_model: Deepgram Aura voice model (default: aura-2-thalia-en)
         tts_cache_ttl_seconds: TTL for cached TTS audio (default: 300 = 5 min)
+        tts_store_backend: "memory" (per-process TTSCache) or "disk"
+            (content-addressed files under tts_store_dir, shared by all
+            workers on the host and served with sendfile) (default: memory)
+        tts_store_dir: Root directory of the disk TTS store (default:
+            voicemock-tts under the system temp directory)
+        tts_backend: "deepgram" (hosted Aura, MP3) or "local" (offline eSpeak NG,
+            WAV) (default: deepgram)
+        local_tts_voice: eSpeak NG voice for the local backend (default: en-us)
+        local_tts_words_per_minute: Local TTS speaking rate (default: 175)
+        local_tts_executable: eSpeak NG binary (default: espeak-ng)
+        safety_enabled: Run the transcript safety filter before the LLM (default: True)
+        safety_patterns_file: JSON pattern list replacing the built-in safety patterns
+        safety_patterns_reload_seconds: How often to re-check the patterns file for
+            changes; 0 disables hot reload (default: 5)
+        safety_check_concurrent: Start the LLM call while the regex safety check
+            runs and cancel it on refusal; ignored while the safety classifier
+            is enabled, which must clear a turn before any LLM call
+            (default: False)
+        safety_classifier_model_file: JSON model for the local safety classifier;
+            unset disables the classifier stage
+        safety_classifier_threshold: Harm probability at or above which a turn is
+            refused (default: 0.8)
+        safety_classifier_batch_size: Max transcripts scored per classifier batch
+        safety_classifier_batch_wait_ms: Max time a transcript waits for its batch
+        tracing_enabled: Record pipeline spans (default: False)
+        tracing_sample_ratio: Fraction of traces to record, 0.0-1.0 (default: 1.0)
+        tracing_export_path: OTLP/JSON lines file that finished traces are appended to
+        profiling_enabled: Expose the sampling profiler at /debug/profile (default: False)
+        profiling_token: Shared secret required in X-Profiling-Token; the
+            profiler answers 403 until it is set
+        profiling_continuous: Keep a low-rate sampler running for the process lifetime
+        profiling_continuous_interval_ms: Sampling interval of the continuous sampler
     """
 
     app_name: str = "VoiceMock AI Interview Coach API"
@@ -41,16 +151,67 @@ class Settings(BaseSettings):
     secret_key: str = Field(default="", min_length=1)  # REQUIRED - must be non-empty
     session_ttl_minutes: int = 60
     deepgram_api_key: str = Field(default="")  # REQUIRED at runtime for /turn endpoint
+    deepgram_base_url: str = "https://api.deepgram.com"
     stt_timeout_seconds: int = 30
+    stt_backend: Literal["deepgram", "local"] = "deepgram"
+    local_stt_model_path: str | None = None
+    local_stt_ffmpeg_executable: str = "ffmpeg"
+    max_upload_bytes: int = Field(default=25 * 1024 * 1024, ge=1024)
+    upload_read_timeout_seconds: float = Field(default=15.0, gt=0.0)
+    upload_total_timeout_seconds: float = Field(default=60.0, gt=0.0)
+    audio_spool_memory_bytes: int = Field(default=1024 * 1024, ge=0)
+    audio_silence_check_enabled: bool = True
+    audio_min_duration_ms: float = Field(default=300.0, ge=0.0)
+    audio_silence_threshold_dbfs: float = Field(default=-50.0, lt=0.0)
+    audio_preprocessing_enabled: bool = False
+    audio_target_sample_rate: int = Field(default=16000, ge=8000, le=48000)
+    audio_vad_threshold_db: float = Field(default=-35.0, lt=0.0)
     groq_api_key: str = Field(default="")  # REQUIRED at runtime for /turn endpoint
+    groq_base_url: str | None = None
     llm_model: str = "llama-3.3-70b-versatile"
     llm_timeout_seconds: int = 30
     llm_max_tokens: int = 400
+    llm_response_mode: Literal["buffered", "streaming", "split"] = "buffered"
+    llm_question_max_tokens: int = Field(default=120, ge=16)
+    llm_cache_enabled: bool = False
+    llm_cache_max_entries: int = Field(default=512, ge=1)
+    llm_cache_ttl_seconds: float = Field(default=600.0, gt=0.0)
+    llm_router_enabled: bool = False
+    llm_fast_model: str = "llama-3.1-8b-instant"
+    llm_router_latency_budget_ms: float = Field(default=2500.0, gt=0.0)
+    llm_router_summary_latency_budget_ms: float = Field(default=10000.0, gt=0.0)
+    llm_router_max_error_rate: float = Field(default=0.5, gt=0.0, le=1.0)
+    llm_router_cooldown_seconds: float = Field(default=30.0, ge=0.0)
+    llm_router_window: int = Field(default=50, ge=5)
+    llm_context_budget_tokens: int = Field(default=1500, ge=100)
+    summary_mode: Literal["final", "rolling"] = "final"
+    rolling_summary_final_wait_seconds: float = Field(default=2.0, ge=0.0)
+    session_summary_async: bool = False
+    session_summary_max_wait_seconds: float = Field(default=25.0, ge=0.0)
     tts_timeout_seconds: int = 30
     tts_model: str = "aura-2-thalia-en"
     tts_cache_ttl_seconds: int = 300
+    tts_store_backend: Literal["memory", "disk"] = "memory"
+    tts_store_dir: str = os.path.join(tempfile.gettempdir(), "voicemock-tts")
+    tts_backend: Literal["deepgram", "local"] = "deepgram"
+    local_tts_voice: str = "en-us"
+    local_tts_words_per_minute: int = Field(default=175, ge=80, le=450)
+    local_tts_executable: str = "espeak-ng"
     safety_enabled: bool = True
     safety_patterns_file: str | None = None
+    safety_patterns_reload_seconds: float = Field(default=5.0, ge=0.0)
+    safety_check_concurrent: bool = False
+    safety_classifier_model_file: str | None = None
+    safety_classifier_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
+    safety_classifier_batch_size: int = Field(default=16, ge=1)
+    safety_classifier_batch_wait_ms: float = Field(default=5.0, ge=0.0)
+    tracing_enabled: bool = False
+    tracing_sample_ratio: float = Field(default=1.0, ge=0.0, le=1.0)
+    tracing_export_path: str | None = None
+    profiling_enabled: bool = False
+    profiling_token: str | None = None
+    profiling_continuous: bool = False
+    profiling_continuous_interval_ms: int = Field(default=50, ge=1)
 
     model_config = {
         "env_file": ".env",
@@ -71,3 +71,26 @@ async def test_405_returns_envelope():
     assert data["error"]["code"] == "http_error"
     assert "Method Not Allowed" in data["error"]["message_safe"]
     assert data["request_id"] is not None
+
+
+@pytest.mark.asyncio
+async def test_oversized_upload_returns_envelope_with_request_id():
+    """Test that upload limit rejections carry the request ID."""
+
+    async def body():
+        yield b"x" * (26 * 1024 * 1024)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/turn",
+            content=body(),
+            headers={"Content-Type": "multipart/form-data; boundary=x"},
+        )
+
+    assert response.status_code == 413
+    data = response.json()
+
+    assert data["error"]["code"] == "file_too_large"
+    assert data["error"]["stage"] == "upload"
+    assert data["request_id"] == response.headers["X-Request-ID"]
@@ -0,0 +1,94 @@
+"""Smoke tests for the load-test harness and stub providers."""
+
+import httpx
+import pytest
+
+from benchmarks.loadtest import (
+    LoadTestConfig,
+    LoadTestReport,
+    check_budgets,
+    drive,
+    percentile,
+    run_in_process,
+)
+from benchmarks.stub_providers import StubConfig, StubProfile
+
+
+def _fast_stubs(**overrides) -> StubConfig:
+    profiles = {"stt": StubProfile(), "llm": StubProfile(), "tts": StubProfile()}
+    profiles.update(overrides)
+    return StubConfig(seed=7, **profiles)
+
+
+@pytest.mark.asyncio
+async def test_in_process_run_drives_full_interviews_through_stubs():
+    """Test interviews run start → turn × k → tts against real providers."""
+    config = LoadTestConfig(interviews=2, turns_per_interview=2, concurrency=2)
+
+    report = await run_in_process(config, _fast_stubs())
+
+    assert report.errors == {}
+    assert report.turns_ok == 4
+    assert report.upstream_requests["stt"] == 4
+    assert report.upstream_requests["tts"] == 4
+    # Two follow-ups plus one final summary call per interview
+    assert report.upstream_requests["llm"] == 6
+    assert {"stage.stt_ms", "stage.llm_ms", "client.tts_fetch"} <= set(
+        report.percentiles()
+    )
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_surface_as_turn_error_codes():
+    """Test a failing STT profile is reported by stage-aware error code."""
+    config = LoadTestConfig(interviews=1, turns_per_interview=1, concurrency=1)
+
+    report = await run_in_process(config, _fast_stubs(stt=StubProfile(error_rate=1.0)))
+
+    assert report.errors == {"stt_provider_error": 1}
+
+
+@pytest.mark.asyncio
+async def test_each_interview_keeps_its_own_client():
+    """Test an interview's requests share one client (one worker connection)."""
+    paths_by_client: list[list[str]] = []
+
+    def open_client() -> httpx.AsyncClient:
+        paths: list[str] = []
+        paths_by_client.append(paths)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/session/start":
+                data = {"session_id": "s", "session_token": "t"}
+            else:
+                data = {"timings": {"total_ms": 1.0}, "tts_audio_url": None}
+            return httpx.Response(200, json={"data": data, "error": None})
+
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://test"
+        )
+
+    config = LoadTestConfig(interviews=3, turns_per_interview=2, concurrency=3)
+    report = await drive(open_client, config)
+
+    assert report.turns_ok == 6
+    assert paths_by_client == [["/session/start", "/turn", "/turn"]] * 3
+
+
+def test_check_budgets_flags_slow_p95():
+    report = LoadTestReport(stage_timings_ms={"total_ms": [100.0] * 19 + [900.0]})
+    report.requests = 20
+
+    assert check_budgets(report, {"total_ms": 1000.0}, max_error_rate=0.0) == []
+    assert check_budgets(report, {"total_ms": 50.0}, max_error_rate=None) == [
+        "stage.total_ms: p95 100.0ms > 50.0ms"
+    ]
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
@@ -0,0 +1,25 @@
+"""Integration tests for the /metrics endpoint."""
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from src.main import app
+from src.observability.metrics import turn_stage_latency
+
+
+@pytest.mark.asyncio
+async def test_metrics_returns_prometheus_text():
+    """Test /metrics serves recorded stage histograms as plain text."""
+    turn_stage_latency().observe(120.0, stage="llm", model="test-model", outcome="ok")
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE voicemock_turn_stage_duration_ms histogram" in response.text
+    assert (
+        'voicemock_turn_stage_duration_ms_count{stage="llm",model="test-model",'
+        'outcome="ok"}' in response.text
+    )
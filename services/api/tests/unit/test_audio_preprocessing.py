@@ -0,0 +1,187 @@
+"""Tests for pre-STT audio preprocessing."""
+
+import io
+import tracemalloc
+import wave
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from src.providers.llm_groq import LLMResponse
+from src.services.audio_preprocessing import (
+    decode_pcm,
+    measure_audio,
+    preprocess_audio,
+    resample,
+    trim_silence,
+)
+from src.services.orchestrator import process_turn
+from src.settings.config import Settings
+
+
+def _tone(seconds: float, rate: int, freq: float = 440.0, amp: float = 0.5):
+    t = np.arange(int(seconds * rate)) / rate
+    return (amp * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _wav(samples: np.ndarray, rate: int, sample_width: int = 2) -> bytes:
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    scale = 2 ** (8 * sample_width - 1) - 1
+    ints = np.round(samples * scale).astype(np.int32)
+    if sample_width == 2:
+        frames = ints.astype("<i2").tobytes()
+    else:  # 24-bit little-endian
+        frames = ints.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(samples.shape[1])
+        wav.setsampwidth(sample_width)
+        wav.setframerate(rate)
+        wav.writeframes(frames)
+    return buffer.getvalue()
+
+
+def _padded_speech(rate: int) -> np.ndarray:
+    silence = np.zeros(int(1.5 * rate), dtype=np.float32)
+    return np.concatenate([silence, _tone(1.0, rate), silence])
+
+
+def test_trims_downmixes_and_resamples_stereo_wav() -> None:
+    mono = _padded_speech(48000)
+    upload = _wav(np.stack([mono, mono], axis=1), 48000)
+
+    result = preprocess_audio(upload, "audio/wav")
+
+    assert result.applied is True
+    assert result.mime_type == "audio/wav"
+    assert result.original_bytes == len(upload)
+    assert len(result.audio_bytes) < len(upload) / 10
+    with wave.open(io.BytesIO(result.audio_bytes), "rb") as wav:
+        assert (wav.getnchannels(), wav.getframerate()) == (1, 16000)
+        duration = wav.getnframes() / 16000
+    assert 1.0 <= duration <= 1.5  # speech plus padding, silence gone
+    assert result.trimmed_ms == pytest.approx(2600, abs=50)
+
+
+def test_compressed_uploads_pass_through() -> None:
+    upload = b"\x1aE\xdf\xa3webm-bytes"
+
+    result = preprocess_audio(upload, "audio/webm")
+
+    assert result.applied is False
+    assert result.audio_bytes is upload
+    assert result.mime_type == "audio/webm"
+
+
+def test_upload_that_would_not_shrink_is_kept() -> None:
+    upload = _wav(_tone(1.0, 16000), 16000)
+
+    result = preprocess_audio(upload, "audio/wav")
+
+    assert result.applied is False
+    assert result.audio_bytes is upload
+
+
+def test_decodes_24_bit_wav_and_l16() -> None:
+    tone = _tone(0.1, 8000)
+    samples, rate = decode_pcm(_wav(tone, 8000, sample_width=3), "audio/wav")
+    assert rate == 8000
+    assert np.allclose(samples[:, 0], tone, atol=1e-4)
+
+    l16 = (np.round(tone * 32767).astype(">i2")).tobytes()
+    samples, rate = decode_pcm(l16, "audio/L16; rate=8000; channels=1")
+    assert rate == 8000
+    assert np.allclose(samples[:, 0], tone, atol=1e-3)
+
+
+def test_all_silent_audio_is_not_trimmed() -> None:
+    silence = np.zeros(16000, dtype=np.float32)
+
+    assert len(trim_silence(silence, 16000)) == 16000
+
+
+def test_resampling_filters_frequencies_above_new_nyquist() -> None:
+    speech_band, _ = resample(_tone(0.5, 48000, freq=1000), 48000)
+    ultrasonic, _ = resample(_tone(0.5, 48000, freq=15000), 48000)
+
+    assert np.sqrt(np.mean(speech_band**2)) > 0.3
+    assert np.sqrt(np.mean(ultrasonic**2)) < 0.05
+
+
+@dataclass
+class MockSessionState:
+    session_id: str
+    turn_count: int
+    last_activity_at: datetime
+
+
+@pytest.mark.asyncio
+async def test_process_turn_sends_preprocessed_audio_to_stt() -> None:
+    upload = _wav(_padded_speech(44100), 44100)
+    stt = AsyncMock()
+    stt.transcribe_audio.return_value = "I built the pipeline."
+    llm = AsyncMock()
+    llm.generate_follow_up.return_value = LLMResponse(follow_up_question="Why?")
+    tts = AsyncMock()
+    tts.synthesize.return_value = b"audio"
+
+    with (
+        patch(
+            "src.services.orchestrator.get_settings",
+            return_value=Settings(audio_preprocessing_enabled=True),
+        ),
+        patch("src.services.orchestrator.get_stt_provider", return_value=stt),
+        patch("src.services.orchestrator.get_llm_provider", return_value=llm),
+        patch("src.services.orchestrator.get_tts_provider", return_value=tts),
+    ):
+        result = await process_turn(
+            audio_bytes=upload,
+            mime_type="audio/wav",
+            session=MockSessionState("s", 0, datetime.now(timezone.utc)),
+            role="backend developer",
+            interview_type="technical interview",
+            difficulty="mid-level",
+            asked_questions=[],
+            question_count=5,
+            tts_cache=Mock(),
+            request_id="req-preprocess",
+        )
+
+    sent, mime_type = stt.transcribe_audio.call_args.args
+    assert mime_type == "audio/wav"
+    assert len(sent) < len(upload) / 5
+    assert result.timings["preprocess_ms"] > 0
+
+
+def test_measure_audio_reports_duration_and_peak_level() -> None:
+    level = measure_audio(_wav(_tone(0.5, 16000, amp=0.1), 16000), "audio/wav")
+
+    assert level.duration_ms == pytest.approx(500)
+    assert level.peak_rms_dbfs == pytest.approx(-23.0, abs=0.5)  # 0.1 / sqrt(2)
+    assert measure_audio(b"opaque", "audio/webm") is None
+
+
+def test_measure_audio_walks_long_recordings_in_blocks() -> None:
+    quiet = _tone(30.0, 48000, amp=0.01)
+    quiet[100_000:101_000] = 0.8  # short loud burst between block boundaries
+    upload = _wav(np.stack([quiet, quiet], axis=1), 48000)
+    l16 = (np.round(quiet * 32767).astype(">i2")).tobytes()
+
+    tracemalloc.start()
+    try:
+        level = measure_audio(upload, "audio/wav")
+        _, peak_alloc = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert level.duration_ms == pytest.approx(30000)
+    assert level.peak_rms_dbfs > -10
+    # A whole-file float32 decode would allocate over twice the upload size
+    assert peak_alloc < len(upload) / 3
+    l16_level = measure_audio(l16, "audio/L16; rate=48000")
+    assert l16_level.duration_ms == pytest.approx(30000)
+    assert l16_level.peak_rms_dbfs == pytest.approx(level.peak_rms_dbfs, abs=0.1)
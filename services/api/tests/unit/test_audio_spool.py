@@ -0,0 +1,194 @@
+"""Tests for upload spooling and early release of audio buffers."""
+
+import io
+import mmap
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pytest
+from fastapi import UploadFile
+
+from src.providers.audio_buffer import iter_chunks
+from src.providers.stt_deepgram import DeepgramSTTProvider
+from src.services.audio_preprocessing import decode_pcm, encode_wav
+from src.services import audio_spool
+from src.services.audio_spool import SpooledAudio, spool_upload
+from src.services.orchestrator import process_turn
+
+
+@dataclass
+class MockSessionState:
+    """Mock session state for testing."""
+
+    session_id: str
+    turn_count: int
+    last_activity_at: datetime
+
+
+def _upload(data: bytes) -> UploadFile:
+    # Starlette spools multipart files the same way (1 MiB in memory)
+    file = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    file.write(data)
+    file.seek(0)
+    return UploadFile(file=file, size=len(data), filename="answer.wav")
+
+
+@pytest.mark.asyncio
+async def test_small_upload_stays_in_memory() -> None:
+    upload = _upload(b"x" * 100)
+
+    spooled = await spool_upload(upload, memory_limit_bytes=1024)
+
+    assert not spooled.on_disk
+    assert spooled.buffer == b"x" * 100
+    assert upload.file.closed
+
+
+@pytest.mark.asyncio
+async def test_large_upload_is_memory_mapped_and_released() -> None:
+    data = bytes(range(256)) * 1024
+    spooled = await spool_upload(_upload(data), memory_limit_bytes=1024)
+
+    assert spooled.on_disk
+    assert isinstance(spooled.buffer, mmap.mmap)
+    assert spooled.buffer[:] == data
+    assert len(spooled) == len(data)
+
+    spooled.close()
+    spooled.close()  # idempotent
+
+    assert spooled.closed
+    assert len(spooled) == 0
+    with pytest.raises(ValueError):
+        spooled.buffer
+
+
+@pytest.mark.asyncio
+async def test_large_upload_maps_the_upload_file_without_copying() -> None:
+    data = b"z" * 4096
+    upload = _upload(data)
+
+    with patch.object(
+        audio_spool, "_copy_to_temp_file", side_effect=AssertionError("copied")
+    ):
+        spooled = await spool_upload(upload, memory_limit_bytes=1024)
+
+    assert spooled.buffer[:] == data
+    assert not upload.file.closed  # owned by the spool now
+    spooled.close()
+    assert upload.file.closed
+
+
+@pytest.mark.asyncio
+async def test_upload_without_descriptor_is_copied_to_temp_file() -> None:
+    data = b"y" * 4096
+    upload = UploadFile(file=io.BytesIO(data), size=len(data), filename="a.wav")
+
+    spooled = await spool_upload(upload, memory_limit_bytes=1024)
+
+    assert spooled.on_disk
+    assert spooled.buffer[:] == data
+    assert upload.file.closed
+    spooled.close()
+
+
+@pytest.mark.asyncio
+async def test_mapped_wav_decodes_like_bytes() -> None:
+    wav = encode_wav(np.linspace(-0.5, 0.5, 16000, dtype=np.float32), 16000)
+    spooled = await spool_upload(_upload(wav), memory_limit_bytes=0)
+
+    from_map = decode_pcm(spooled.buffer, "audio/wav")
+    from_bytes = decode_pcm(wav, "audio/wav")
+
+    assert from_map[1] == from_bytes[1] == 16000
+    np.testing.assert_array_equal(from_map[0], from_bytes[0])
+    spooled.close()
+
+
+@pytest.mark.asyncio
+async def test_deepgram_streams_mapped_audio_in_chunks() -> None:
+    data = b"a" * 200_000
+    spooled = await spool_upload(_upload(data), memory_limit_bytes=0)
+    provider = DeepgramSTTProvider(api_key="test_key")
+    response = Mock()
+    response.json.return_value = {
+        "results": {"channels": [{"alternatives": [{"transcript": "hello"}]}]}
+    }
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        client = AsyncMock()
+        mock_client_class.return_value.__aenter__.return_value = client
+        client.post = AsyncMock(return_value=response)
+
+        transcript = await provider.transcribe_audio(spooled.buffer, "audio/wav")
+
+    assert transcript == "hello"
+    kwargs = client.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Length"] == str(len(data))
+    chunks = [chunk async for chunk in kwargs["content"]]
+    assert len(chunks) > 1
+    assert b"".join(chunks) == data
+    spooled.close()
+
+
+@pytest.mark.asyncio
+async def test_chunks_cover_in_memory_audio() -> None:
+    chunks = [chunk async for chunk in iter_chunks(b"abcdefg", chunk_size=3)]
+
+    assert chunks == [b"abc", b"def", b"g"]
+
+
+@pytest.mark.asyncio
+async def test_process_turn_releases_spooled_audio_after_stt() -> None:
+    spooled = await spool_upload(_upload(b"w" * 4096), memory_limit_bytes=0)
+    seen: dict = {}
+
+    async def transcribe_audio(audio, mime_type):
+        seen["mapped"] = isinstance(audio, mmap.mmap)
+        return "I profiled the service first."
+
+    async def synthesize(text):
+        seen["closed_before_tts"] = spooled.closed
+        return b"mp3"
+
+    stt = Mock(transcribe_audio=transcribe_audio)
+    llm = AsyncMock()
+    llm.generate_follow_up.return_value = "What did you find?"
+    tts = Mock(synthesize=synthesize)
+    session = MockSessionState(
+        session_id="test-session",
+        turn_count=0,
+        last_activity_at=datetime.now(timezone.utc),
+    )
+
+    with (
+        patch("src.services.orchestrator.get_stt_provider", return_value=stt),
+        patch("src.services.orchestrator.get_llm_provider", return_value=llm),
+        patch("src.services.orchestrator.get_tts_provider", return_value=tts),
+    ):
+        result = await process_turn(
+            spooled,
+            "audio/webm",
+            session,
+            "backend developer",
+            "technical interview",
+            "mid-level",
+            [],
+            5,
+            Mock(),
+        )
+
+    assert result.transcript == "I profiled the service first."
+    assert seen == {"mapped": True, "closed_before_tts": True}
+    assert spooled.closed
+
+
+def test_in_memory_spool_drops_bytes_on_close() -> None:
+    spooled = SpooledAudio(data=b"abc")
+
+    spooled.close()
+
+    assert spooled.closed
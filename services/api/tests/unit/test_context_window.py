@@ -0,0 +1,107 @@
+"""Tests for token-budgeted LLM prompt context."""
+
+import json
+
+from src.providers.context_window import (
+    estimate_tokens,
+    fit_asked_questions,
+    fit_turn_history,
+)
+from src.providers.llm_groq import GroqLLMProvider
+
+
+def _turn(number: int) -> dict:
+    return {
+        "turn_number": number,
+        "transcript": " ".join(f"word{i}" for i in range(120)),
+        "assistant_text": f"Question {number}: tell me about a time you handled conflict?",
+        "coaching_feedback": {
+            "dimensions": [
+                {"label": "Clarity", "score": 4, "tip": "Lead with the outcome."},
+                {"label": "Relevance", "score": 5, "tip": "Strong role alignment."},
+                {"label": "Structure", "score": 2, "tip": "Name each STAR step."},
+                {"label": "Filler Words", "score": 3, "tip": "Pause instead of um."},
+            ],
+            "summary_tip": "Quantify impact early.",
+        },
+    }
+
+
+AVERAGES = {"clarity": 4.0, "relevance": 5.0, "structure": 2.0, "filler_words": 3.0}
+
+
+def test_estimate_tokens_is_roughly_four_chars_per_token() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("a" * 401) == 101
+
+
+def test_fit_asked_questions_keeps_most_recent() -> None:
+    questions = [f"Question number {i} about your experience?" for i in range(50)]
+
+    kept, omitted = fit_asked_questions(questions, budget_tokens=60)
+
+    assert kept == questions[-len(kept) :]
+    assert omitted == 50 - len(kept)
+    assert 0 < len(kept) < 50
+    assert fit_asked_questions(questions[:3], budget_tokens=60) == (questions[:3], 0)
+
+
+def test_fit_turn_history_returns_short_history_unchanged() -> None:
+    history = [_turn(1)]
+
+    fitted, dropped = fit_turn_history(history, AVERAGES, budget_tokens=10_000)
+
+    assert fitted is history
+    assert dropped == 0
+
+
+def test_fit_turn_history_keeps_weak_dimension_evidence() -> None:
+    history = [_turn(i) for i in range(1, 6)]
+    full_tokens = estimate_tokens(json.dumps(history))
+
+    fitted, dropped = fit_turn_history(history, AVERAGES, budget_tokens=full_tokens - 1)
+
+    assert dropped == 0
+    feedback = fitted[0]["coaching_feedback"]
+    assert feedback["scores"]["Clarity"] == 4
+    assert set(feedback["weak_dimension_tips"]) == {"Structure", "Filler Words"}
+    assert "summary_tip" not in feedback
+    assert fitted[-1]["coaching_feedback"]["summary_tip"] == "Quantify impact early."
+    # Input is not mutated
+    assert "dimensions" in history[0]["coaching_feedback"]
+
+
+def test_fit_turn_history_bounds_prompt_for_long_sessions() -> None:
+    budget = 1500
+    history = [_turn(i) for i in range(1, 201)]
+
+    fitted, dropped = fit_turn_history(history, AVERAGES, budget_tokens=budget)
+
+    assert estimate_tokens(json.dumps(fitted)) <= budget
+    assert dropped > 0
+    # The most recent turn keeps its full answer text
+    assert fitted[-1]["turn_number"] == 200
+    assert fitted[-1]["transcript"] == history[-1]["transcript"]
+
+
+def test_summary_prompt_size_is_bounded_regardless_of_session_length() -> None:
+    provider = GroqLLMProvider(api_key="test_key", context_budget_tokens=1000)
+
+    sizes = []
+    for turns in (20, 200):
+        history = [_turn(i) for i in range(1, turns + 1)]
+        averages = provider._compute_average_scores(history)
+        fitted, omitted = fit_turn_history(history, averages, 1000)
+        prompt = provider._build_session_summary_prompt(
+            turn_history=fitted,
+            role="Backend Engineer",
+            interview_type="behavioral",
+            difficulty="medium",
+            average_scores=averages,
+            omitted_turns=omitted,
+        )
+        sizes.append(len(prompt))
+        assert "earliest turns are omitted" in prompt
+
+    assert abs(sizes[0] - sizes[1]) < 200
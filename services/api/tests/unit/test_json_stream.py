@@ -0,0 +1,82 @@
+"""Tests for the incremental follow-up JSON parser."""
+
+import json
+
+import pytest
+
+from src.providers.json_stream import FollowUpStreamParser
+
+PAYLOAD = json.dumps(
+    {
+        "follow_up_question": '  Why "event-driven"? Walk me through it.\\n ',
+        "coaching_feedback": {
+            "dimensions": [
+                {"label": "Clarity", "score": 4, "tip": "Lead with it, then [context]."},
+                {"label": "Structure", "score": 2, "tip": "Name each {STAR} step."},
+            ],
+            "summary_tip": "Quantify impact early.",
+        },
+        "refused": False,
+    }
+)
+
+
+def _feed_in_chunks(text: str, size: int) -> list:
+    parser = FollowUpStreamParser()
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start : start + size]))
+    return events
+
+
+def test_emits_question_then_each_dimension() -> None:
+    events = _feed_in_chunks(PAYLOAD, size=len(PAYLOAD))
+
+    assert events == [
+        ("follow_up_question", 'Why "event-driven"? Walk me through it.\\n'),
+        (
+            "coaching_dimension",
+            {"label": "Clarity", "score": 4, "tip": "Lead with it, then [context]."},
+        ),
+        (
+            "coaching_dimension",
+            {"label": "Structure", "score": 2, "tip": "Name each {STAR} step."},
+        ),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13])
+def test_events_do_not_depend_on_chunk_boundaries(size: int) -> None:
+    assert _feed_in_chunks(PAYLOAD, size) == _feed_in_chunks(PAYLOAD, len(PAYLOAD))
+
+
+def test_question_is_reported_before_feedback_arrives() -> None:
+    parser = FollowUpStreamParser()
+    cut = PAYLOAD.index('"coaching_feedback"')
+
+    assert parser.feed(PAYLOAD[:cut]) == [
+        ("follow_up_question", 'Why "event-driven"? Walk me through it.\\n')
+    ]
+    assert [kind for kind, _ in parser.feed(PAYLOAD[cut:])] == [
+        "coaching_dimension",
+        "coaching_dimension",
+    ]
+
+
+def test_ignores_nested_and_blank_question_fields() -> None:
+    text = json.dumps(
+        {
+            "meta": {"follow_up_question": "nested"},
+            "follow_up_question": "   ",
+            "dimensions": [{"label": "top-level, not coaching"}],
+        }
+    )
+
+    assert _feed_in_chunks(text, 4) == []
+
+
+def test_malformed_input_stops_reporting_without_raising() -> None:
+    parser = FollowUpStreamParser()
+
+    assert parser.feed('}{"follow_up_question": "Why?"}') == []
+    assert parser.feed("more text") == []
@@ -0,0 +1,167 @@
+"""Tests for the LLM response cache."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.observability.metrics import (
+    llm_response_cache_evictions_total,
+    llm_response_cache_total,
+)
+from src.providers.llm_cache import LLMResponseCache
+from src.providers.llm_groq import GroqLLMProvider
+
+
+def _completion(content: str) -> Mock:
+    completion = Mock()
+    completion.choices = [Mock(message=Mock(content=content))]
+    return completion
+
+
+def test_key_depends_on_messages_and_parameters() -> None:
+    request = {
+        "model": "m",
+        "messages": [{"role": "user", "content": "hi"}],
+        "temperature": 0.5,
+    }
+
+    assert LLMResponseCache.key(request) == LLMResponseCache.key(dict(request))
+    assert LLMResponseCache.key(request) != LLMResponseCache.key(
+        {**request, "temperature": 0.7}
+    )
+    assert LLMResponseCache.key(request) != LLMResponseCache.key(
+        {**request, "messages": [{"role": "user", "content": "hello"}]}
+    )
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    cache = LLMResponseCache(max_entries=2)
+    evictions_before = llm_response_cache_evictions_total().value(reason="lru")
+
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"  # "b" is now least recently used
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+    assert llm_response_cache_evictions_total().value(reason="lru") == (
+        evictions_before + 1
+    )
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    cache = LLMResponseCache(ttl_seconds=10)
+
+    with patch("src.providers.llm_cache.time.monotonic", return_value=100.0):
+        cache.put("a", "A")
+    with patch("src.providers.llm_cache.time.monotonic", return_value=109.0):
+        assert cache.get("a") == "A"
+    with patch("src.providers.llm_cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_follow_up_is_served_from_cache() -> None:
+    """An identical replayed turn skips the Groq call and counts a hit."""
+    content = '{"follow_up_question":"What did you learn?","refused":false}'
+    hits_before = llm_response_cache_total().value(prompt="follow_up", result="hit")
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=_completion(content)
+        )
+
+        provider = GroqLLMProvider(api_key="test_key", response_cache=LLMResponseCache())
+        kwargs = dict(
+            transcript="I shipped the billing migration.",
+            role="cache test role",
+            interview_type="behavioral",
+            difficulty="medium",
+            asked_questions=[],
+            question_number=1,
+            total_questions=5,
+        )
+        first = await provider.generate_follow_up(**kwargs)
+        second = await provider.generate_follow_up(**kwargs)
+        await provider.generate_follow_up(**{**kwargs, "transcript": "Different."})
+
+    assert first == second
+    assert second.follow_up_question == "What did you learn?"
+    assert mock_client.chat.completions.create.await_count == 2
+    assert llm_response_cache_total().value(prompt="follow_up", result="hit") == (
+        hits_before + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_refused_follow_up_is_not_cached() -> None:
+    content = '{"follow_up_question":"Let us keep it professional.","refused":true}'
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=_completion(content)
+        )
+
+        cache = LLMResponseCache()
+        provider = GroqLLMProvider(api_key="test_key", response_cache=cache)
+        for _ in range(2):
+            result = await provider.generate_follow_up(
+                transcript="something abusive",
+                role="cache test role",
+                interview_type="behavioral",
+                difficulty="medium",
+                asked_questions=[],
+                question_number=1,
+                total_questions=5,
+            )
+
+    assert result.refused is True
+    assert len(cache) == 0
+    assert mock_client.chat.completions.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_only_valid_session_summaries_are_cached() -> None:
+    valid = (
+        '{"overall_assessment":"Solid.","strengths":["Examples"],'
+        '"improvements":["Metrics"],"average_scores":{}}'
+    )
+    turn_history = [
+        {
+            "turn_number": 1,
+            "transcript": "Answer",
+            "assistant_text": "Question?",
+            "coaching_feedback": None,
+        }
+    ]
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[_completion("not json"), _completion(valid)]
+        )
+
+        provider = GroqLLMProvider(api_key="test_key", response_cache=LLMResponseCache())
+        summaries = [
+            await provider.generate_session_summary(
+                turn_history=turn_history,
+                role="Backend Engineer",
+                interview_type="behavioral",
+                difficulty="medium",
+            )
+            for _ in range(3)
+        ]
+
+    assert summaries[0] is None
+    assert summaries[1] == summaries[2]
+    assert summaries[1] is not summaries[2]
+    assert mock_client.chat.completions.create.await_count == 2
@@ -155,6 +155,51 @@ async def test_generate_follow_up_timeout_error():
         assert exc_info.value.retryable is True
 
 
+@pytest.mark.asyncio
+async def test_optional_calls_raise_api_errors_only_when_asked():
+    """Summary calls return None on API errors unless raise_errors is set."""
+    from groq import APITimeoutError
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=APITimeoutError(request=Mock())
+        )
+        provider = GroqLLMProvider(api_key="test_key")
+        summary_kwargs = dict(
+            turn_history=[],
+            role="backend developer",
+            interview_type="technical interview",
+            difficulty="mid-level",
+        )
+
+        assert await provider.generate_session_summary(**summary_kwargs) is None
+        with pytest.raises(LLMError) as exc_info:
+            await provider.generate_session_summary(
+                **summary_kwargs, raise_errors=True
+            )
+        assert exc_info.value.code == "llm_timeout"
+
+        with pytest.raises(LLMError):
+            await provider.update_rolling_summary(
+                previous_summary=None,
+                turn={"turn_number": 1},
+                role="backend developer",
+                interview_type="technical interview",
+                difficulty="mid-level",
+                raise_errors=True,
+            )
+        with pytest.raises(LLMError):
+            await provider.generate_coaching_feedback(
+                transcript="I used queues.",
+                role="backend developer",
+                interview_type="technical interview",
+                difficulty="mid-level",
+                raise_errors=True,
+            )
+
+
 @pytest.mark.asyncio
 async def test_generate_follow_up_api_error():
     """Test API error raises LLMError with 'provider_error' code."""
@@ -490,3 +535,257 @@ async def test_generate_session_summary_malformed_json_returns_none():
         )
 
         assert result is None
+
+
+def test_system_prompt_prefix_is_stable_across_turns():
+    """Only the suffix changes between turns; the prefix is memoized per setup."""
+    provider = GroqLLMProvider(api_key="test_key")
+
+    prefix_1, suffix_1 = provider._build_system_prompt_parts(
+        "backend developer", "technical interview", "mid-level", [], 1, 5
+    )
+    prefix_2, suffix_2 = provider._build_system_prompt_parts(
+        "backend developer",
+        "technical interview",
+        "mid-level",
+        ["Tell me about yourself."],
+        5,
+        5,
+    )
+    other_prefix, _ = provider._build_system_prompt_parts(
+        "data scientist", "technical interview", "mid-level", [], 1, 5
+    )
+
+    assert prefix_1 is prefix_2
+    assert "backend developer" in prefix_1
+    assert "question 1 of 5" in suffix_1
+    assert "FINAL" in suffix_2 and "Tell me about yourself." in suffix_2
+    assert "FINAL" not in prefix_1 and "question 1" not in prefix_1
+    # Sessions with different setups still share the leading instructions
+    shared = prefix_1.split("\n\n")[0]
+    assert other_prefix.startswith(shared)
+
+
+@pytest.mark.asyncio
+async def test_generate_follow_up_records_prompt_size_metrics():
+    """Prompt section sizes and prefix memo hits are recorded per request."""
+    from src.observability.metrics import (
+        llm_prompt_bytes,
+        llm_prompt_prefix_cache_total,
+    )
+
+    mock_completion = Mock()
+    mock_completion.choices = [
+        Mock(message=Mock(content='{"follow_up_question":"Why?"}'))
+    ]
+    suffix_before = llm_prompt_bytes().count(prompt="follow_up", section="suffix")
+    hits_before = llm_prompt_prefix_cache_total().value(result="hit")
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_completion)
+
+        provider = GroqLLMProvider(api_key="test_key")
+        for question_number in (1, 2):
+            await provider.generate_follow_up(
+                transcript="Sample answer",
+                role="metrics test role",
+                interview_type="behavioral",
+                difficulty="senior",
+                asked_questions=[],
+                question_number=question_number,
+                total_questions=5,
+            )
+
+    assert (
+        llm_prompt_bytes().count(prompt="follow_up", section="suffix")
+        == suffix_before + 2
+    )
+    assert llm_prompt_prefix_cache_total().value(result="hit") >= hits_before + 1
+
+
+_FEEDBACK_JSON = (
+    '{"dimensions":[{"label":"Clarity","score":4,"tip":"Lead with the result."}],'
+    '"summary_tip":"Quantify impact."}'
+)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"follow_up_question":"  Why?  ","coaching_feedback":' + _FEEDBACK_JSON + "}",
+        '{"follow_up_question":"Why?","refused":true}',
+        '{"follow_up_question":"Why?","refused":"true"}',
+        '{"follow_up_question":"Why?","refused":1}',
+        '{"follow_up_question":"   ","refused":false}',
+        '{"follow_up_question":"Why?","coaching_feedback":{"dimensions":[]}}',
+        '{"follow_up_question":42}',
+        '["not", "an", "object"]',
+        "Plain text question?",
+    ],
+)
+def test_parse_llm_response_fast_path_matches_lenient_parser(content):
+    """Single-pass validation gives the same result as field-by-field parsing."""
+    provider = GroqLLMProvider(api_key="test_key")
+
+    assert provider._parse_llm_response(content) == (
+        provider._parse_llm_response_lenient(content)
+    )
+
+
+def test_coaching_word_limits_count_whitespace_separated_words():
+    from src.api.models.turn_models import CoachingDimension
+
+    tip = "\n".join(["word"] * 25) + "\t"
+    assert CoachingDimension(label="Clarity", score=3, tip=tip).tip == tip
+    with pytest.raises(ValueError, match="25 words or fewer"):
+        CoachingDimension(label="Clarity", score=3, tip=tip + " extra")
+
+
+class _FakeStream:
+    """Async iterator of chat completion chunks, like groq's AsyncStream."""
+
+    def __init__(self, pieces):
+        self._chunks = [
+            Mock(choices=[Mock(delta=Mock(content=piece))]) for piece in pieces
+        ]
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_generate_follow_up_streams_question_before_feedback():
+    """Streaming reports the question while coaching feedback is still pending."""
+    content = (
+        '{"follow_up_question":"How did you measure it?","coaching_feedback":'
+        + _FEEDBACK_JSON
+        + ',"refused":false}'
+    )
+    pieces = [content[i : i + 10] for i in range(0, len(content), 10)]
+    stream = _FakeStream(pieces)
+    events = []
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=stream)
+
+        provider = GroqLLMProvider(api_key="test_key")
+        result = await provider.generate_follow_up(
+            transcript="Sample answer",
+            role="streaming test role",
+            interview_type="behavioral",
+            difficulty="medium",
+            asked_questions=[],
+            question_number=1,
+            total_questions=5,
+            on_follow_up_question=lambda q: events.append(("question", q)),
+            on_coaching_dimension=lambda d: events.append(("dimension", d["label"])),
+        )
+
+    assert events == [("question", "How did you measure it?"), ("dimension", "Clarity")]
+    assert result.follow_up_question == "How did you measure it?"
+    assert result.coaching_feedback is not None
+    assert stream.closed
+    call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+    assert call_kwargs["stream"] is True
+    assert "response_format" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_generate_question_uses_short_question_only_call():
+    """Split mode's question call caps tokens and omits the coaching schema."""
+    mock_completion = Mock()
+    mock_completion.choices = [
+        Mock(message=Mock(content='{"follow_up_question":"Why?","refused":false}'))
+    ]
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_completion)
+
+        provider = GroqLLMProvider(api_key="test_key", question_max_tokens=80)
+        result = await provider.generate_question(
+            transcript="Sample answer",
+            role="split test role",
+            interview_type="behavioral",
+            difficulty="medium",
+            asked_questions=["Tell me about yourself."],
+            question_number=2,
+            total_questions=5,
+        )
+
+    assert result == LLMResponse(follow_up_question="Why?")
+    call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+    system_prompt = call_kwargs["messages"][0]["content"]
+    assert call_kwargs["max_tokens"] == 80
+    assert "coaching_feedback" not in system_prompt
+    assert "Tell me about yourself." in system_prompt
+
+
+@pytest.mark.asyncio
+async def test_generate_coaching_feedback_returns_validated_feedback():
+    mock_completion = Mock()
+    mock_completion.choices = [
+        Mock(message=Mock(content='{"coaching_feedback":' + _FEEDBACK_JSON + "}"))
+    ]
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_completion)
+
+        provider = GroqLLMProvider(api_key="test_key")
+        feedback = await provider.generate_coaching_feedback(
+            transcript="Sample answer",
+            role="split test role",
+            interview_type="behavioral",
+            difficulty="medium",
+            question="Tell me about yourself.",
+        )
+
+    assert feedback is not None
+    assert feedback.dimensions[0].label == "Clarity"
+    system_prompt = mock_client.chat.completions.create.call_args.kwargs["messages"][
+        0
+    ]["content"]
+    assert "Tell me about yourself." in system_prompt
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content",
+    ["not json", '{"coaching_feedback":{"dimensions":"bad"}}', None],
+)
+async def test_generate_coaching_feedback_returns_none_on_invalid_output(content):
+    mock_completion = Mock()
+    mock_completion.choices = [Mock(message=Mock(content=content))]
+
+    with patch("src.providers.llm_groq.AsyncGroq") as mock_groq_class:
+        mock_client = AsyncMock()
+        mock_groq_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_completion)
+
+        provider = GroqLLMProvider(api_key="test_key")
+        feedback = await provider.generate_coaching_feedback(
+            transcript="Sample answer",
+            role="split test role",
+            interview_type="behavioral",
+            difficulty="medium",
+        )
+
+    assert feedback is None
@@ -0,0 +1,262 @@
+"""Tests for latency-aware LLM routing, using local stub backends."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.observability.metrics import llm_router_requests_total
+from src.providers.llm_groq import LLMError, LLMResponse
+from src.providers.llm_router import BackendStats, LLMBackend, LLMRouter
+from src.services import orchestrator
+from src.settings.config import Settings
+
+
+class StubBackend:
+    """LLM backend stub with scripted delay, errors and results."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        self.name = name
+        self.delay = delay
+        self.errors: list[LLMError] = []
+        self.summary: dict | None = {"overall_assessment": name}
+        self.summary_delay = 0.0
+        self.summary_errors: list[LLMError] = []
+        self.calls = 0
+
+    async def generate_follow_up(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        return LLMResponse(follow_up_question=f"{self.name}?")
+
+    async def generate_session_summary(self, raise_errors=False, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.summary_delay)
+        if self.summary_errors:
+            error = self.summary_errors.pop(0)
+            if raise_errors:
+                raise error
+            return None
+        return self.summary
+
+
+def _router(fast: StubBackend, main: StubBackend, **kwargs) -> LLMRouter:
+    return LLMRouter(
+        backends=[LLMBackend("fast", fast), LLMBackend("main", main)],
+        routes={"follow_up": ["fast", "main"], "summary": ["main", "fast"]},
+        **kwargs,
+    )
+
+
+def _rate_limited() -> LLMError:
+    return LLMError("429", code="llm_rate_limit", retryable=True)
+
+
+@pytest.mark.asyncio
+async def test_each_route_uses_its_preferred_backend() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    router = _router(fast, main)
+
+    follow_up = await router.generate_follow_up(transcript="answer")
+    summary = await router.generate_session_summary(turn_history=[])
+
+    assert follow_up.follow_up_question == "fast?"
+    assert summary == {"overall_assessment": "main"}
+
+
+@pytest.mark.asyncio
+async def test_response_reports_the_model_that_answered() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    fast.errors = [_rate_limited()]
+    router = LLMRouter(
+        backends=[
+            LLMBackend("fast", fast, model="small-model"),
+            LLMBackend("main", main),
+        ],
+        routes={"follow_up": ["fast", "main"], "summary": ["main"]},
+        cooldown_seconds=0.0,
+    )
+
+    fallback = await router.generate_follow_up(transcript="answer")
+    preferred = await router.generate_follow_up(transcript="answer")
+
+    assert fallback.model == "main"
+    assert preferred.model == "small-model"
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_backend_falls_back_and_cools_down() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    fast.errors = [_rate_limited()]
+    router = _router(fast, main, cooldown_seconds=60)
+    fallbacks_before = llm_router_requests_total().value(
+        route="follow_up", backend="fast", outcome="fallback"
+    )
+
+    first = await router.generate_follow_up(transcript="answer")
+    second = await router.generate_follow_up(transcript="answer")
+
+    assert first.follow_up_question == "main?"
+    assert second.follow_up_question == "main?"
+    assert fast.calls == 1  # skipped while cooling down
+    assert router.stats("fast").cooling_down()
+    assert llm_router_requests_total().value(
+        route="follow_up", backend="fast", outcome="fallback"
+    ) == (fallbacks_before + 1)
+
+
+@pytest.mark.asyncio
+async def test_slow_p95_moves_traffic_to_other_backend() -> None:
+    fast, main = StubBackend("fast", delay=0.03), StubBackend("main")
+    router = _router(fast, main, latency_budget_ms=10, min_samples=2)
+
+    for _ in range(2):
+        assert (await router.generate_follow_up()).follow_up_question == "fast?"
+    result = await router.generate_follow_up()
+
+    assert result.follow_up_question == "main?"
+    assert [backend.name for backend in router.candidates("follow_up")] == [
+        "main",
+        "fast",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slow_summaries_do_not_move_follow_up_traffic() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    fast.summary_delay = 0.03
+    router = LLMRouter(
+        backends=[LLMBackend("fast", fast), LLMBackend("main", main)],
+        routes={"follow_up": ["fast", "main"], "summary": ["fast", "main"]},
+        latency_budget_ms=10,
+        route_latency_budgets_ms={"summary": 10},
+        min_samples=2,
+    )
+
+    for _ in range(2):
+        await router.generate_session_summary(turn_history=[])
+
+    assert router.candidates("summary")[0].name == "main"
+    assert router.candidates("follow_up")[0].name == "fast"
+    assert router.stats("fast", route="follow_up").samples == 0
+
+
+@pytest.mark.asyncio
+async def test_per_route_latency_budget() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    fast.summary_delay = 0.03
+    router = LLMRouter(
+        backends=[LLMBackend("fast", fast), LLMBackend("main", main)],
+        routes={"follow_up": ["fast", "main"], "summary": ["fast", "main"]},
+        latency_budget_ms=10,
+        route_latency_budgets_ms={"summary": 5000},
+        min_samples=2,
+    )
+
+    for _ in range(2):
+        await router.generate_session_summary(turn_history=[])
+
+    assert router.candidates("summary")[0].name == "fast"
+
+
+@pytest.mark.asyncio
+async def test_summary_rate_limit_starts_cooldown_on_every_route() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    main.summary_errors = [_rate_limited()]
+    router = _router(fast, main, cooldown_seconds=60)
+
+    summary = await router.generate_session_summary(turn_history=[])
+
+    assert summary == {"overall_assessment": "fast"}
+    assert router.stats("main", route="summary").cooling_down()
+    assert router.stats("main", route="follow_up").cooling_down()
+
+
+@pytest.mark.asyncio
+async def test_failed_optional_calls_return_none() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    main.summary_errors = [_rate_limited()]
+    fast.summary_errors = [LLMError("bad", code="llm_provider_error", retryable=True)]
+    router = _router(fast, main)
+
+    assert await router.generate_session_summary(turn_history=[]) is None
+
+
+@pytest.mark.asyncio
+async def test_high_error_rate_marks_backend_unhealthy() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    fast.errors = [LLMError("timeout", code="llm_timeout", retryable=True)] * 2
+    router = _router(fast, main, max_error_rate=0.5, min_samples=2)
+
+    for _ in range(2):
+        await router.generate_follow_up()
+
+    assert router.stats("fast").error_rate() == 1.0
+    assert router.candidates("follow_up")[0].name == "main"
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_is_not_retried_elsewhere() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    fast.errors = [LLMError("filtered", code="llm_content_filter", retryable=False)]
+    router = _router(fast, main)
+
+    with pytest.raises(LLMError) as exc_info:
+        await router.generate_follow_up()
+
+    assert exc_info.value.code == "llm_content_filter"
+    assert main.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_last_error_raised_when_every_backend_fails() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    fast.errors = [_rate_limited()]
+    main.errors = [LLMError("down", code="llm_provider_error", retryable=True)]
+    router = _router(fast, main)
+
+    with pytest.raises(LLMError) as exc_info:
+        await router.generate_follow_up()
+
+    assert exc_info.value.code == "llm_provider_error"
+
+
+@pytest.mark.asyncio
+async def test_missing_summary_falls_back_to_other_backend() -> None:
+    fast, main = StubBackend("fast"), StubBackend("main")
+    main.summary = None
+    router = _router(fast, main)
+
+    assert await router.generate_session_summary() == {"overall_assessment": "fast"}
+
+    fast.summary = None
+    assert await router.generate_session_summary() is None
+
+
+def test_p95_uses_nearest_rank() -> None:
+    stats = BackendStats(window=100)
+    for latency in range(1, 101):
+        stats.record(float(latency), failed=False)
+
+    assert stats.p95_ms() == 95.0
+    assert BackendStats().p95_ms() is None
+
+
+def test_router_rejects_unknown_route_backends() -> None:
+    with pytest.raises(ValueError):
+        LLMRouter(backends=[], routes={"follow_up": ["missing"]})
+
+
+def test_get_llm_provider_returns_shared_router_when_enabled() -> None:
+    settings = Settings(llm_router_enabled=True, llm_fast_model="small-model")
+    with (
+        patch("src.services.orchestrator.get_settings", return_value=settings),
+        patch.object(orchestrator, "_llm_router", None),
+    ):
+        provider = orchestrator.get_llm_provider()
+        assert provider is orchestrator.get_llm_provider()
+
+    assert isinstance(provider, LLMRouter)
+    assert [b.name for b in provider.candidates("follow_up")] == ["fast", "main"]
@@ -0,0 +1,267 @@
+"""Tests for the local (offline) STT and TTS providers."""
+
+import asyncio
+import io
+import json
+import wave
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.providers import stt_local
+from src.providers.stt_deepgram import (
+    DeepgramSTTProvider,
+    EmptyTranscriptError,
+    STTBadRequestError,
+    STTError,
+)
+from src.providers.stt_local import VoskSTTProvider
+from src.providers.tts_deepgram import DeepgramTTSProvider, TTSError, TTSTimeoutError
+from src.providers.tts_local import EspeakTTSProvider
+from src.services.orchestrator import (
+    TurnProcessingError,
+    get_stt_provider,
+    get_tts_provider,
+    process_turn,
+)
+from src.settings.config import Settings
+
+
+def _wav(channels: int = 1, sample_width: int = 2, frames: int = 8000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00" * frames * channels * sample_width)
+    return buffer.getvalue()
+
+
+class FakeRecognizer:
+    """Stands in for vosk.KaldiRecognizer."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.fed = 0
+
+    def AcceptWaveform(self, data: bytes) -> bool:
+        self.fed += len(data)
+        return False
+
+    def FinalResult(self) -> str:
+        return json.dumps({"text": self.text})
+
+
+def _fake_vosk(text: str) -> Mock:
+    fake = Mock()
+    fake.recognizer = FakeRecognizer(text)
+    fake.KaldiRecognizer.return_value = fake.recognizer
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def _clear_model_cache():
+    stt_local._load_model.cache_clear()
+    yield
+    stt_local._load_model.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_vosk_transcribes_mono_wav() -> None:
+    fake = _fake_vosk("i led the migration")
+
+    with patch.object(stt_local, "vosk", fake):
+        transcript = await VoskSTTProvider(model_path="/models/en").transcribe_audio(
+            _wav(), "audio/wav"
+        )
+
+    assert transcript == "i led the migration"
+    fake.Model.assert_called_once_with("/models/en")
+    assert fake.KaldiRecognizer.call_args.args[1] == 16000
+    assert fake.recognizer.fed == 16000  # all 8000 16-bit frames
+
+
+@pytest.mark.asyncio
+async def test_vosk_empty_result_is_empty_transcript() -> None:
+    with patch.object(stt_local, "vosk", _fake_vosk("")):
+        with pytest.raises(EmptyTranscriptError):
+            await VoskSTTProvider().transcribe_audio(_wav(), "audio/wav")
+
+
+def _ffmpeg(stdout: bytes, returncode: int = 0) -> Mock:
+    process = Mock()
+    process.communicate = AsyncMock(return_value=(stdout, b"invalid data"))
+    process.returncode = returncode
+    return process
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "audio", [b"\x00\x00\x00\x1cftypM4A ", _wav(channels=2)], ids=["m4a", "stereo"]
+)
+async def test_vosk_decodes_other_audio_with_ffmpeg(audio: bytes) -> None:
+    fake = _fake_vosk("i led the migration")
+    seen: dict = {}
+
+    async def spawn(*args, **kwargs):
+        seen["args"] = args
+        with open(args[args.index("-i") + 1], "rb") as source:
+            seen["input"] = source.read()
+        return _ffmpeg(b"\x00\x00" * 24000)
+
+    with (
+        patch.object(stt_local, "vosk", fake),
+        patch("src.providers.stt_local.asyncio.create_subprocess_exec", spawn),
+    ):
+        transcript = await VoskSTTProvider(
+            ffmpeg_executable="/opt/ffmpeg"
+        ).transcribe_audio(audio, "audio/mp4")
+
+    assert transcript == "i led the migration"
+    assert seen["args"][0] == "/opt/ffmpeg"
+    assert seen["args"][-6:] == ("pcm_s16le", "-ac", "1", "-ar", "16000", "pipe:1")
+    assert seen["input"] == audio
+    assert fake.KaldiRecognizer.call_args.args[1] == 16000
+    assert fake.recognizer.fed == 48000
+
+
+@pytest.mark.asyncio
+async def test_vosk_rejects_audio_ffmpeg_cannot_decode() -> None:
+    with (
+        patch.object(stt_local, "vosk", _fake_vosk("text")),
+        patch(
+            "src.providers.stt_local.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=_ffmpeg(b"", returncode=1)),
+        ),
+    ):
+        with pytest.raises(STTBadRequestError):
+            await VoskSTTProvider().transcribe_audio(b"ID3 not audio", "audio/mpeg")
+
+
+@pytest.mark.asyncio
+async def test_vosk_missing_ffmpeg_is_not_retryable() -> None:
+    with (
+        patch.object(stt_local, "vosk", _fake_vosk("text")),
+        patch(
+            "src.providers.stt_local.asyncio.create_subprocess_exec",
+            AsyncMock(side_effect=FileNotFoundError()),
+        ),
+    ):
+        with pytest.raises(STTError) as exc_info:
+            await VoskSTTProvider().transcribe_audio(b"m4a", "audio/mp4")
+
+    assert exc_info.value.retryable is False
+    assert exc_info.value.code == "stt_provider_error"
+
+
+@pytest.mark.asyncio
+async def test_vosk_missing_package_is_not_retryable() -> None:
+    with patch.object(stt_local, "vosk", None):
+        with pytest.raises(STTError) as exc_info:
+            await VoskSTTProvider().transcribe_audio(_wav(), "audio/wav")
+
+    assert exc_info.value.retryable is False
+
+
+def _process(stdout: bytes, returncode: int = 0) -> Mock:
+    process = Mock()
+    process.communicate = AsyncMock(return_value=(stdout, b""))
+    process.returncode = returncode
+    process.wait = AsyncMock(return_value=returncode)
+    return process
+
+
+@pytest.mark.asyncio
+async def test_espeak_returns_wav_from_stdout() -> None:
+    process = _process(b"RIFF....WAVE")
+
+    with patch(
+        "src.providers.tts_local.asyncio.create_subprocess_exec",
+        AsyncMock(return_value=process),
+    ) as spawn:
+        audio = await EspeakTTSProvider(voice="en-gb").synthesize("Why?")
+
+    assert audio == b"RIFF....WAVE"
+    assert spawn.call_args.args[0] == "espeak-ng"
+    assert spawn.call_args.args[3:5] == ("-v", "en-gb")
+    process.communicate.assert_awaited_once_with(b"Why?")
+
+
+@pytest.mark.asyncio
+async def test_espeak_missing_executable_is_not_retryable() -> None:
+    with patch(
+        "src.providers.tts_local.asyncio.create_subprocess_exec",
+        AsyncMock(side_effect=FileNotFoundError()),
+    ):
+        with pytest.raises(TTSError) as exc_info:
+            await EspeakTTSProvider().synthesize("Why?")
+
+    assert exc_info.value.retryable is False
+
+
+@pytest.mark.asyncio
+async def test_missing_espeak_fails_the_turn_as_non_retryable() -> None:
+    llm = AsyncMock()
+    llm.generate_follow_up.return_value = "What would you change?"
+    session = Mock(turn_count=0)
+    tts_cache = Mock()
+
+    with (
+        patch("src.services.orchestrator.get_llm_provider", return_value=llm),
+        patch(
+            "src.services.orchestrator.get_tts_provider",
+            return_value=EspeakTTSProvider(executable="/missing/espeak-ng"),
+        ),
+    ):
+        with pytest.raises(TurnProcessingError) as exc_info:
+            await process_turn(
+                audio_bytes=None,
+                mime_type=None,
+                session=session,
+                role="backend developer",
+                interview_type="technical interview",
+                difficulty="mid-level",
+                asked_questions=[],
+                question_count=5,
+                tts_cache=tts_cache,
+                transcript="I rewrote the scheduler.",
+                request_id="req-local-tts",
+            )
+
+    assert exc_info.value.stage == "tts"
+    assert exc_info.value.code == "tts_provider_error"
+    assert exc_info.value.retryable is False
+    tts_cache.store.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_espeak_timeout_kills_process() -> None:
+    process = _process(b"")
+
+    async def hang(_input):
+        await asyncio.sleep(1)
+
+    process.communicate = hang
+    with patch(
+        "src.providers.tts_local.asyncio.create_subprocess_exec",
+        AsyncMock(return_value=process),
+    ):
+        with pytest.raises(TTSTimeoutError):
+            await EspeakTTSProvider(timeout_seconds=0.01).synthesize("Why?")
+
+    process.kill.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("backend", "stt_class", "tts_class"),
+    [
+        ("deepgram", DeepgramSTTProvider, DeepgramTTSProvider),
+        ("local", VoskSTTProvider, EspeakTTSProvider),
+    ],
+)
+def test_settings_select_speech_backends(backend, stt_class, tts_class) -> None:
+    settings = Settings(stt_backend=backend, tts_backend=backend)
+
+    with patch("src.services.orchestrator.get_settings", return_value=settings):
+        assert isinstance(get_stt_provider(), stt_class)
+        assert isinstance(get_tts_provider(), tts_class)
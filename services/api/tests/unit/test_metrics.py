@@ -0,0 +1,58 @@
+"""Tests for the in-process metrics registry."""
+
+import pytest
+
+from src.observability.metrics import MetricsRegistry
+
+
+def test_counter_increments_per_label_series():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ("outcome",))
+
+    counter.inc(outcome="ok")
+    counter.inc(outcome="ok")
+    counter.inc(outcome="stt_timeout")
+
+    assert counter.value(outcome="ok") == 2
+    assert counter.value(outcome="stt_timeout") == 1
+    assert counter.value(outcome="missing") == 0
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "stage_ms", "Stage latency.", ("stage",), buckets=(10.0, 100.0)
+    )
+
+    histogram.observe(5.0, stage="stt")
+    histogram.observe(50.0, stage="stt")
+    histogram.observe(500.0, stage="stt")
+
+    output = registry.render()
+
+    assert "# TYPE stage_ms histogram" in output
+    assert 'stage_ms_bucket{stage="stt",le="10"} 1' in output
+    assert 'stage_ms_bucket{stage="stt",le="100"} 2' in output
+    assert 'stage_ms_bucket{stage="stt",le="+Inf"} 3' in output
+    assert 'stage_ms_sum{stage="stt"} 555' in output
+    assert 'stage_ms_count{stage="stt"} 3' in output
+    assert histogram.count(stage="stt") == 3
+
+
+def test_registry_returns_existing_metric_by_name():
+    registry = MetricsRegistry()
+    first = registry.counter("shared_total", "Shared.")
+    second = registry.counter("shared_total", "Shared.")
+
+    assert first is second
+
+    with pytest.raises(ValueError):
+        registry.histogram("shared_total", "Conflicting type.")
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    counter = registry.counter("escaped_total", "Escaping.", ("model",))
+    counter.inc(model='weird"model\\name')
+
+    assert 'escaped_total{model="weird\\"model\\\\name"} 1' in registry.render()
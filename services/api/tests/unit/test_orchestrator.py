@@ -23,6 +23,7 @@ from src.providers.tts_deepgram import (
 from src.providers.llm_groq import LLMError, LLMResponse
 from unittest.mock import Mock
 from src.api.models.turn_models import CoachingFeedback, CoachingDimension
+from src.domain.session_state import RubricScores, TurnRecord
 
 
 @pytest.fixture
@@ -967,3 +968,181 @@ async def test_process_turn_non_final_has_null_session_summary(mock_tts_cache):
 
     assert result.session_summary is None
     mock_llm.generate_session_summary.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_process_turn_final_summary_uses_running_rubric_scores(mock_tts_cache):
+    """Final turn passes running averages (including this turn) to the summary."""
+    mock_stt = AsyncMock()
+    mock_stt.transcribe_audio.return_value = "Final answer"
+
+    mock_llm = AsyncMock()
+    mock_llm.generate_follow_up.return_value = LLMResponse(
+        follow_up_question="That concludes our interview.",
+        coaching_feedback=CoachingFeedback(
+            dimensions=[
+                CoachingDimension(label="Clarity", score=2, tip="Slow down."),
+                CoachingDimension(label="Relevance", score=4, tip="On topic."),
+                CoachingDimension(label="Structure", score=4, tip="Good flow."),
+                CoachingDimension(label="Filler Words", score=4, tip="Few fillers."),
+            ],
+            summary_tip="Lead with the result.",
+        ),
+    )
+    mock_llm.generate_session_summary.return_value = None
+
+    previous_feedback = {
+        "dimensions": [{"label": "Clarity", "score": 4, "tip": "Clear."}],
+    }
+    rubric_scores = RubricScores()
+    rubric_scores.record(previous_feedback)
+
+    session = MockSessionState(
+        session_id="test-session",
+        turn_count=1,
+        last_activity_at=datetime.now(timezone.utc),
+    )
+
+    with patch(
+        "src.services.orchestrator.get_stt_provider", return_value=mock_stt
+    ), patch(
+        "src.services.orchestrator.get_llm_provider", return_value=mock_llm
+    ), patch(
+        "src.services.orchestrator.get_tts_provider",
+        return_value=Mock(synthesize=AsyncMock(return_value=b"audio")),
+    ):
+        await process_turn(
+            b"audio",
+            "audio/webm",
+            session,
+            "backend developer",
+            "technical interview",
+            "mid-level",
+            ["Tell me about yourself."],
+            2,
+            mock_tts_cache,
+            turn_history=[
+                TurnRecord(
+                    turn_number=1,
+                    transcript="First answer",
+                    assistant_text="Tell me about yourself.",
+                    coaching_feedback=previous_feedback,
+                )
+            ],
+            rubric_scores=rubric_scores,
+        )
+
+    kwargs = mock_llm.generate_session_summary.call_args.kwargs
+    assert kwargs["average_scores"] == {
+        "clarity": 3.0,
+        "relevance": 4.0,
+        "structure": 4.0,
+        "filler_words": 4.0,
+    }
+    assert [turn["turn_number"] for turn in kwargs["turn_history"]] == [1, 2]
+    assert kwargs["turn_history"][0]["transcript"] == "First answer"
+    # The caller's running totals are not mutated by the orchestrator
+    assert rubric_scores.counts == {"clarity": 1}
+
+
+@pytest.mark.asyncio
+async def test_process_turn_final_summary_merges_rolling_summary(mock_tts_cache):
+    """Turns covered by the running summary are not resent to the final summary."""
+    mock_stt = AsyncMock()
+    mock_stt.transcribe_audio.return_value = "Final answer"
+
+    mock_llm = AsyncMock()
+    mock_llm.generate_follow_up.return_value = LLMResponse(
+        follow_up_question="That concludes our interview."
+    )
+    mock_llm.generate_session_summary.return_value = None
+
+    session = MockSessionState(
+        session_id="test-session",
+        turn_count=2,
+        last_activity_at=datetime.now(timezone.utc),
+    )
+    rolling_summary = {
+        "strengths": ["Concrete examples"],
+        "improvements": [],
+        "notes": "",
+        "covered_turns": 1,
+    }
+
+    with patch(
+        "src.services.orchestrator.get_stt_provider", return_value=mock_stt
+    ), patch(
+        "src.services.orchestrator.get_llm_provider", return_value=mock_llm
+    ), patch(
+        "src.services.orchestrator.get_tts_provider",
+        return_value=Mock(synthesize=AsyncMock(return_value=b"audio")),
+    ):
+        await process_turn(
+            b"audio",
+            "audio/webm",
+            session,
+            "backend developer",
+            "technical interview",
+            "mid-level",
+            ["Tell me about yourself.", "What went wrong?"],
+            3,
+            mock_tts_cache,
+            turn_history=[
+                TurnRecord(
+                    turn_number=number,
+                    transcript=f"Answer {number}",
+                    assistant_text="Question?",
+                    coaching_feedback=None,
+                )
+                for number in (1, 2)
+            ],
+            rolling_summary=rolling_summary,
+        )
+
+    kwargs = mock_llm.generate_session_summary.call_args.kwargs
+    assert kwargs["rolling_summary"] == rolling_summary
+    assert [turn["turn_number"] for turn in kwargs["turn_history"]] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_process_turn_defer_summary_returns_pending_request(mock_tts_cache):
+    """With defer_summary the final turn returns summary inputs, not a summary."""
+    mock_llm = AsyncMock()
+    mock_llm.generate_follow_up.return_value = LLMResponse(
+        follow_up_question="That concludes our interview."
+    )
+
+    session = MockSessionState(
+        session_id="test-session",
+        turn_count=0,
+        last_activity_at=datetime.now(timezone.utc),
+    )
+
+    with patch(
+        "src.services.orchestrator.get_llm_provider", return_value=mock_llm
+    ), patch(
+        "src.services.orchestrator.get_tts_provider",
+        return_value=Mock(synthesize=AsyncMock(return_value=b"audio")),
+    ):
+        result = await process_turn(
+            None,
+            None,
+            session,
+            "backend developer",
+            "technical interview",
+            "mid-level",
+            [],
+            1,
+            mock_tts_cache,
+            transcript="Final answer",
+            request_id="req-deferred",
+            defer_summary=True,
+        )
+
+    mock_llm.generate_session_summary.assert_not_called()
+    assert result.session_summary is None
+    assert result.pending_summary is not None
+    assert result.pending_summary.request_id == "req-deferred"
+    assert [t["transcript"] for t in result.pending_summary.turn_history] == [
+        "Final answer"
+    ]
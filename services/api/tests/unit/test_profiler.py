@@ -0,0 +1,118 @@
+"""Tests for the sampling profiler and GET /debug/profile."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import RequestContext, get_request_context
+from src.observability.profiler import StackSampler, pipeline_stage
+from src.settings.config import Settings
+
+
+def _busy_spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_samples_are_tagged_with_running_pipeline_stage():
+    sampler = StackSampler(interval_seconds=0.001, loop=asyncio.get_running_loop())
+    sampler.start()
+    try:
+        with pipeline_stage("stt"):
+            _busy_spin(0.1)
+    finally:
+        sampler.stop()
+
+    output = sampler.collapsed()
+    assert sampler.samples > 0
+    assert any(
+        line.startswith("stage:stt;") and "test_profiler:_busy_spin" in line
+        for line in output.splitlines()
+    )
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stage_restores_previous_stage():
+    sampler = StackSampler(loop=asyncio.get_running_loop())
+
+    with pipeline_stage("llm"):
+        with pipeline_stage("safety_check"):
+            assert sampler._current_stage() == "safety_check"
+        assert sampler._current_stage() == "llm"
+    assert sampler._current_stage() == "other"
+
+
+def test_collapsed_reset_clears_samples():
+    sampler = StackSampler()
+    sampler.sample_once()
+
+    assert sampler.collapsed(reset=True).startswith("stage:unknown;")
+    assert sampler.collapsed() == ""
+    assert sampler.samples == 0
+
+
+@pytest.fixture
+def profiling_client(monkeypatch):
+    from src.api.routes.profiling import router
+
+    settings = Settings(secret_key="test", profiling_enabled=True, profiling_token="s3")
+    monkeypatch.setattr("src.api.routes.profiling.get_settings", lambda: settings)
+
+    app = FastAPI()
+    app.include_router(router, prefix="/debug")
+    app.dependency_overrides[get_request_context] = lambda: RequestContext(
+        request_id="test-request-id"
+    )
+    return TestClient(app), settings
+
+
+def test_profile_endpoint_returns_collapsed_stacks(profiling_client):
+    client, _ = profiling_client
+
+    response = client.get(
+        "/debug/profile",
+        params={"seconds": 0.05, "interval_ms": 1},
+        headers={"X-Profiling-Token": "s3"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert int(response.headers["X-Profile-Samples"]) > 0
+
+
+def test_profile_endpoint_requires_token(profiling_client):
+    client, _ = profiling_client
+
+    response = client.get("/debug/profile", params={"seconds": 0.01})
+
+    assert response.status_code == 401
+    assert response.json()["error"]["code"] == "invalid_token"
+
+
+def test_profile_endpoint_refuses_without_configured_token(profiling_client):
+    client, settings = profiling_client
+    settings.profiling_token = None
+
+    response = client.get(
+        "/debug/profile",
+        params={"seconds": 0.01},
+        headers={"X-Profiling-Token": ""},
+    )
+
+    assert response.status_code == 403
+    assert response.json()["error"]["code"] == "profiling_token_not_configured"
+
+
+def test_profile_endpoint_disabled_by_default(profiling_client):
+    client, settings = profiling_client
+    settings.profiling_enabled = False
+
+    response = client.get("/debug/profile", params={"seconds": 0.01})
+
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "not_found"
@@ -0,0 +1,157 @@
+"""Tests for background rolling session summaries."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.api.models.session_models import SessionStartRequest
+from src.domain.session_state import TurnRecord
+from src.providers.llm_groq import GroqLLMProvider
+from src.services.rolling_summary import RollingSummarizer
+from src.services.session_store import SessionStore
+
+
+def _turn(number: int) -> TurnRecord:
+    return TurnRecord(
+        turn_number=number,
+        transcript=f"Answer {number}",
+        assistant_text=f"Question {number}?",
+        coaching_feedback=None,
+    )
+
+
+@pytest.fixture
+def store_and_session():
+    store = SessionStore(ttl_minutes=60)
+    session = store.create_session(
+        SessionStartRequest(
+            role="Software Engineer",
+            interview_type="behavioral",
+            difficulty="medium",
+            question_count=5,
+        )
+    )
+    return store, session.session_id
+
+
+def _merging_provider(fail_on: set[int] | None = None) -> AsyncMock:
+    """Provider whose running summary lists every merged turn number in notes."""
+    fail_on = fail_on or set()
+    provider = AsyncMock()
+
+    async def update_rolling_summary(previous_summary, turn, **kwargs):
+        if turn["turn_number"] in fail_on:
+            fail_on.discard(turn["turn_number"])
+            return None
+        notes = (previous_summary or {}).get("notes", "")
+        return {
+            "strengths": [],
+            "improvements": [],
+            "notes": f"{notes}{turn['turn_number']};",
+        }
+
+    provider.update_rolling_summary.side_effect = update_rolling_summary
+    return provider
+
+
+def test_set_rolling_summary_ignores_stale_summaries(store_and_session) -> None:
+    store, session_id = store_and_session
+
+    assert store.set_rolling_summary(session_id, {"notes": "a", "covered_turns": 2})
+    assert not store.set_rolling_summary(session_id, {"notes": "b", "covered_turns": 1})
+    assert not store.set_rolling_summary("missing", {"covered_turns": 3})
+
+    session = store.get_session(session_id)
+    assert session is not None
+    assert session.rolling_summary == {"notes": "a", "covered_turns": 2}
+
+
+@pytest.mark.asyncio
+async def test_summarizer_merges_turns_in_order(store_and_session) -> None:
+    """Updates for one session run serially and each merges only new turns."""
+    store, session_id = store_and_session
+    provider = _merging_provider()
+    summarizer = RollingSummarizer(lambda: provider)
+
+    store.update_session(session_id, turn_history=[_turn(1)])
+    summarizer.schedule(store, session_id)
+    store.update_session(session_id, turn_history=[_turn(1), _turn(2)])
+    summarizer.schedule(store, session_id)
+
+    assert await summarizer.wait(session_id, timeout=1)
+    session = store.get_session(session_id)
+    assert session is not None
+    assert session.rolling_summary["notes"] == "1;2;"
+    assert session.rolling_summary["covered_turns"] == 2
+    assert provider.update_rolling_summary.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summarizer_catches_up_after_failed_update(store_and_session) -> None:
+    """A failed update leaves its turn for the next update to merge."""
+    store, session_id = store_and_session
+    provider = _merging_provider(fail_on={1})
+    summarizer = RollingSummarizer(lambda: provider)
+
+    store.update_session(session_id, turn_history=[_turn(1)])
+    await summarizer.schedule(store, session_id)
+    session = store.get_session(session_id)
+    assert session is not None and session.rolling_summary is None
+
+    store.update_session(session_id, turn_history=[_turn(1), _turn(2)])
+    await summarizer.schedule(store, session_id)
+
+    session = store.get_session(session_id)
+    assert session is not None
+    assert session.rolling_summary["notes"] == "1;2;"
+
+
+@pytest.mark.asyncio
+async def test_summarizer_wait_times_out_on_slow_update(store_and_session) -> None:
+    store, session_id = store_and_session
+    release = asyncio.Event()
+    provider = AsyncMock()
+
+    async def slow_update(**kwargs):
+        await release.wait()
+        return {"strengths": [], "improvements": [], "notes": ""}
+
+    provider.update_rolling_summary.side_effect = slow_update
+    summarizer = RollingSummarizer(lambda: provider)
+    store.update_session(session_id, turn_history=[_turn(1)])
+    summarizer.schedule(store, session_id)
+
+    assert not await summarizer.wait(session_id, timeout=0.01)
+    release.set()
+    assert await summarizer.wait(session_id, timeout=1)
+    assert await summarizer.wait("unknown-session")
+
+
+def test_final_summary_prompt_merges_running_summary() -> None:
+    provider = GroqLLMProvider(api_key="test_key")
+
+    prompt = provider._build_session_summary_prompt(
+        turn_history=[
+            {
+                "turn_number": 5,
+                "transcript": "Answer 5",
+                "assistant_text": "Thanks!",
+                "coaching_feedback": None,
+            }
+        ],
+        role="Backend Engineer",
+        interview_type="behavioral",
+        difficulty="medium",
+        average_scores={"clarity": 4.0},
+        rolling_summary={
+            "strengths": ["Concrete examples"],
+            "improvements": [],
+            "notes": "",
+            "covered_turns": 4,
+        },
+    )
+
+    assert "Running summary of turns 1-4" in prompt
+    assert "Concrete examples" in prompt
+    assert "Answer 5" in prompt
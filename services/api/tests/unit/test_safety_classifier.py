@@ -0,0 +1,177 @@
+"""Tests for the local safety classifier and its micro-batching wrapper."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.services.orchestrator import TurnProcessingError, process_turn
+from src.services.safety_classifier import (
+    BatchingSafetyClassifier,
+    HashedLinearClassifier,
+)
+from src.services.safety_filter import SafetyFilter
+from src.settings.config import Settings
+
+HARMFUL = [
+    "you are worthless and everyone hates you",
+    "i am going to find where you live",
+    "shut up you pathetic idiot",
+    "people like you deserve to suffer",
+]
+BENIGN = [
+    "i led the migration of our billing service",
+    "we reduced latency by forty percent",
+    "i mentored two junior engineers on testing",
+    "the outage taught me to add better alerts",
+]
+
+
+class RecordingClassifier:
+    """Scores texts containing 'bad' as harmful and records each batch."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def score_batch(self, texts):
+        self.batches.append(list(texts))
+        return [1.0 if "bad" in text else 0.0 for text in texts]
+
+
+@pytest.fixture(scope="module")
+def trained_model() -> HashedLinearClassifier:
+    return HashedLinearClassifier.fit(
+        HARMFUL + BENIGN, [1] * len(HARMFUL) + [0] * len(BENIGN)
+    )
+
+
+def test_hashed_linear_classifier_separates_training_classes(trained_model) -> None:
+    """The reference model scores harmful text above benign text."""
+    harmful_scores = trained_model.score_batch(HARMFUL)
+    benign_scores = trained_model.score_batch(BENIGN)
+
+    assert min(harmful_scores) > 0.8
+    assert max(benign_scores) < 0.2
+
+
+def test_hashed_linear_classifier_round_trips_through_json(
+    trained_model, tmp_path
+) -> None:
+    """Saved model files reload to identical scores."""
+    model_file = tmp_path / "model.json"
+    trained_model.save(str(model_file))
+
+    reloaded = HashedLinearClassifier.from_file(str(model_file))
+
+    texts = ["you pathetic idiot", "i led the migration"]
+    assert reloaded.score_batch(texts) == pytest.approx(trained_model.score_batch(texts))
+
+
+@pytest.mark.asyncio
+async def test_batching_classifier_scores_concurrent_checks_together() -> None:
+    """Concurrent checks share one score_batch call and keep their own results."""
+    classifier = RecordingClassifier()
+    batching = BatchingSafetyClassifier(classifier, max_batch_size=8, max_wait_ms=20)
+
+    results = await asyncio.gather(
+        batching.check("fine answer"),
+        batching.check("bad answer"),
+        batching.check("another fine answer"),
+    )
+
+    assert classifier.batches == [["fine answer", "bad answer", "another fine answer"]]
+    assert [r.is_safe for r in results] == [True, False, True]
+    assert results[1].reason == "classifier_flagged"
+
+
+@pytest.mark.asyncio
+async def test_batching_classifier_flushes_full_batches_immediately() -> None:
+    """A batch reaching max_batch_size is scored without waiting for the timer."""
+    classifier = RecordingClassifier()
+    batching = BatchingSafetyClassifier(classifier, max_batch_size=2, max_wait_ms=10_000)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batching.check("a"), batching.check("b")), timeout=1
+    )
+
+    assert classifier.batches == [["a", "b"]]
+    assert all(r.is_safe for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batching_classifier_propagates_model_errors() -> None:
+    """Every caller in a failed batch sees the classifier error."""
+    classifier = Mock()
+    classifier.score_batch.side_effect = RuntimeError("model crashed")
+    batching = BatchingSafetyClassifier(classifier, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError, match="model crashed"):
+        await batching.check("anything")
+
+
+@pytest.mark.asyncio
+async def test_classifier_refusal_short_circuits_before_llm() -> None:
+    """A classifier hit raises content_refused without calling the LLM."""
+    mock_llm = AsyncMock()
+    session = Mock(turn_count=0, last_activity_at=datetime.now(timezone.utc))
+    batching = BatchingSafetyClassifier(RecordingClassifier(), max_wait_ms=1)
+
+    with patch("src.services.orchestrator.get_llm_provider", return_value=mock_llm):
+        with pytest.raises(TurnProcessingError) as exc_info:
+            await process_turn(
+                audio_bytes=None,
+                mime_type=None,
+                session=session,
+                role="backend developer",
+                interview_type="technical interview",
+                difficulty="mid-level",
+                asked_questions=[],
+                question_count=5,
+                tts_cache=Mock(),
+                safety_filter=SafetyFilter(enabled=True),
+                safety_classifier=batching,
+                transcript="a bad paraphrased threat",
+                request_id="req-classifier-1",
+            )
+
+    assert exc_info.value.code == "content_refused"
+    assert exc_info.value.stage == "llm"
+    mock_llm.generate_follow_up.assert_not_called()
+    assert session.turn_count == 0
+
+
+@pytest.mark.asyncio
+async def test_classifier_runs_before_llm_in_concurrent_mode() -> None:
+    """Concurrent safety mode never starts the LLM call before the classifier."""
+    mock_llm = AsyncMock()
+    session = Mock(turn_count=0, last_activity_at=datetime.now(timezone.utc))
+    batching = BatchingSafetyClassifier(RecordingClassifier(), max_wait_ms=1)
+
+    with (
+        patch(
+            "src.services.orchestrator.get_settings",
+            return_value=Settings(safety_check_concurrent=True),
+        ),
+        patch("src.services.orchestrator.get_llm_provider", return_value=mock_llm),
+    ):
+        with pytest.raises(TurnProcessingError) as exc_info:
+            await process_turn(
+                audio_bytes=None,
+                mime_type=None,
+                session=session,
+                role="backend developer",
+                interview_type="technical interview",
+                difficulty="mid-level",
+                asked_questions=[],
+                question_count=5,
+                tts_cache=Mock(),
+                safety_filter=SafetyFilter(enabled=True),
+                safety_classifier=batching,
+                transcript="a bad paraphrased threat",
+                request_id="req-classifier-2",
+            )
+
+    assert exc_info.value.code == "content_refused"
+    mock_llm.generate_follow_up.assert_not_called()
+    mock_llm.generate_follow_up.assert_not_awaited()
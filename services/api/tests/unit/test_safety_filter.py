@@ -1,6 +1,11 @@
 """Tests for transcript safety filter."""
 
-from src.services.safety_filter import SafetyFilter
+import json
+import os
+import re
+import time
+
+from src.services.safety_filter import PatternMatcher, SafetyFilter
 
 
 def test_check_transcript_detects_obvious_violations() -> None:
@@ -36,3 +41,190 @@ def test_check_transcript_bypasses_when_disabled() -> None:
 
     assert result.is_safe is True
     assert result.reason is None
+
+
+def test_check_transcript_reports_first_listed_pattern(tmp_path) -> None:
+    """Reason matches the first pattern in file order, whatever tier matched it."""
+    patterns_file = tmp_path / "patterns.json"
+    patterns_file.write_text(
+        json.dumps(
+            [
+                {"name": "threat", "pattern": r"\bburn\s+it\s+down\b"},
+                {"name": "ssn", "pattern": r"\d{3}-\d{2}-\d{4}"},
+                {"name": "slur", "pattern": r"\b(darn|heck)\b"},
+                {"name": "heck_phrase", "pattern": r"\bheck\s+no\b"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    filter_service = SafetyFilter(patterns_file=str(patterns_file))
+
+    assert filter_service.check_transcript("HECK no").reason == "slur"
+    assert filter_service.check_transcript("heck, my ssn is 123-45-6789").reason == (
+        "ssn"
+    )
+    assert filter_service.check_transcript("darn, let's burn it down").reason == (
+        "threat"
+    )
+    assert filter_service.check_transcript("hecking fine").is_safe is True
+
+
+def test_pattern_matcher_agrees_with_sequential_scan() -> None:
+    """Indexed matching returns the same reason as searching each regex in order."""
+    patterns = [
+        ("word", r"\bdrop\b"),
+        ("alternation", r"\b(?:table|tables)\b"),
+        ("prefix", r"\bsel+ect\s+\*"),
+        ("substring", r"ops"),
+        ("top_level_or", r"\bfoo|bar\b"),
+        ("class", r"[0-9]{4}"),
+        ("grouped_prefix", r"\b(tell\s+me\s+your\s+(pin|password))\b"),
+        ("optional_group", r"\b(?:please\s+)?share\b"),
+        ("grouped_alternation", r"\b(i\s+will\s+go|we\s+go)\b"),
+    ]
+    matcher = PatternMatcher(patterns)
+    texts = [
+        "Tell me your PIN",
+        "tell me your name",
+        "please share it",
+        "share it",
+        "we go now",
+        "I will go",
+        "drop it",
+        "Tables and chairs",
+        "sellect * from users",
+        "whoops",
+        "rebar",
+        "foobar",
+        "call 5550 now",
+        "nothing to see",
+        "dropped the select",
+    ]
+
+    for text in texts:
+        expected = next(
+            (
+                name
+                for name, pattern in patterns
+                if re.search(pattern, text, flags=re.IGNORECASE)
+            ),
+            None,
+        )
+        assert matcher.search(text) == expected, text
+
+
+def test_pattern_matcher_agrees_with_sequential_scan_on_non_ascii() -> None:
+    """Non-ASCII patterns and transcripts keep re.IGNORECASE semantics."""
+    patterns = [
+        ("dotted_capital", r"\bİstanbul\b"),
+        ("ascii_city", r"\bistanbul\b"),
+        ("sharp_s", r"\bstraße\b"),
+        ("accented_prefix", r"\bcafé\s+\w+"),
+        ("kelvin", r"\bkelvin\b"),
+        ("word", r"\bdrop\b"),
+    ]
+    matcher = PatternMatcher(patterns)
+    texts = [
+        "I moved to İstanbul",
+        "I moved to ISTANBUL",
+        "i̇stanbul",
+        "STRASSE",
+        "Straße",
+        "CAFÉ latte",
+        "\u212aelvin scale",
+        "drop the İndex",
+        "naïve but fine",
+        "nothing to see",
+    ]
+
+    for text in texts:
+        expected = next(
+            (
+                name
+                for name, pattern in patterns
+                if re.search(pattern, text, flags=re.IGNORECASE)
+            ),
+            None,
+        )
+        assert matcher.search(text) == expected, text
+
+
+def test_pattern_matcher_scans_small_sets_sequentially() -> None:
+    """Too few indexable patterns to pay for tokenizing: search them in order."""
+    patterns = [
+        ("word", r"\bdrop\b"),
+        ("prefix", r"\bsel+ect\s+\*"),
+        ("substring", r"ops"),
+    ]
+    matcher = PatternMatcher(patterns)
+
+    assert matcher._sequential == [0, 1, 2]
+    assert matcher.search("whoops, drop it") == "word"
+    assert matcher.search("sellect * from users") == "prefix"
+    assert matcher.search("nothing to see") is None
+
+
+def test_pattern_matcher_skips_invalid_patterns() -> None:
+    """An invalid regex in a custom list is skipped instead of failing the load."""
+    matcher = PatternMatcher([("broken", r"\b(unclosed"), ("ok", r"\bbad\b")])
+
+    assert len(matcher) == 1
+    assert matcher.search("that was bad") == "ok"
+
+
+def _write_patterns(path, patterns, mtime_ns: int) -> None:
+    path.write_text(json.dumps(patterns), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_reload_if_changed_swaps_in_new_patterns(tmp_path) -> None:
+    """An edited patterns file replaces the active set; an unchanged one is a no-op."""
+    patterns_file = tmp_path / "patterns.json"
+    _write_patterns(patterns_file, [{"name": "old", "pattern": r"\bfoo\b"}], 10**18)
+    filter_service = SafetyFilter(patterns_file=str(patterns_file))
+
+    assert filter_service.reload_if_changed() is False
+
+    _write_patterns(
+        patterns_file, [{"name": "new", "pattern": r"\bbar\b"}], 10**18 + 10**9
+    )
+    assert filter_service.reload_if_changed() is True
+    assert filter_service.check_transcript("foo").is_safe is True
+    assert filter_service.check_transcript("bar").reason == "new"
+
+
+def test_reload_if_changed_keeps_previous_set_on_invalid_file(tmp_path) -> None:
+    """A broken or deleted patterns file never drops the active patterns."""
+    patterns_file = tmp_path / "patterns.json"
+    _write_patterns(patterns_file, [{"name": "old", "pattern": r"\bfoo\b"}], 10**18)
+    filter_service = SafetyFilter(patterns_file=str(patterns_file))
+
+    patterns_file.write_text("{not json", encoding="utf-8")
+    os.utime(patterns_file, ns=(10**18 + 10**9, 10**18 + 10**9))
+    assert filter_service.reload_if_changed() is False
+    assert filter_service.check_transcript("foo").reason == "old"
+
+    patterns_file.unlink()
+    assert filter_service.reload_if_changed() is False
+    assert filter_service.check_transcript("foo").reason == "old"
+
+
+def test_check_transcript_reloads_in_background(tmp_path) -> None:
+    """Checks trigger a throttled background reload and keep using the old set meanwhile."""
+    patterns_file = tmp_path / "patterns.json"
+    _write_patterns(patterns_file, [{"name": "old", "pattern": r"\bfoo\b"}], 10**18)
+    filter_service = SafetyFilter(
+        patterns_file=str(patterns_file), reload_interval_seconds=0.01
+    )
+    _write_patterns(
+        patterns_file, [{"name": "new", "pattern": r"\bbar\b"}], 10**18 + 10**9
+    )
+
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        if filter_service.check_transcript("bar").reason == "new":
+            break
+        time.sleep(0.01)
+
+    assert filter_service.check_transcript("bar").reason == "new"
+    assert filter_service.check_transcript("foo").is_safe is True
@@ -1,5 +1,6 @@
 """Safety integration tests for turn orchestrator."""
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
@@ -9,6 +10,7 @@ import pytest
 from src.providers.llm_groq import LLMResponse
 from src.services.orchestrator import TurnProcessingError, process_turn
 from src.services.safety_filter import SafetyFilter
+from src.settings.config import Settings
 
 
 @dataclass
@@ -105,3 +107,111 @@ async def test_llm_refusal_returns_content_refused_and_does_not_increment_turn(
     assert error.request_id == "req-safety-2"
     assert error.message_safe.startswith("Let's stay focused")
     assert session.turn_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_safety_refusal_cancels_inflight_llm_call(
+    mock_tts_cache: Mock,
+) -> None:
+    """Optimistic mode cancels the started LLM call when the transcript is refused."""
+    llm_started = asyncio.Event()
+    llm_cancelled = asyncio.Event()
+
+    async def slow_follow_up(**kwargs):
+        llm_started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            llm_cancelled.set()
+            raise
+
+    mock_llm = Mock()
+    mock_llm.generate_follow_up = slow_follow_up
+    mock_tts = Mock()
+    mock_tts.synthesize = AsyncMock(return_value=b"audio")
+
+    session = MockSessionState(
+        session_id="test-session",
+        turn_count=1,
+        last_activity_at=datetime.now(timezone.utc),
+    )
+
+    with (
+        patch(
+            "src.services.orchestrator.get_settings",
+            return_value=Settings(safety_check_concurrent=True),
+        ),
+        patch("src.services.orchestrator.get_llm_provider", return_value=mock_llm),
+        patch("src.services.orchestrator.get_tts_provider", return_value=mock_tts),
+    ):
+        with pytest.raises(TurnProcessingError) as exc_info:
+            await process_turn(
+                audio_bytes=None,
+                mime_type=None,
+                session=session,
+                role="backend developer",
+                interview_type="technical interview",
+                difficulty="mid-level",
+                asked_questions=[],
+                question_count=5,
+                tts_cache=mock_tts_cache,
+                safety_filter=SafetyFilter(enabled=True),
+                transcript="I will kill this person",
+                request_id="req-safety-3",
+            )
+
+    assert exc_info.value.code == "content_refused"
+    assert exc_info.value.stage == "llm"
+    assert llm_started.is_set()
+    assert llm_cancelled.is_set()
+    mock_tts.synthesize.assert_not_called()
+    mock_tts_cache.store.assert_not_called()
+    assert session.turn_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_safety_pass_returns_llm_response(
+    mock_tts_cache: Mock,
+) -> None:
+    """Optimistic mode returns the LLM follow-up when the transcript is safe."""
+    mock_llm = AsyncMock()
+    mock_llm.generate_follow_up.return_value = LLMResponse(
+        follow_up_question="What was the hardest trade-off?",
+        coaching_feedback=None,
+        refused=False,
+    )
+    mock_tts = Mock()
+    mock_tts.synthesize = AsyncMock(return_value=b"audio")
+
+    session = MockSessionState(
+        session_id="test-session",
+        turn_count=1,
+        last_activity_at=datetime.now(timezone.utc),
+    )
+
+    with (
+        patch(
+            "src.services.orchestrator.get_settings",
+            return_value=Settings(safety_check_concurrent=True),
+        ),
+        patch("src.services.orchestrator.get_llm_provider", return_value=mock_llm),
+        patch("src.services.orchestrator.get_tts_provider", return_value=mock_tts),
+    ):
+        result = await process_turn(
+            audio_bytes=None,
+            mime_type=None,
+            session=session,
+            role="backend developer",
+            interview_type="technical interview",
+            difficulty="mid-level",
+            asked_questions=[],
+            question_count=5,
+            tts_cache=mock_tts_cache,
+            safety_filter=SafetyFilter(enabled=True),
+            transcript="I split the monolith into three services.",
+            request_id="req-safety-4",
+        )
+
+    assert result.assistant_text == "What was the hardest trade-off?"
+    mock_tts.synthesize.assert_awaited_once_with("What was the hardest trade-off?")
+    assert session.turn_count == 2
@@ -1,10 +1,12 @@
 """Unit tests for session store."""
 
+import dataclasses
+
 import pytest
 from datetime import datetime, timedelta, timezone
 
 from src.api.models.session_models import SessionStartRequest
-from src.domain.session_state import TurnRecord
+from src.domain.session_state import RubricScores, TurnRecord
 from src.services.session_store import SessionStore
 
 
@@ -148,8 +150,8 @@ def test_cleanup_expired_sessions_preserves_active_sessions(
     assert session_store.get_session(session.session_id) is not None
 
 
-def test_turn_history_is_deep_copied(session_store, sample_request):
-    """Turn history should be copied deeply on get/update responses."""
+def test_turn_history_is_isolated_between_copies(session_store, sample_request):
+    """Copies get their own history list; the records themselves are frozen."""
     session = session_store.create_session(sample_request)
 
     updated = session_store.update_session(
@@ -171,7 +173,66 @@ def test_turn_history_is_deep_copied(session_store, sample_request):
     assert first_copy is not None
     assert second_copy is not None
     assert first_copy.turn_history is not second_copy.turn_history
-    assert first_copy.turn_history[0] is not second_copy.turn_history[0]
 
-    first_copy.turn_history[0].transcript = "Mutated"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first_copy.turn_history[0].transcript = "Mutated"
+    first_copy.turn_history.clear()
     assert second_copy.turn_history[0].transcript == "Answer"
+
+
+def test_append_turn_extends_history_in_place(session_store, sample_request):
+    """append_turn adds to the stored history without rebuilding it."""
+    session = session_store.create_session(sample_request)
+    stored_history = session_store._sessions[session.session_id].turn_history
+
+    for turn_number in (1, 2):
+        assert session_store.append_turn(
+            session.session_id,
+            TurnRecord(
+                turn_number=turn_number,
+                transcript=f"Answer {turn_number}",
+                assistant_text="Follow-up",
+            ),
+            turn_count=turn_number,
+        )
+
+    assert session_store._sessions[session.session_id].turn_history is stored_history
+    latest = session_store.get_session(session.session_id)
+    assert latest.turn_count == 2
+    assert [turn.transcript for turn in latest.turn_history] == [
+        "Answer 1",
+        "Answer 2",
+    ]
+    assert latest.last_activity_at >= session.last_activity_at
+
+
+def test_append_turn_returns_false_for_unknown_id(session_store):
+    """append_turn reports a missing session instead of raising."""
+    turn = TurnRecord(turn_number=1, transcript="Answer", assistant_text="Next?")
+
+    assert session_store.append_turn("non-existent-id", turn) is False
+
+
+def test_rubric_scores_are_copied_and_averaged(session_store, sample_request):
+    """Running rubric totals survive updates and are copied on reads."""
+    session = session_store.create_session(sample_request)
+    rubric_scores = RubricScores()
+    for score in (3, 4):
+        rubric_scores.record(
+            {
+                "dimensions": [
+                    {"label": "Clarity", "score": score, "tip": "tip"},
+                    {"label": "Filler Words", "score": 5, "tip": "tip"},
+                ]
+            }
+        )
+
+    session_store.update_session(session.session_id, rubric_scores=rubric_scores)
+    copy = session_store.get_session(session.session_id)
+
+    assert copy is not None
+    assert copy.rubric_scores.averages() == {"clarity": 3.5, "filler_words": 5.0}
+    copy.rubric_scores.record({"dimensions": [{"label": "Clarity", "score": 1}]})
+    stored = session_store.get_session(session.session_id)
+    assert stored is not None
+    assert stored.rubric_scores.counts == {"clarity": 2, "filler_words": 2}
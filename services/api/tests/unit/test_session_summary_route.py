@@ -0,0 +1,162 @@
+"""Tests for GET /session/{session_id}/summary and background summary jobs."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.api.dependencies import RequestContext, get_request_context
+from src.api.dependencies.shared_services import (
+    get_session_store,
+    get_summary_jobs,
+    get_token_service,
+)
+from src.api.models.session_models import SessionStartRequest
+from src.api.routes.session import router
+from src.services.orchestrator import SessionSummaryRequest
+from src.services.session_store import SessionStore
+from src.services.summary_jobs import SessionSummaryJobs
+
+SUMMARY = {
+    "overall_assessment": "Clear, concrete answers.",
+    "strengths": ["Concrete examples"],
+    "improvements": ["Quantify impact"],
+    "average_scores": {"clarity": 4.0},
+    "recommended_actions": [],
+}
+
+
+@pytest.fixture
+def store() -> SessionStore:
+    return SessionStore(ttl_minutes=60)
+
+
+@pytest.fixture
+def session_id(store: SessionStore) -> str:
+    session = store.create_session(
+        SessionStartRequest(
+            role="Software Engineer",
+            interview_type="behavioral",
+            difficulty="medium",
+            question_count=1,
+        )
+    )
+    return session.session_id
+
+
+@pytest.fixture
+def jobs() -> SessionSummaryJobs:
+    return SessionSummaryJobs()
+
+
+@pytest.fixture
+def app(store: SessionStore, session_id: str, jobs: SessionSummaryJobs) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/session")
+    token_service = Mock()
+    token_service.verify_token.side_effect = lambda token: (
+        session_id if token == "valid-token" else None
+    )
+    app.dependency_overrides[get_request_context] = lambda: RequestContext(
+        request_id="test-request-id"
+    )
+    app.dependency_overrides[get_session_store] = lambda: store
+    app.dependency_overrides[get_token_service] = lambda: token_service
+    app.dependency_overrides[get_summary_jobs] = lambda: jobs
+    return app
+
+
+async def _get_summary(app: FastAPI, session_id: str, **params) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(
+            f"/session/{session_id}/summary",
+            params=params,
+            headers={"Authorization": "Bearer valid-token"},
+        )
+
+
+def _summary_request() -> SessionSummaryRequest:
+    return SessionSummaryRequest(
+        turn_history=[],
+        role="Software Engineer",
+        interview_type="behavioral",
+        difficulty="medium",
+    )
+
+
+@pytest.mark.asyncio
+async def test_summary_returns_ready_summary(app, store, session_id) -> None:
+    store.set_session_summary(session_id, SUMMARY, "ready")
+
+    response = await _get_summary(app, session_id)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["summary_status"] == "ready"
+    assert data["session_summary"]["strengths"] == ["Concrete examples"]
+
+
+@pytest.mark.asyncio
+async def test_summary_before_final_turn_returns_409(app, session_id) -> None:
+    response = await _get_summary(app, session_id)
+
+    assert response.status_code == 409
+    assert response.json()["error"]["code"] == "session_not_complete"
+
+
+@pytest.mark.asyncio
+async def test_summary_rejects_invalid_token(app, session_id) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            f"/session/{session_id}/summary",
+            headers={"Authorization": "Bearer wrong-token"},
+        )
+
+    assert response.status_code == 401
+    assert response.json()["error"]["code"] == "invalid_token"
+
+
+@pytest.mark.asyncio
+async def test_summary_long_polls_until_background_job_finishes(
+    app, store, session_id, jobs
+) -> None:
+    release = asyncio.Event()
+
+    async def slow_summary(request):
+        await release.wait()
+        return SUMMARY
+
+    with patch("src.services.summary_jobs.summarize_session", side_effect=slow_summary):
+        jobs.start(store, session_id, _summary_request())
+
+        pending = await _get_summary(app, session_id)
+        assert pending.json()["data"] == {
+            "summary_status": "pending",
+            "session_summary": None,
+        }
+
+        poll = asyncio.create_task(_get_summary(app, session_id, wait=5))
+        await asyncio.sleep(0.01)
+        assert not poll.done()
+        release.set()
+        response = await asyncio.wait_for(poll, timeout=1)
+
+    assert response.json()["data"]["summary_status"] == "ready"
+    assert response.json()["data"]["session_summary"]["average_scores"] == {
+        "clarity": 4.0
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_background_summary_is_reported(store, session_id, jobs) -> None:
+    with patch("src.services.summary_jobs.summarize_session", return_value=None):
+        await jobs.start(store, session_id, _summary_request())
+
+    session = store.get_session(session_id)
+    assert session is not None
+    assert session.summary_status == "failed"
+    assert session.session_summary is None
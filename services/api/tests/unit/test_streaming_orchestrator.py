@@ -0,0 +1,309 @@
+"""Streaming and split LLM response tests for turn orchestrator (early TTS)."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.api.models.turn_models import CoachingFeedback
+from src.providers.llm_groq import LLMResponse
+from src.services.orchestrator import TurnProcessingError, process_turn
+from src.services.safety_filter import SafetyCheckResult, SafetyFilter
+from src.settings.config import Settings
+
+
+@dataclass
+class MockSessionState:
+    """Mock session state for testing."""
+
+    session_id: str
+    turn_count: int
+    last_activity_at: datetime
+
+
+class StreamingLLM:
+    """Reports the question early, then waits before finishing the response."""
+
+    def __init__(self, streamed: str, final: LLMResponse):
+        self.streamed = streamed
+        self.final = final
+        self.finish = asyncio.Event()
+        self.callback_seen = False
+
+    async def generate_follow_up(self, on_follow_up_question=None, **kwargs):
+        if on_follow_up_question is not None:
+            self.callback_seen = True
+            on_follow_up_question(self.streamed)
+            await asyncio.sleep(0)  # let the early TTS task start
+        await self.finish.wait()
+        return self.final
+
+
+class RecordingTTS:
+    def __init__(self):
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+        self.release = asyncio.Event()
+
+    async def synthesize(self, text: str) -> bytes:
+        self.started.append(text)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(text)
+            raise
+        return f"audio:{text}".encode()
+
+
+class GatedFilter(SafetyFilter):
+    """Regex filter whose verdict is held until ``verdict`` is set."""
+
+    def __init__(self, is_safe: bool):
+        super().__init__(enabled=True)
+        self.is_safe = is_safe
+        self.verdict = threading.Event()
+
+    def check_transcript(self, transcript: str) -> SafetyCheckResult:
+        self.verdict.wait(timeout=5)
+        return SafetyCheckResult(is_safe=self.is_safe, reason="gated")
+
+
+async def _run_turn(llm, tts, tts_cache=None, safety_filter=None, **settings):
+    session = MockSessionState(
+        session_id="test-session",
+        turn_count=0,
+        last_activity_at=datetime.now(timezone.utc),
+    )
+    with (
+        patch(
+            "src.services.orchestrator.get_settings",
+            return_value=Settings(**{"llm_response_mode": "streaming", **settings}),
+        ),
+        patch("src.services.orchestrator.get_llm_provider", return_value=llm),
+        patch("src.services.orchestrator.get_tts_provider", return_value=tts),
+    ):
+        return await process_turn(
+            audio_bytes=None,
+            mime_type=None,
+            session=session,
+            role="backend developer",
+            interview_type="technical interview",
+            difficulty="mid-level",
+            asked_questions=[],
+            question_count=5,
+            tts_cache=tts_cache or Mock(),
+            safety_filter=safety_filter or SafetyFilter(enabled=True),
+            transcript="I designed the caching layer.",
+            request_id="req-stream-1",
+        )
+
+
+@pytest.mark.asyncio
+async def test_tts_starts_before_llm_response_finishes() -> None:
+    llm = StreamingLLM(
+        "How did you invalidate it?",
+        LLMResponse(follow_up_question="How did you invalidate it?"),
+    )
+    tts = RecordingTTS()
+
+    turn = asyncio.create_task(_run_turn(llm, tts))
+    await asyncio.sleep(0.01)
+
+    assert tts.started == ["How did you invalidate it?"]
+    assert not turn.done()
+    llm.finish.set()
+    tts.release.set()
+    result = await asyncio.wait_for(turn, timeout=1)
+
+    assert result.tts_audio_url == "/tts/req-stream-1"
+    assert tts.started == ["How did you invalidate it?"]
+
+
+@pytest.mark.asyncio
+async def test_llm_refusal_cancels_early_tts() -> None:
+    llm = StreamingLLM(
+        "Let's keep it professional.",
+        LLMResponse(follow_up_question="Let's keep it professional.", refused=True),
+    )
+    llm.finish.set()
+    tts = RecordingTTS()
+
+    with pytest.raises(TurnProcessingError) as exc_info:
+        await _run_turn(llm, tts)
+
+    assert exc_info.value.code == "content_refused"
+    assert tts.cancelled == ["Let's keep it professional."]
+
+
+@pytest.mark.asyncio
+async def test_early_tts_waits_for_concurrent_safety_verdict() -> None:
+    llm = StreamingLLM(
+        "Why that design?", LLMResponse(follow_up_question="Why that design?")
+    )
+    llm.finish.set()
+    tts = RecordingTTS()
+    tts.release.set()
+    safety_filter = GatedFilter(is_safe=True)
+    tts_cache = Mock()
+
+    turn = asyncio.create_task(
+        _run_turn(
+            llm,
+            tts,
+            tts_cache=tts_cache,
+            safety_filter=safety_filter,
+            safety_check_concurrent=True,
+        )
+    )
+    await asyncio.sleep(0.01)
+
+    assert llm.callback_seen is True
+    assert tts.started == []
+    safety_filter.verdict.set()
+    result = await asyncio.wait_for(turn, timeout=1)
+
+    assert tts.started == ["Why that design?"]
+    assert result.tts_audio_url == "/tts/req-stream-1"
+    tts_cache.store.assert_called_once_with("req-stream-1", b"audio:Why that design?")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_safety_refusal_never_synthesizes_or_caches() -> None:
+    llm = StreamingLLM(
+        "Why that design?", LLMResponse(follow_up_question="Why that design?")
+    )
+    tts = RecordingTTS()
+    tts.release.set()
+    safety_filter = GatedFilter(is_safe=False)
+    tts_cache = Mock()
+
+    turn = asyncio.create_task(
+        _run_turn(
+            llm,
+            tts,
+            tts_cache=tts_cache,
+            safety_filter=safety_filter,
+            safety_check_concurrent=True,
+        )
+    )
+    await asyncio.sleep(0.01)
+    safety_filter.verdict.set()
+    with pytest.raises(TurnProcessingError) as exc_info:
+        await asyncio.wait_for(turn, timeout=1)
+
+    assert exc_info.value.code == "content_refused"
+    assert tts.started == []
+    tts_cache.store.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_final_question_is_synthesized_again() -> None:
+    llm = StreamingLLM(
+        "Preview question?",
+        LLMResponse(follow_up_question="Final question?"),
+    )
+    llm.finish.set()
+    tts = RecordingTTS()
+    tts.release.set()
+
+    result = await _run_turn(llm, tts)
+
+    assert result.assistant_text == "Final question?"
+    assert tts.started[-1] == "Final question?"
+
+
+@pytest.mark.asyncio
+async def test_buffered_mode_does_not_stream() -> None:
+    llm = StreamingLLM("Q?", LLMResponse(follow_up_question="Q?"))
+    llm.finish.set()
+    tts = RecordingTTS()
+    tts.release.set()
+
+    await _run_turn(llm, tts, llm_response_mode="buffered")
+
+    assert llm.callback_seen is False
+
+
+class SplitLLM:
+    """Question-only and coaching calls; coaching finishes on demand."""
+
+    def __init__(self, question: LLMResponse, coaching=None):
+        self.question = question
+        self.coaching = coaching
+        self.coaching_release = asyncio.Event()
+        self.coaching_cancelled = False
+
+    async def generate_question(self, **kwargs):
+        await asyncio.sleep(0)  # let the coaching task start
+        return self.question
+
+    async def generate_coaching_feedback(self, **kwargs):
+        try:
+            await self.coaching_release.wait()
+        except asyncio.CancelledError:
+            self.coaching_cancelled = True
+            raise
+        return self.coaching
+
+
+@pytest.mark.asyncio
+async def test_split_mode_starts_tts_before_coaching_finishes() -> None:
+    coaching = CoachingFeedback(
+        dimensions=[{"label": "Clarity", "score": 4, "tip": "Lead with it."}],
+        summary_tip="Quantify impact.",
+    )
+    llm = SplitLLM(LLMResponse(follow_up_question="What changed?"), coaching)
+    tts = RecordingTTS()
+
+    turn = asyncio.create_task(_run_turn(llm, tts, llm_response_mode="split"))
+    await asyncio.sleep(0.01)
+
+    assert tts.started == ["What changed?"]
+    tts.release.set()
+    await asyncio.sleep(0.01)
+    assert not turn.done()  # audio is ready; coaching is still pending
+    llm.coaching_release.set()
+    result = await asyncio.wait_for(turn, timeout=1)
+
+    assert result.assistant_text == "What changed?"
+    assert result.coaching_feedback == coaching
+    assert result.tts_audio_url == "/tts/req-stream-1"
+
+
+@pytest.mark.asyncio
+async def test_split_mode_times_the_coaching_call_separately() -> None:
+    llm = SplitLLM(LLMResponse(follow_up_question="What changed?"))
+    tts = RecordingTTS()
+    tts.release.set()
+
+    async def release_coaching_later() -> None:
+        await asyncio.sleep(0.05)
+        llm.coaching_release.set()
+
+    releaser = asyncio.create_task(release_coaching_later())
+    result = await _run_turn(llm, tts, llm_response_mode="split")
+    await releaser
+
+    assert result.timings["coaching_ms"] >= 40
+    assert result.timings["llm_ms"] < result.timings["coaching_ms"]
+
+    buffered_llm = StreamingLLM("Next?", LLMResponse(follow_up_question="Next?"))
+    buffered_llm.finish.set()
+    buffered = await _run_turn(buffered_llm, tts, llm_response_mode="buffered")
+    assert "coaching_ms" not in buffered.timings
+
+
+@pytest.mark.asyncio
+async def test_split_mode_refusal_cancels_coaching_call() -> None:
+    llm = SplitLLM(LLMResponse(follow_up_question="Let's refocus.", refused=True))
+    tts = RecordingTTS()
+
+    with pytest.raises(TurnProcessingError) as exc_info:
+        await _run_turn(llm, tts, llm_response_mode="split")
+
+    assert exc_info.value.code == "content_refused"
+    assert llm.coaching_cancelled is True
+    assert tts.started == []
@@ -0,0 +1,148 @@
+"""Tests for span tracing and OTLP/JSON export."""
+
+import json
+
+import httpx
+import pytest
+
+from src.observability.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    TracingTransport,
+    _HttpTraceRecorder,
+    http_client_options,
+)
+
+REQUEST_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def test_nested_spans_share_trace_and_export_on_root_end():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(enabled=True, exporter=exporter)
+
+    with tracer.start_as_current_span("POST /turn", trace_id=REQUEST_ID) as root:
+        with tracer.start_as_current_span("stt") as child:
+            assert exporter.spans == []
+
+    names = [span.name for span in exporter.spans]
+    assert names == ["stt", "POST /turn"]
+    assert root.trace_id == REQUEST_ID.replace("-", "")
+    assert child.trace_id == root.trace_id
+    assert child.parent_span_id == root.span_id
+
+
+def test_disabled_tracer_records_nothing():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(enabled=False, exporter=exporter)
+
+    with tracer.start_as_current_span("stt") as span:
+        span.set_attribute("ignored", True)
+
+    assert exporter.spans == []
+    assert not span.is_recording
+
+
+def test_sample_ratio_zero_drops_whole_trace():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(enabled=True, sample_ratio=0.0, exporter=exporter)
+
+    with tracer.start_as_current_span("root", trace_id=REQUEST_ID):
+        with tracer.start_as_current_span("child"):
+            pass
+
+    assert exporter.spans == []
+
+
+def test_span_records_stage_error_code():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(enabled=True, exporter=exporter)
+
+    class StageError(Exception):
+        code = "stt_timeout"
+
+    with pytest.raises(StageError):
+        with tracer.start_as_current_span("stt"):
+            raise StageError()
+
+    span = exporter.spans[0]
+    assert span.status_code == 2
+    assert span.attributes["error.code"] == "stt_timeout"
+
+
+def test_file_exporter_writes_otlp_json(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(enabled=True, exporter=FileSpanExporter(str(path)))
+
+    with tracer.start_as_current_span("llm.follow_up", {"llm.model": "m"}):
+        pass
+
+    document = json.loads(path.read_text().strip())
+    span = document["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert span["name"] == "llm.follow_up"
+    assert span["attributes"] == [{"key": "llm.model", "value": {"stringValue": "m"}}]
+    assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+
+
+@pytest.mark.asyncio
+async def test_http_trace_recorder_creates_phase_child_spans():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(enabled=True, exporter=exporter)
+
+    with tracer.start_as_current_span("root") as root:
+        recorder = _HttpTraceRecorder(tracer, root)
+        await recorder("connection.connect_tcp.started", {})
+        await recorder("connection.connect_tcp.complete", {})
+        await recorder("http11.receive_response_headers.started", {})
+        await recorder("http11.receive_response_headers.complete", {})
+
+    names = {span.name for span in exporter.spans}
+    assert {"http.connect", "http.ttfb", "root"} <= names
+
+
+@pytest.mark.asyncio
+async def test_tracing_transport_wraps_request_in_span(monkeypatch):
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(enabled=True, exporter=exporter)
+    monkeypatch.setattr("src.observability.tracing.get_tracer", lambda: tracer)
+
+    inner = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    async with httpx.AsyncClient(transport=TracingTransport(inner)) as client:
+        with tracer.start_as_current_span("root"):
+            response = await client.get("https://api.deepgram.com/v1/listen")
+
+    assert response.status_code == 200
+    http_span = next(s for s in exporter.spans if s.name == "http.request")
+    assert http_span.attributes["server.address"] == "api.deepgram.com"
+    assert http_span.attributes["http.status_code"] == 200
+
+
+def test_http_client_options_keep_httpx_defaults_when_tracing_is_off(monkeypatch):
+    monkeypatch.setattr(
+        "src.observability.tracing.get_tracer", lambda: Tracer(enabled=False)
+    )
+
+    assert set(http_client_options()) == {"verify"}
+
+
+def test_http_client_options_mount_env_proxies_when_tracing_is_on(monkeypatch):
+    tracer = Tracer(enabled=True, exporter=InMemorySpanExporter())
+    monkeypatch.setattr("src.observability.tracing.get_tracer", lambda: tracer)
+    for name in ("HTTP_PROXY", "ALL_PROXY", "http_proxy", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost,.corp.example")
+    limits = httpx.Limits(max_connections=7)
+
+    options = http_client_options(limits)
+
+    assert isinstance(options["transport"], TracingTransport)
+    mounts = options["mounts"]
+    assert isinstance(mounts["https://"], TracingTransport)
+    assert mounts["all://localhost"] is None
+    assert mounts["all://*corp.example"] is None
+    transport_for = httpx.AsyncClient(**options)._transport_for_url
+    assert transport_for(httpx.URL("https://api.groq.com")) is mounts["https://"]
+    assert transport_for(httpx.URL("https://stt.corp.example")) is (
+        options["transport"]
+    )
@@ -0,0 +1,162 @@
+"""Unit tests for the disk-backed TTS store."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.api.dependencies import shared_services
+from src.services.tts_disk_store import DiskTTSStore
+from src.settings.config import Settings
+
+WAV = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 32
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a fresh disk store for each test."""
+    return DiskTTSStore(tmp_path, ttl_seconds=300)
+
+
+def test_store_and_retrieve_audio_bytes(store):
+    store.store("req-1", b"fake_mp3_audio")
+
+    stored = store.locate("req-1")
+
+    assert store.get("req-1") == b"fake_mp3_audio"
+    assert stored.media_type == "audio/mpeg"
+    assert stored.path.read_bytes() == b"fake_mp3_audio"
+
+
+def test_identical_audio_is_stored_once(store, tmp_path):
+    store.store("req-1", WAV)
+    store.store("req-2", WAV)
+
+    assert store.locate("req-1").path == store.locate("req-2").path
+    assert store.locate("req-2").media_type == "audio/wav"
+    assert len(list((tmp_path / "audio").iterdir())) == 1
+
+
+def test_entries_are_shared_between_instances(store, tmp_path):
+    store.store("req-1", b"audio")
+
+    assert DiskTTSStore(tmp_path).get("req-1") == b"audio"
+
+
+def test_expired_entry_is_removed_on_access(tmp_path):
+    store = DiskTTSStore(tmp_path, ttl_seconds=1)
+    store.store("req-1", b"audio")
+
+    with patch("src.services.tts_disk_store.time.time", return_value=time.time() + 5):
+        assert store.locate("req-1") is None
+
+    assert list((tmp_path / "index").iterdir()) == []
+
+
+def test_request_id_cannot_escape_the_store(store, tmp_path):
+    store.store("../../outside", b"audio")
+
+    assert store.get("../../outside") == b"audio"
+    assert not (tmp_path.parent / "outside").exists()
+
+
+def test_cleanup_removes_expired_entries_and_orphaned_audio(tmp_path):
+    store = DiskTTSStore(tmp_path, ttl_seconds=1)
+    store.store("old", b"old audio")
+    store.store("shared-old", b"kept audio")
+
+    # Past the TTL plus the grace period unreferenced clips get
+    later = time.time() + 120
+    with patch("src.services.tts_disk_store.time.time", return_value=later):
+        store.store("new", b"kept audio")
+        removed = store.cleanup()
+        assert store.get("new") == b"kept audio"
+
+    assert removed == 2
+    assert [p.name for p in (tmp_path / "index").iterdir()] == [
+        store._index_path("new").name
+    ]
+    assert len(list((tmp_path / "audio").iterdir())) == 1
+
+
+def test_cleanup_keeps_recently_expired_clips_for_a_grace_period(tmp_path):
+    store = DiskTTSStore(tmp_path, ttl_seconds=1)
+    store.store("req-1", b"audio")
+    located = store.locate("req-1")
+
+    with patch("src.services.tts_disk_store.time.time", return_value=time.time() + 5):
+        assert store.cleanup() == 1
+
+    assert located.path.read_bytes() == b"audio"
+
+
+def test_store_rewrites_a_clip_removed_by_a_concurrent_cleanup(store):
+    store.store("req-1", b"audio")
+    clip = store.locate("req-1").path
+
+    def removed_by_cleanup(path):
+        path.unlink()
+        raise FileNotFoundError(path)
+
+    with patch("src.services.tts_disk_store.os.utime", side_effect=removed_by_cleanup):
+        store.store("req-2", b"audio")
+
+    assert clip.read_bytes() == b"audio"
+    assert store.get("req-2") == b"audio"
+
+
+def test_store_sweeps_expired_files_periodically(tmp_path):
+    store = DiskTTSStore(tmp_path, ttl_seconds=1, sweep_interval_seconds=0)
+    store.store("old", b"old audio")
+
+    later = time.time() + 120
+    with patch("src.services.tts_disk_store.time.time", return_value=later):
+        store.store("new", b"new audio")
+
+    assert [p.name for p in (tmp_path / "index").iterdir()] == [
+        store._index_path("new").name
+    ]
+    assert len(list((tmp_path / "audio").iterdir())) == 1
+
+
+def test_store_sweeps_at_most_once_per_interval(tmp_path):
+    with patch("src.services.tts_disk_store.time.monotonic", return_value=0.0):
+        store = DiskTTSStore(tmp_path, ttl_seconds=1, sweep_interval_seconds=60)
+
+    with patch.object(store, "cleanup", return_value=0) as cleanup:
+        with patch("src.services.tts_disk_store.time.monotonic", return_value=30.0):
+            store.store("req-1", b"audio")
+        with patch("src.services.tts_disk_store.time.monotonic", return_value=61.0):
+            store.store("req-2", b"audio")
+            store.store("req-3", b"audio")
+
+    cleanup.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        b"[]",
+        b'{"media_type": "audio/mpeg", "stored_at": 0}',
+        b'{"sha256": "../../etc/passwd", "media_type": "audio/mpeg", "stored_at": 0}',
+        b'{"sha256": "' + b"a" * 64 + b'", "media_type": "audio/mpeg"}',
+    ],
+)
+def test_malformed_index_entry_is_a_miss(store, entry):
+    store.store("req-1", b"audio")
+    store._index_path("req-1").write_bytes(entry)
+
+    assert store.locate("req-1") is None
+    assert store.get("req-1") is None
+    assert store.cleanup() == 0
+
+
+def test_get_tts_cache_uses_disk_store_when_configured(tmp_path):
+    settings = Settings(tts_store_backend="disk", tts_store_dir=str(tmp_path))
+    with (
+        patch.object(shared_services, "get_settings", return_value=settings),
+        patch.object(shared_services, "_tts_cache", None),
+    ):
+        cache = shared_services.get_tts_cache()
+
+    assert isinstance(cache, DiskTTSStore)
@@ -2,7 +2,7 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.api.dependencies import RequestContext
 
@@ -256,6 +256,29 @@ def test_fetch_tts_audio_content_type_audio_mpeg(client, mock_audio_bytes, mock_
     assert response.headers["content-type"] == "audio/mpeg"
 
 
+def test_fetch_tts_audio_content_type_audio_wav(client, mock_app):
+    """WAV audio from the local TTS backend is served as audio/wav."""
+    from src.api.dependencies.shared_services import (
+        get_token_service,
+        get_tts_cache,
+    )
+
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+
+    mock_tts_cache = Mock()
+    mock_tts_cache.get.return_value = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 32
+
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+    mock_app.dependency_overrides[get_tts_cache] = lambda: mock_tts_cache
+
+    headers = {"Authorization": "Bearer valid_token"}
+    response = client.get("/tts/test-request-id", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/wav"
+
+
 def test_fetch_tts_audio_error_responses_include_request_id(client, mock_app):
     """Test that error responses include X-Request-ID header.
 
@@ -314,3 +337,61 @@ def test_fetch_tts_audio_401_includes_envelope_format(client, mock_app):
     assert "retryable" in json_resp["error"]
     assert "request_id" in json_resp
     assert "X-Request-ID" in response.headers
+
+
+def test_fetch_tts_audio_served_from_disk_store(client, mock_app, tmp_path):
+    """The disk TTS store is served as a file response with the stored type."""
+    from src.api.dependencies.shared_services import (
+        get_token_service,
+        get_tts_cache,
+    )
+    from src.services import DiskTTSStore
+
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    store = DiskTTSStore(tmp_path)
+    wav = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 32
+    store.store("test-request-id", wav)
+
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+    mock_app.dependency_overrides[get_tts_cache] = lambda: store
+
+    headers = {"Authorization": "Bearer valid_token"}
+    response = client.get("/tts/test-request-id", headers=headers)
+    missing = client.get("/tts/other-request-id", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/wav"
+    assert response.headers["content-length"] == str(len(wav))
+    assert response.content == wav
+    assert missing.status_code == 404
+    assert missing.json()["error"]["code"] == "tts_audio_not_found"
+
+
+def test_fetch_tts_audio_file_removed_after_locate_is_not_found(
+    client, mock_app, tmp_path
+):
+    """A clip deleted between lookup and response is a 404 envelope, not a 500."""
+    from src.api.dependencies.shared_services import (
+        get_token_service,
+        get_tts_cache,
+    )
+    from src.services import DiskTTSStore
+
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    store = DiskTTSStore(tmp_path)
+    store.store("test-request-id", b"fake_mp3_audio")
+    stored = store.locate("test-request-id")
+    stored.path.unlink()  # as if a concurrent cleanup won the race
+
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+    mock_app.dependency_overrides[get_tts_cache] = lambda: store
+
+    with patch.object(store, "locate", return_value=stored):
+        response = client.get(
+            "/tts/test-request-id", headers={"Authorization": "Bearer valid_token"}
+        )
+
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "tts_audio_not_found"
@@ -2,7 +2,7 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timezone
 
 from src.api.dependencies import RequestContext
@@ -123,14 +123,60 @@ def test_submit_turn_success(client, mock_session, mock_turn_result, mock_app):
         assert json_resp["error"] is None
         assert "request_id" in json_resp
 
-        # Verify session update called
-        mock_store.update_session.assert_called_once()
-        call_args = mock_store.update_session.call_args
+        # Verify the turn was appended to the session
+        mock_store.append_turn.assert_called_once()
+        call_args = mock_store.append_turn.call_args
         assert call_args[0][0] == "test-session-123"
+        assert call_args[0][1].transcript == mock_turn_result.transcript
         assert "turn_count" in call_args[1]
         assert "last_activity_at" in call_args[1]
 
 
+def test_final_turn_waits_briefly_for_rolling_summary(
+    client, mock_session, mock_turn_result, mock_app
+):
+    """The last turn waits a short bound, then merges the latest rolling summary."""
+    from src.api.dependencies.shared_services import (
+        get_rolling_summarizer,
+        get_session_store,
+        get_token_service,
+    )
+    from src.settings.config import Settings
+
+    mock_session.turn_count = 4  # answering the fifth and last question
+    latest = Mock(rolling_summary={"covered_turns": 3})
+    mock_store = Mock()
+    mock_store.get_session.side_effect = [mock_session, latest]
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    summarizer = Mock()
+    summarizer.wait = AsyncMock(return_value=False)  # update still running
+    seen: dict = {}
+
+    async def mock_process_turn(*args, rolling_summary=None, **kwargs):
+        seen["rolling_summary"] = rolling_summary
+        return mock_turn_result
+
+    mock_app.dependency_overrides[get_session_store] = lambda: mock_store
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+    mock_app.dependency_overrides[get_rolling_summarizer] = lambda: summarizer
+    settings = Settings(summary_mode="rolling", rolling_summary_final_wait_seconds=1.5)
+
+    with (
+        patch("src.api.routes.turn.get_settings", return_value=settings),
+        patch("src.api.routes.turn.process_turn", new=mock_process_turn),
+    ):
+        response = client.post(
+            "/turn",
+            data={"session_id": "test-session-123", "transcript": "I used queues."},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+    assert response.json()["error"] is None
+    summarizer.wait.assert_awaited_once_with("test-session-123", timeout=1.5)
+    assert seen["rolling_summary"] == {"covered_turns": 3}
+
+
 def test_submit_turn_invalid_token(client, mock_app):
     """Test error when session token is invalid."""
     from src.api.dependencies.shared_services import get_token_service
@@ -214,6 +260,38 @@ def test_submit_turn_empty_audio_file(client, mock_session, mock_app):
     assert json_resp["error"]["code"] == "invalid_audio"
 
 
+def test_submit_turn_releases_spool_on_early_return(client, mock_session, mock_app):
+    """The spooled upload is closed even when /turn returns before STT."""
+    from src.api.dependencies.shared_services import (
+        get_session_store,
+        get_token_service,
+    )
+    from src.services.audio_spool import SpooledAudio
+
+    mock_store = Mock()
+    mock_store.get_session.return_value = mock_session
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    mock_app.dependency_overrides[get_session_store] = lambda: mock_store
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+
+    spooled = SpooledAudio(data=b"")
+
+    async def fake_spool_upload(upload, memory_limit_bytes):
+        return spooled
+
+    with patch("src.api.routes.turn.spool_upload", fake_spool_upload):
+        response = client.post(
+            "/turn",
+            files={"audio": ("test.webm", b"", "audio/webm")},
+            data={"session_id": "test-session-123"},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+    assert response.json()["error"]["code"] == "invalid_audio"
+    assert spooled.closed
+
+
 def test_submit_turn_stt_error(client, mock_session, mock_app):
     """Test error propagation from STT provider."""
     from src.api.dependencies.shared_services import (
@@ -598,3 +676,267 @@ def test_submit_turn_returns_session_summary_on_final_turn(
             json_resp["data"]["session_summary"]["overall_assessment"]
             == "You communicated clearly and stayed focused."
         )
+
+
+def test_submit_turn_records_stage_metrics(
+    client, mock_session, mock_turn_result, mock_app
+):
+    """Test successful turns are observed in the per-stage latency histogram."""
+    from src.api.dependencies.shared_services import (
+        get_session_store,
+        get_token_service,
+    )
+    from src.observability.metrics import turn_requests_total, turn_stage_latency
+
+    mock_store = Mock()
+    mock_store.get_session.return_value = mock_session
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    mock_app.dependency_overrides[get_session_store] = lambda: mock_store
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+
+    async def mock_process_turn(*args, **kwargs):
+        return mock_turn_result
+
+    ok_before = turn_requests_total().value(stage="none", outcome="ok")
+    stt_before = turn_stage_latency().count(
+        stage="stt", model="nova-2", outcome="ok"
+    )
+
+    with patch("src.api.routes.turn.process_turn", new=mock_process_turn):
+        response = client.post(
+            "/turn",
+            files={"audio": ("test.webm", b"fake_audio_data", "audio/webm")},
+            data={"session_id": "test-session-123"},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+    assert response.status_code == 200
+    assert turn_requests_total().value(stage="none", outcome="ok") == ok_before + 1
+    assert (
+        turn_stage_latency().count(stage="stt", model="nova-2", outcome="ok")
+        == stt_before + 1
+    )
+
+
+def test_submit_turn_labels_llm_latency_with_routed_model(
+    client, mock_session, mock_turn_result, mock_app
+):
+    """LLM latency is recorded under the model the router chose, not "router"."""
+    from src.api.dependencies.shared_services import (
+        get_session_store,
+        get_token_service,
+    )
+    from src.observability.metrics import turn_stage_latency
+
+    mock_store = Mock()
+    mock_store.get_session.return_value = mock_session
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    mock_app.dependency_overrides[get_session_store] = lambda: mock_store
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+    mock_turn_result.llm_model = "llama-3.1-8b-instant"
+
+    async def mock_process_turn(*args, **kwargs):
+        return mock_turn_result
+
+    labels = {"stage": "llm", "model": "llama-3.1-8b-instant", "outcome": "ok"}
+    before = turn_stage_latency().count(**labels)
+    router_before = turn_stage_latency().count(
+        stage="llm", model="router", outcome="ok"
+    )
+
+    with patch("src.api.routes.turn.process_turn", new=mock_process_turn):
+        response = client.post(
+            "/turn",
+            files={"audio": ("test.webm", b"fake_audio_data", "audio/webm")},
+            data={"session_id": "test-session-123"},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+    assert response.status_code == 200
+    assert turn_stage_latency().count(**labels) == before + 1
+    assert (
+        turn_stage_latency().count(stage="llm", model="router", outcome="ok")
+        == router_before
+    )
+
+
+def test_submit_turn_records_split_mode_coaching_latency(
+    client, mock_session, mock_turn_result, mock_app
+):
+    """Split mode's coaching call gets its own latency stage."""
+    from src.api.dependencies.shared_services import (
+        get_session_store,
+        get_token_service,
+    )
+    from src.observability.metrics import turn_stage_latency
+    from src.settings.config import get_settings
+
+    mock_store = Mock()
+    mock_store.get_session.return_value = mock_session
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    mock_app.dependency_overrides[get_session_store] = lambda: mock_store
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+    mock_turn_result.timings["coaching_ms"] = 640.0
+
+    async def mock_process_turn(*args, **kwargs):
+        return mock_turn_result
+
+    def coaching_count() -> int:
+        return sum(
+            turn_stage_latency().count(stage="llm.coaching", model=model, outcome="ok")
+            for model in ("router", get_settings().llm_model)
+        )
+
+    before = coaching_count()
+
+    with patch("src.api.routes.turn.process_turn", new=mock_process_turn):
+        response = client.post(
+            "/turn",
+            files={"audio": ("test.webm", b"fake_audio_data", "audio/webm")},
+            data={"session_id": "test-session-123"},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["timings"]["coaching_ms"] == 640.0
+    assert coaching_count() == before + 1
+
+
+def test_submit_turn_updates_running_rubric_scores(client, mock_app):
+    """Each turn adds its coaching scores to the session's running totals."""
+    from src.api.dependencies.shared_services import (
+        get_session_store,
+        get_token_service,
+    )
+    from src.api.models import CoachingDimension, CoachingFeedback
+    from src.domain.session_state import RubricScores, SessionState
+
+    session = SessionState(
+        session_id="test-session-123",
+        role="candidate",
+        interview_type="technical",
+        difficulty="medium",
+        question_count=5,
+        created_at=datetime.now(timezone.utc),
+        last_activity_at=datetime.now(timezone.utc),
+        rubric_scores=RubricScores(sums={"clarity": 5}, counts={"clarity": 1}),
+    )
+    mock_store = Mock()
+    mock_store.get_session.return_value = session
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    mock_app.dependency_overrides[get_session_store] = lambda: mock_store
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+
+    received = {}
+
+    async def mock_process_turn(*args, **kwargs):
+        received.update(kwargs)
+        args[2].turn_count += 1
+        return TurnResult(
+            transcript="Answer",
+            timings={"stt_ms": 1.0, "llm_ms": 1.0, "total_ms": 2.0},
+            assistant_text="Next?",
+            coaching_feedback=CoachingFeedback(
+                dimensions=[
+                    CoachingDimension(label="Clarity", score=3, tip="Tip."),
+                    CoachingDimension(label="Relevance", score=4, tip="Tip."),
+                    CoachingDimension(label="Structure", score=4, tip="Tip."),
+                    CoachingDimension(label="Filler Words", score=5, tip="Tip."),
+                ],
+                summary_tip="Keep going.",
+            ),
+        )
+
+    with patch("src.api.routes.turn.process_turn", new=mock_process_turn):
+        response = client.post(
+            "/turn",
+            files={"audio": ("test.webm", b"fake_audio_data", "audio/webm")},
+            data={"session_id": "test-session-123"},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+    assert response.status_code == 200
+    assert received["turn_history"] is session.turn_history
+    saved = mock_store.append_turn.call_args.kwargs["rubric_scores"]
+    assert saved.averages() == {
+        "clarity": 4.0,
+        "relevance": 4.0,
+        "structure": 4.0,
+        "filler_words": 5.0,
+    }
+
+
+def _pcm_wav(seconds: float, amplitude: float, rate: int = 16000) -> bytes:
+    import io
+    import wave
+
+    import numpy as np
+
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (amplitude * 32767 * np.sin(2 * np.pi * 440 * t)).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("filename", "audio", "mime_type", "reaches_stt"),
+    [
+        ("silent.wav", _pcm_wav(1.0, 0.0), "audio/wav", False),
+        ("hiss.wav", _pcm_wav(1.0, 0.001), "audio/wav", False),
+        ("tap.wav", _pcm_wav(0.1, 0.5), "audio/wav", False),
+        ("answer.wav", _pcm_wav(1.0, 0.5), "audio/wav", True),
+        ("answer.webm", b"\x1aE\xdf\xa3opaque", "audio/webm", True),
+    ],
+)
+def test_submit_turn_rejects_silent_audio_before_stt(
+    client,
+    mock_session,
+    mock_turn_result,
+    mock_app,
+    filename,
+    audio,
+    mime_type,
+    reaches_stt,
+):
+    """Silent or too-short WAV uploads never reach the orchestrator."""
+    from src.api.dependencies.shared_services import (
+        get_session_store,
+        get_token_service,
+    )
+
+    mock_store = Mock()
+    mock_store.get_session.return_value = mock_session
+    mock_token_service = Mock()
+    mock_token_service.verify_token.return_value = "test-session-123"
+    mock_app.dependency_overrides[get_session_store] = lambda: mock_store
+    mock_app.dependency_overrides[get_token_service] = lambda: mock_token_service
+
+    calls = []
+
+    async def mock_process_turn(*args, **kwargs):
+        calls.append(args)
+        return mock_turn_result
+
+    with patch("src.api.routes.turn.process_turn", new=mock_process_turn):
+        response = client.post(
+            "/turn",
+            files={"audio": (filename, audio, mime_type)},
+            data={"session_id": "test-session-123"},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+    json_resp = response.json()
+    assert bool(calls) is reaches_stt
+    if not reaches_stt:
+        assert json_resp["error"]["stage"] == "stt"
+        assert json_resp["error"]["code"] == "stt_empty_transcript"
+        assert json_resp["error"]["retryable"] is False
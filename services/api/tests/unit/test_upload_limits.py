@@ -0,0 +1,111 @@
+"""Tests for the upload size and read-timeout middleware."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from src.api.middleware import UploadLimitMiddleware
+
+MAX_BYTES = 1024
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    app.state.reads = 0
+
+    @app.post("/turn")
+    async def turn(request: Request):
+        app.state.reads += 1
+        body = await request.body()
+        return {"bytes": len(body)}
+
+    @app.post("/session/start")
+    async def start(request: Request):
+        return {"bytes": len(await request.body())}
+
+    app.add_middleware(
+        UploadLimitMiddleware,
+        max_bytes=MAX_BYTES,
+        read_timeout_seconds=0.05,
+        total_timeout_seconds=0.3,
+    )
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+async def _chunks(count: int, size: int, delay: float = 0.0):
+    for _ in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        yield b"x" * size
+
+
+@pytest.mark.asyncio
+async def test_declared_oversized_body_is_rejected_before_reading(app) -> None:
+    async with _client(app) as client:
+        response = await client.post("/turn", content=b"x" * (MAX_BYTES + 1))
+
+    assert response.status_code == 413
+    assert response.json()["error"] == {
+        "stage": "upload",
+        "code": "file_too_large",
+        "message_safe": "Audio file is too large",
+        "retryable": False,
+        "details": {"max_bytes": MAX_BYTES},
+    }
+    assert app.state.reads == 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_is_cut_off_at_the_limit(app) -> None:
+    async with _client(app) as client:
+        response = await client.post("/turn", content=_chunks(4, 512))
+
+    assert response.status_code == 413
+    assert response.json()["error"]["code"] == "file_too_large"
+
+
+@pytest.mark.asyncio
+async def test_stalled_upload_times_out(app) -> None:
+    async with _client(app) as client:
+        response = await client.post("/turn", content=_chunks(2, 16, delay=0.2))
+
+    assert response.status_code == 408
+    assert response.json()["error"]["code"] == "upload_timeout"
+    assert response.json()["error"]["retryable"] is True
+
+
+@pytest.mark.asyncio
+async def test_slow_drip_upload_hits_the_total_deadline(app) -> None:
+    # Each chunk arrives inside the read timeout, but the body never finishes
+    async with _client(app) as client:
+        response = await client.post("/turn", content=_chunks(40, 1, delay=0.02))
+
+    assert response.status_code == 408
+    assert response.json()["error"]["code"] == "upload_timeout"
+
+
+@pytest.mark.asyncio
+async def test_uploads_within_limits_pass_through(app) -> None:
+    async with _client(app) as client:
+        streamed = await client.post("/turn", content=_chunks(2, 256, delay=0.01))
+        declared = await client.post("/turn", content=b"x" * MAX_BYTES)
+
+    assert streamed.json() == {"bytes": 512}
+    assert declared.json() == {"bytes": MAX_BYTES}
+
+
+@pytest.mark.asyncio
+async def test_other_paths_are_not_limited(app) -> None:
+    async with _client(app) as client:
+        response = await client.post("/session/start", content=b"x" * (MAX_BYTES * 2))
+
+    assert response.json() == {"bytes": MAX_BYTES * 2}